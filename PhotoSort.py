@@ -1,22 +1,32 @@
 # Standard library imports
+import bisect
 import ctypes
 import datetime
 import gc
+import hashlib
+import heapq
 import io
 import json
 import os
 import queue
 import shutil
+import sqlite3
+import struct
 import subprocess
 import sys
 import threading
 import time
+import tracemalloc
 import logging
 import logging.handlers
+from array import array
+from contextlib import contextmanager
+from collections import OrderedDict, deque
 from functools import partial
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from multiprocessing import Process, Queue, cpu_count, freeze_support
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed, wait
+from multiprocessing import Process, Queue, cpu_count, freeze_support, get_all_start_methods, get_context
+from multiprocessing.shared_memory import SharedMemory
 
 from pathlib import Path
 import platform
@@ -32,11 +42,12 @@ import pillow_heif
 # PySide6 - Qt framework imports
 from PySide6.QtCore import (Qt, QEvent, QMetaObject, QObject, QPoint, Slot,
                            QThread, QTimer, QUrl, Signal, Q_ARG, QRect, QPointF,
-                           QMimeData, QAbstractListModel, QModelIndex, QSize, QSharedMemory)
+                           QMimeData, QAbstractListModel, QModelIndex, QSize, QSharedMemory,
+                           QFileSystemWatcher, QStandardPaths)
 
 from PySide6.QtGui import (QAction, QColor, QColorSpace, QDesktopServices, QFont, QGuiApplication, 
                           QImage, QImageReader, QKeyEvent, QMouseEvent, QPainter, QPalette, QIcon,
-                          QPen, QPixmap, QWheelEvent, QFontMetrics, QKeySequence, QDrag)
+                          QPen, QPixmap, QTransform, QWheelEvent, QFontMetrics, QKeySequence, QDrag)
 from PySide6.QtWidgets import (QApplication, QButtonGroup, QCheckBox, QComboBox,
                               QDialog, QFileDialog, QFrame, QGridLayout, 
                               QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
@@ -118,8 +129,6 @@ def setup_logger():
     logging.info("PhotoSort 시작 (버전: 25.07.15)")
     
     return logger
-# 로거 초기화
-logger = setup_logger()
 
 def apply_dark_title_bar(widget):
     """주어진 위젯의 제목 표시줄에 다크 테마를 적용합니다 (Windows 전용)."""
@@ -643,49 +652,73 @@ class HardwareProfileManager:
         "conservative": {
             "name": "저사양 (8GB RAM)",
             "max_imaging_threads": 2, "max_raw_processes": 1, "cache_size_images": 30,
-            "preload_range_adjacent": (5, 2), "preload_range_priority": 2, "preload_grid_bg_limit_factor": 0.3,
+            "preload_range_adjacent": (5, 2), "preload_grid_bg_limit_factor": 0.3,
             "memory_thresholds": {"danger": 88, "warning": 82, "caution": 75},
             "cache_clear_ratios": {"danger": 0.5, "warning": 0.3, "caution": 0.15},
+            "raw_decoder_idle_seconds": 30,  # RAW 디코더 프로세스 유휴 종료 시간 (초)
+            "raw_disk_cache_gb": 2,  # 디코딩된 RAW 프레임 디스크 캐시 예산 (GB, 여유 공간의 1/4 이내, 0이면 끔)
+            "image_decode_processes": 0,  # 일반 이미지 프로세스 디코딩 엔진 (0이면 끄고 이미징 스레드에서 디코딩)
+            "pipeline_io_workers": (2, 4), "pipeline_ready_mb": 128,  # 일반 이미지 I/O 단계 스레드 수 (로컬, 네트워크 저장소), 준비 큐 바이트 한도 (MB)
             "idle_preload_enabled": False,
         },
         "balanced": {
             "name": "표준 (16GB RAM)",
             "max_imaging_threads": 3, "max_raw_processes": lambda cores: min(2, max(1, cores // 4)), "cache_size_images": 60,
-            "preload_range_adjacent": (8, 3), "preload_range_priority": 3, "preload_grid_bg_limit_factor": 0.5,
+            "preload_range_adjacent": (8, 3), "preload_grid_bg_limit_factor": 0.5,
             "memory_thresholds": {"danger": 92, "warning": 88, "caution": 80},
             "cache_clear_ratios": {"danger": 0.5, "warning": 0.3, "caution": 0.15},
+            "raw_decoder_idle_seconds": 45,
+            "raw_disk_cache_gb": 5,
+            "image_decode_processes": 0,
+            "pipeline_io_workers": (2, 4), "pipeline_ready_mb": 256,
             "idle_preload_enabled": True, "idle_interval_ms": 2200,
         },
         "enhanced": {
             "name": "상급 (24GB RAM)",
             "max_imaging_threads": 4, "max_raw_processes": lambda cores: min(2, max(1, cores // 4)), "cache_size_images": 80,
-            "preload_range_adjacent": (10, 4), "preload_range_priority": 4, "preload_grid_bg_limit_factor": 0.6,
+            "preload_range_adjacent": (10, 4), "preload_grid_bg_limit_factor": 0.6,
             "memory_thresholds": {"danger": 94, "warning": 90, "caution": 85},
             "cache_clear_ratios": {"danger": 0.5, "warning": 0.3, "caution": 0.15},
+            "raw_decoder_idle_seconds": 60,
+            "raw_disk_cache_gb": 10,
+            "image_decode_processes": 0,
+            "pipeline_io_workers": (2, 6), "pipeline_ready_mb": 384,
             "idle_preload_enabled": True, "idle_interval_ms": 1800,
         },
         "aggressive": {
             "name": "고성능 (32GB RAM)",
             "max_imaging_threads": 4, "max_raw_processes": lambda cores: min(3, max(2, cores // 3)), "cache_size_images": 120,
-            "preload_range_adjacent": (12, 5), "preload_range_priority": 5, "preload_grid_bg_limit_factor": 0.75,
+            "preload_range_adjacent": (12, 5), "preload_grid_bg_limit_factor": 0.75,
             "memory_thresholds": {"danger": 95, "warning": 92, "caution": 88},
             "cache_clear_ratios": {"danger": 0.4, "warning": 0.25, "caution": 0.1},
+            "raw_decoder_idle_seconds": 90,
+            "raw_disk_cache_gb": 20,
+            "image_decode_processes": 0,
+            "pipeline_io_workers": (3, 6), "pipeline_ready_mb": 512,
             "idle_preload_enabled": True, "idle_interval_ms": 1500,
         },
         "extreme": {
             "name": "초고성능 (64GB RAM)",
             "max_imaging_threads": 4, "max_raw_processes": lambda cores: min(4, max(2, cores // 3)), "cache_size_images": 150,
-            "preload_range_adjacent": (18, 6), "preload_range_priority": 6, "preload_grid_bg_limit_factor": 0.8,
+            "preload_range_adjacent": (18, 6), "preload_grid_bg_limit_factor": 0.8,
             "memory_thresholds": {"danger": 96, "warning": 94, "caution": 90},
             "cache_clear_ratios": {"danger": 0.4, "warning": 0.2, "caution": 0.1},
+            "raw_decoder_idle_seconds": 120,
+            "raw_disk_cache_gb": 40,
+            "image_decode_processes": lambda cores: min(6, max(2, cores // 2)),
+            "pipeline_io_workers": (3, 8), "pipeline_ready_mb": 768,
             "idle_preload_enabled": True, "idle_interval_ms": 1200,
         },
         "dominator": {
             "name": "워크스테이션 (96GB+ RAM)",
             "max_imaging_threads": 5, "max_raw_processes": lambda cores: min(8, max(4, cores // 3)), "cache_size_images": 200,
-            "preload_range_adjacent": (20, 8), "preload_range_priority": 7, "preload_grid_bg_limit_factor": 0.9,
+            "preload_range_adjacent": (20, 8), "preload_grid_bg_limit_factor": 0.9,
             "memory_thresholds": {"danger": 97, "warning": 95, "caution": 92},
             "cache_clear_ratios": {"danger": 0.3, "warning": 0.15, "caution": 0.05},
+            "raw_decoder_idle_seconds": 180,
+            "raw_disk_cache_gb": 80,
+            "image_decode_processes": lambda cores: max(4, cores * 3 // 4),
+            "pipeline_io_workers": (4, 8), "pipeline_ready_mb": 1024,
             "idle_preload_enabled": True, "idle_interval_ms": 800,
         }
     }
@@ -1715,6 +1748,233 @@ class GridCellWidget(QWidget):
 
         painter.end()
 
+class MetadataCatalog:
+    """
+    파일 경로/크기/수정시간을 키로 하는 영구 메타데이터 카탈로그 (SQLite).
+    정렬용 촬영 시간과 EXIF 정보를 저장하여, 폴더를 다시 열 때 이미지 파일을 열지 않고 정렬/정보 표시가 가능하도록 합니다.
+    여러 스레드(폴더 로더, EXIF 워커, 메인)에서 동시에 사용되므로 모든 접근은 락으로 보호됩니다.
+    """
+    DB_FILE = "photosort_metadata.db"
+    FLUSH_THRESHOLD = 500  # 이 개수 이상 쓰기가 쌓이면 자동으로 커밋
+
+    _COLUMNS = ("path", "dir", "size", "mtime_ns", "capture_dt",
+                "width", "height", "orientation", "make", "model", "lens", "exif_json")
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._memo = {}      # 경로 -> 행 딕셔너리 (prefetch 및 최근 조회/쓰기 결과)
+        self._pending = {}   # 경로 -> 아직 커밋되지 않은 행 딕셔너리
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    dir TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    capture_dt TEXT,
+                    width INTEGER,
+                    height INTEGER,
+                    orientation INTEGER,
+                    make TEXT,
+                    model TEXT,
+                    lens TEXT,
+                    exif_json TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir)")
+            self._conn.commit()
+            logging.info(f"메타데이터 카탈로그 열림: {self.db_path}")
+        except Exception as e:
+            logging.error(f"메타데이터 카탈로그 초기화 실패 ({self.db_path}): {e}. 카탈로그 없이 동작합니다.")
+            self._conn = None
+
+    @property
+    def available(self):
+        return self._conn is not None
+
+    @staticmethod
+    def stat_key(file_path):
+        """카탈로그 키로 사용할 (크기, 수정시간 ns)를 반환합니다. 실패 시 None."""
+        try:
+            st = os.stat(file_path)
+            return st.st_size, st.st_mtime_ns
+        except OSError:
+            return None
+
+    def prefetch_folder(self, folder_path):
+        """폴더에 속한 모든 행을 한 번의 쿼리로 메모리에 올립니다 (폴더 로드 직전에 호출)."""
+        if not self.available or not folder_path:
+            return 0
+        folder_key = str(Path(folder_path))
+        with self._lock:
+            try:
+                cursor = self._conn.execute(
+                    f"SELECT {', '.join(self._COLUMNS)} FROM files WHERE dir = ?", (folder_key,))
+                count = 0
+                for row in cursor:
+                    self._memo[row[0]] = dict(zip(self._COLUMNS, row))
+                    count += 1
+                logging.debug(f"메타데이터 카탈로그 prefetch: {folder_key} ({count}개 항목)")
+                return count
+            except Exception as e:
+                logging.warning(f"메타데이터 카탈로그 prefetch 실패 ({folder_key}): {e}")
+                return 0
+
+    def _get_row(self, path_str, stat_key):
+        """유효한(크기/수정시간이 일치하는) 행을 반환합니다. 락 안에서 호출되어야 합니다."""
+        row = self._memo.get(path_str)
+        if row is None and self.available:
+            try:
+                cursor = self._conn.execute(
+                    f"SELECT {', '.join(self._COLUMNS)} FROM files WHERE path = ?", (path_str,))
+                fetched = cursor.fetchone()
+                if fetched:
+                    row = dict(zip(self._COLUMNS, fetched))
+                    self._memo[path_str] = row
+            except Exception as e:
+                logging.debug(f"메타데이터 카탈로그 조회 실패 ({path_str}): {e}")
+                return None
+        if row is None or stat_key is None:
+            return None
+        if row["size"] != stat_key[0] or row["mtime_ns"] != stat_key[1]:
+            return None  # 파일이 변경됨 -> 무효
+        return row
+
+    def get_capture_datetime(self, file_path, stat_key=None):
+        """카탈로그에 저장된 촬영 시간(datetime)을 반환합니다. 없으면 None."""
+        path_str = str(file_path)
+        if stat_key is None:
+            stat_key = self.stat_key(path_str)
+        with self._lock:
+            row = self._get_row(path_str, stat_key)
+            if row and row.get("capture_dt"):
+                try:
+                    return datetime.fromisoformat(row["capture_dt"])
+                except (ValueError, TypeError):
+                    return None
+        return None
+
+    def get_exif(self, file_path, stat_key=None):
+        """카탈로그에 저장된 EXIF 결과 딕셔너리를 반환합니다. 없으면 None."""
+        path_str = str(file_path)
+        if stat_key is None:
+            stat_key = self.stat_key(path_str)
+        with self._lock:
+            row = self._get_row(path_str, stat_key)
+            if not row or not row.get("exif_json"):
+                return None
+            try:
+                exif_data = json.loads(row["exif_json"])
+            except (ValueError, TypeError):
+                return None
+        if isinstance(exif_data.get("exif_resolution"), list):
+            exif_data["exif_resolution"] = tuple(exif_data["exif_resolution"])
+        exif_data["image_path"] = path_str
+        return exif_data
+
+    def _upsert(self, path_str, stat_key, **fields):
+        """행을 메모리에 갱신하고 쓰기 버퍼에 추가합니다. 락 안에서 호출되어야 합니다."""
+        row = self._memo.get(path_str)
+        if row is None or row["size"] != stat_key[0] or row["mtime_ns"] != stat_key[1]:
+            # 새 파일이거나 파일이 변경되었으면 이전 정보는 모두 무효
+            row = {col: None for col in self._COLUMNS}
+            row.update(path=path_str, dir=str(Path(path_str).parent),
+                       size=stat_key[0], mtime_ns=stat_key[1])
+        else:
+            row = dict(row)
+        row.update(fields)
+        self._memo[path_str] = row
+        self._pending[path_str] = row
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def put_capture_datetime(self, file_path, capture_dt, stat_key=None):
+        """정렬용 촬영 시간을 저장합니다."""
+        if not self.available or capture_dt is None:
+            return
+        path_str = str(file_path)
+        if stat_key is None:
+            stat_key = self.stat_key(path_str)
+        if stat_key is None:
+            return
+        with self._lock:
+            self._upsert(path_str, stat_key, capture_dt=capture_dt.isoformat())
+
+    def put_exif(self, file_path, exif_data, stat_key=None):
+        """ExifWorker 결과를 저장합니다. 촬영 시간/해상도/방향/카메라/렌즈는 개별 컬럼에도 기록합니다."""
+        if not self.available or not exif_data:
+            return
+        path_str = str(file_path)
+        if stat_key is None:
+            stat_key = self.stat_key(path_str)
+        if stat_key is None:
+            return
+        stored = {k: v for k, v in exif_data.items() if k != "image_path"}
+        try:
+            exif_json = json.dumps(stored, ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            logging.debug(f"EXIF 직렬화 실패 ({path_str}): {e}")
+            return
+        fields = {
+            "exif_json": exif_json,
+            "make": stored.get("exif_make") or None,
+            "model": stored.get("exif_model") or None,
+            "lens": stored.get("exif_lens") or None,
+            "orientation": stored.get("exif_orientation"),
+        }
+        resolution = stored.get("exif_resolution")
+        if resolution and len(resolution) == 2:
+            fields["width"], fields["height"] = resolution
+        datetime_str = stored.get("exif_datetime")
+        if isinstance(datetime_str, str):
+            try:
+                fields["capture_dt"] = datetime.strptime(datetime_str[:19], '%Y:%m:%d %H:%M:%S').isoformat()
+            except ValueError:
+                pass
+        with self._lock:
+            row = self._get_row(path_str, stat_key)
+            if row and row.get("capture_dt"):
+                # 헤더 단계가 SubSecTimeOriginal까지 반영해 기록한 촬영 시간은 초 단위 값으로 덮어쓰지 않음 (연사 순서 유지)
+                fields.pop("capture_dt", None)
+            self._upsert(path_str, stat_key, **fields)
+
+    def flush(self):
+        """버퍼에 쌓인 쓰기를 한 번의 트랜잭션으로 커밋합니다."""
+        if not self.available:
+            return
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [tuple(row[col] for col in self._COLUMNS) for row in self._pending.values()]
+            self._pending.clear()
+            try:
+                placeholders = ", ".join("?" for _ in self._COLUMNS)
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO files ({', '.join(self._COLUMNS)}) VALUES ({placeholders})", rows)
+                self._conn.commit()
+                logging.debug(f"메타데이터 카탈로그 커밋: {len(rows)}개 항목")
+            except Exception as e:
+                logging.warning(f"메타데이터 카탈로그 커밋 실패: {e}")
+
+    def close(self):
+        """남은 쓰기를 커밋하고 연결을 닫습니다."""
+        if not self.available:
+            return
+        with self._lock:
+            self.flush()
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+            self._memo.clear()
+        logging.info("메타데이터 카탈로그 닫힘")
+
 class ExifWorker(QObject):
     """백그라운드 스레드에서 EXIF 데이터를 처리하는 워커 클래스"""
     # 시그널 정의
@@ -1722,11 +1982,12 @@ class ExifWorker(QObject):
     error = Signal(str, str)      # (오류 메시지, 이미지 경로)
     request_process = Signal(str)
     
-    def __init__(self, raw_extensions, exiftool_path, exiftool_available):
+    def __init__(self, raw_extensions, exiftool_path, exiftool_available, metadata_catalog=None):
         super().__init__()
         self.raw_extensions = raw_extensions
         self.exiftool_path = exiftool_path
         self.exiftool_available = exiftool_available
+        self.metadata_catalog = metadata_catalog  # 영구 메타데이터 카탈로그 (없으면 None)
         self._running = True  # 작업 중단 플래그
 
         # 자신의 시그널을 슬롯에 연결
@@ -1768,6 +2029,16 @@ class ExifWorker(QObject):
         try:
             if not self._running:
                 return
+
+            # PHASE -1: 카탈로그에 유효한 결과가 있으면 파일을 열지 않고 바로 반환
+            stat_key = None
+            if self.metadata_catalog and self.metadata_catalog.available:
+                stat_key = MetadataCatalog.stat_key(image_path)
+                cached_result = self.metadata_catalog.get_exif(image_path, stat_key)
+                if cached_result is not None:
+                    if self._running:
+                        self.finished.emit(cached_result, image_path)
+                    return
                 
             file_path_obj = Path(image_path)
             suffix = file_path_obj.suffix.lower()
@@ -1788,6 +2059,7 @@ class ExifWorker(QObject):
                 "exif_fnumber": None,
                 "exif_iso": None,
                 "exif_orientation": None,
+                "exif_lens": "",
                 "image_path": image_path
             }
             
@@ -1866,6 +2138,10 @@ class ExifWorker(QObject):
                     if result["exif_iso"] is None and piexif.ExifIFD.ISOSpeedRatings in exif_ifd:
                         result["exif_iso"] = exif_ifd.get(piexif.ExifIFD.ISOSpeedRatings)
 
+                    # 렌즈 정보
+                    if not result["exif_lens"] and piexif.ExifIFD.LensModel in exif_ifd:
+                        result["exif_lens"] = exif_ifd.get(piexif.ExifIFD.LensModel, b'').decode('utf-8', errors='ignore').strip('\x00 ')
+
                     # 필수 정보 확인
                     required_info_count = sum([
                         result["exif_resolution"] is not None,
@@ -1970,7 +2246,14 @@ class ExifWorker(QObject):
                             except (ValueError, TypeError):
                                 result["exif_iso"] = str(iso_val)
 
-            # 작업 완료, 결과 전송
+                    # 렌즈 정보
+                    if not result["exif_lens"]:
+                        result["exif_lens"] = str(exif_data_tool.get("LensModel") or exif_data_tool.get("LensID") or "").strip()
+
+            # 작업 완료, 카탈로그 저장 후 결과 전송
+            if self.metadata_catalog and self._running:
+                self.metadata_catalog.put_exif(image_path, result, stat_key)
+                self.metadata_catalog.flush()
             if self._running:
                 self.finished.emit(result, image_path)
             
@@ -1979,103 +2262,749 @@ class ExifWorker(QObject):
             if self._running:
                 self.error.emit(str(e), image_path)
 
-class PriorityThreadPoolExecutor(ThreadPoolExecutor):
-    """우선순위를 지원하는 스레드 풀"""
-    
+class ImagingTask(Future):
+    """
+    PriorityThreadPoolExecutor 작업 핸들 (Future 호환).
+    대기 중에 cancel()하면 실행되지 않고, reprioritize()로 대기열 안에서 우선순위를 바꿀 수 있습니다.
+    group이 지정된 작업은 풀의 세대(generation)에 묶여, 세대가 바뀌면 오래된 작업으로 처리됩니다.
+    여러 요청자가 공유하는 작업은 요청자 수(waiters)를 세어 마지막 요청자가 떠날 때만 취소합니다 (SharedTaskHandle).
+    """
+
+    def __init__(self, pool, priority, group=None, generation=0):
+        super().__init__()
+        self._pool = pool
+        self.priority = priority
+        self.group = group
+        self.generation = generation
+        self.demoted = False
+        self.waiters = 1
+        self._entry = None  # 현재 힙 항목 (우선순위 변경 시 교체, 꺼내지면 None)
+
+    def add_waiter(self, group=None):
+        """요청자 합류. 다른 그룹의 요청자가 합류하면 한 그룹의 세대 전환으로 무효화되지 않도록 그룹에서 뺍니다."""
+        with self._pool._condition:
+            self.waiters += 1
+            if group != self.group:
+                self.group = None
+
+    def release_waiter(self):
+        """요청자 하나가 떠남. 마지막 요청자가 떠날 때만 취소하며 취소 여부를 반환합니다."""
+        with self._pool._condition:
+            self.waiters -= 1
+            last = self.waiters <= 0
+        return self.cancel() if last else False
+
+    def reprioritize(self, priority, keep_higher=False):
+        """
+        대기 중인 작업의 우선순위를 바꾸고 현재 세대로 갱신합니다. 이미 실행 중/완료면 False.
+        keep_higher=True면 기존 우선순위가 더 급할 때는 유지합니다 (오래된 작업은 항상 새 값 적용).
+        """
+        return self._pool._reprioritize(self, priority, keep_higher)
+
+    def is_stale(self):
+        return self._pool.is_stale(self)
+
+
+class SharedTaskHandle:
+    """
+    ImageLoader.request_shared가 요청자마다 돌려주는 ImagingTask 핸들 (Future 호환).
+    cancel()은 이 요청자만 빠지고, 같은 작업을 기다리는 요청자가 모두 빠졌을 때만 작업을 취소합니다.
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self._released = False
+
+    def cancel(self):
+        if self._released:
+            return self.task.cancelled()
+        self._released = True
+        return self.task.release_waiter()
+
+    def __getattr__(self, name):
+        return getattr(self.task, name)
+
+
+class PriorityThreadPoolExecutor:
+    """
+    힙 기반 우선순위 스레드 풀.
+    작업은 (우선순위 숫자, 제출 순번) 힙에 쌓이고, 작업자 스레드가 조건 변수로 대기하다가
+    힙에서 가장 급한 작업을 직접 꺼냅니다. 같은 우선순위는 제출 순서(FIFO)를 따릅니다.
+    우선순위 변경은 기존 항목을 무효화하고 새 항목을 넣는 방식이며, 세대 전환은 카운터 증가(O(1))만 하고
+    오래된 작업은 작업자가 꺼낼 때 정책에 따라 취소하거나 뒤로 미룹니다.
+    """
+
+    # 이름 → 숫자 우선순위 (작을수록 먼저 실행). 숫자를 직접 넘겨도 됩니다.
+    PRIORITIES = {'high': 0, 'medium': 10, 'low': 20}
+    DEMOTED_OFFSET = 100  # 'demote' 정책으로 미뤄진 작업은 모든 현재 작업 뒤에 실행
+
     def __init__(self, max_workers=None, thread_name_prefix=''):
-        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
-        
-        # 우선순위별 작업 큐
-        self.task_queues = {
-            'high': queue.Queue(),    # 현재 보는 이미지
-            'medium': queue.Queue(),  # 다음/인접 이미지
-            'low': queue.Queue()      # 나머지 이미지
-        }
-        
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._thread_name_prefix = thread_name_prefix or "PriorityPool"
+        self._heap = []  # [우선순위, 순번, task(무효화되면 None), fn, args, kwargs]
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._threads = []
+        self._idle_workers = 0
+        self._generations = {}     # 그룹 -> 현재 세대
+        self._stale_policies = {}  # 그룹 -> 'cancel' 또는 'demote'
         self.shutdown_flag = False
-        self.queue_processor_thread = threading.Thread(
-            target=self._process_priority_queues,
+
+    @classmethod
+    def priority_value(cls, priority):
+        """'high'/'medium'/'low' 또는 숫자를 숫자 우선순위로 변환 (알 수 없는 값은 'low')"""
+        if isinstance(priority, (int, float)):
+            return priority
+        return cls.PRIORITIES.get(priority, cls.PRIORITIES['low'])
+
+    def submit_task(self, priority, fn, args=(), kwargs=None, group=None):
+        """작업 제출 후 ImagingTask 핸들 반환. group을 주면 해당 그룹의 현재 세대에 묶입니다."""
+        with self._condition:
+            if self.shutdown_flag:
+                raise RuntimeError("종료된 스레드 풀에는 작업을 제출할 수 없습니다.")
+            task = ImagingTask(self, priority, group, self._generations.get(group, 0))
+            self._push(task, self.priority_value(priority), fn, args, kwargs or {})
+            if self._idle_workers == 0 and len(self._threads) < self._max_workers:
+                self._start_worker()
+            self._condition.notify()
+        return task
+
+    def submit_with_priority(self, priority, fn, *args, **kwargs):
+        """우선순위와 함께 작업 제출. 대기 중에 cancel()하면 실행되지 않습니다."""
+        return self.submit_task(priority, fn, args, kwargs)
+
+    def submit(self, fn, *args, **kwargs):
+        """기본 우선순위('medium')로 작업 제출 (ThreadPoolExecutor 호환)"""
+        return self.submit_task('medium', fn, args, kwargs)
+
+    def _push(self, task, value, fn, args, kwargs):
+        """힙 항목 추가 (호출자가 조건 변수 락 보유)"""
+        self._sequence += 1
+        entry = [value, self._sequence, task, fn, args, kwargs]
+        task._entry = entry
+        heapq.heappush(self._heap, entry)
+
+    def _reprioritize(self, task, priority, keep_higher=False):
+        with self._condition:
+            entry = task._entry
+            if entry is None or task.done():
+                return False
+            value = self.priority_value(priority)
+            if keep_higher and not self.is_stale(task) and not task.demoted and entry[0] <= value:
+                return True
+            entry[2] = None  # 기존 항목 무효화 (꺼낼 때 건너뜀)
+            task.priority = priority
+            task.demoted = False
+            task.generation = self._generations.get(task.group, 0)
+            self._push(task, value, entry[3], entry[4], entry[5])
+            self._condition.notify()
+            return True
+
+    def advance_generation(self, group, stale_policy='cancel'):
+        """
+        그룹의 세대를 올립니다 (O(1)). 이전 세대에 제출되고 그 뒤 갱신되지 않은 대기 작업은
+        작업자가 꺼낼 때 stale_policy에 따라 취소('cancel')되거나 맨 뒤로 미뤄집니다('demote').
+        """
+        with self._condition:
+            generation = self._generations.get(group, 0) + 1
+            self._generations[group] = generation
+            self._stale_policies[group] = stale_policy
+            return generation
+
+    def is_stale(self, task):
+        return task.group is not None and task.generation < self._generations.get(task.group, 0)
+
+    def cancel_pending(self, min_priority='low'):
+        """우선순위 숫자가 min_priority 이상인 대기 작업을 모두 취소하고 취소한 개수 반환"""
+        threshold = self.priority_value(min_priority)
+        with self._condition:
+            victims = [entry[2] for entry in self._heap if entry[2] is not None and entry[0] >= threshold]
+        return sum(1 for task in victims if task.cancel())
+
+    def pending_count(self):
+        with self._condition:
+            return sum(1 for entry in self._heap if entry[2] is not None and not entry[2].done())
+
+    def _start_worker(self):
+        """작업자 스레드 추가 (호출자가 조건 변수 락 보유)"""
+        worker = threading.Thread(
+            target=self._worker_loop,
             daemon=True,
-            name=f"{thread_name_prefix}-QueueProcessor"
+            name=f"{self._thread_name_prefix}_{len(self._threads)}"
         )
-        self.queue_processor_thread.start()
-    
-    def _process_priority_queues(self):
-        """우선순위 큐를 처리하는 스레드 함수"""
-        while not self.shutdown_flag:
-            task_info = None
-            
+        self._threads.append(worker)
+        worker.start()
+
+    def _next_entry(self, stale_tasks):
+        """
+        실행할 다음 항목을 꺼냅니다 (호출자가 조건 변수 락 보유). 종료 중이거나 취소할 오래된 작업이
+        모인 채로 큐가 비면 None. 오래된 작업은 stale_tasks에 모으고, 취소 콜백이 풀 락 밖에서
+        실행되도록 호출자가 취소합니다.
+        """
+        while True:
+            while not self._heap and not self.shutdown_flag:
+                if stale_tasks:
+                    return None
+                self._idle_workers += 1
+                self._condition.wait()
+                self._idle_workers -= 1
+            if not self._heap:
+                return None
+            entry = heapq.heappop(self._heap)
+            task = entry[2]
+            if task is None:
+                continue  # 우선순위 변경으로 무효화된 항목
+            task._entry = None
+            if self.is_stale(task) and not task.demoted:  # 한 번 미뤄진 작업은 그대로 실행
+                if self._stale_policies.get(task.group) == 'demote':
+                    task.demoted = True
+                    self._push(task, entry[0] + self.DEMOTED_OFFSET, entry[3], entry[4], entry[5])
+                else:
+                    stale_tasks.append(task)
+                continue
+            return entry
+
+    def _worker_loop(self):
+        """힙에서 가장 급한 작업을 꺼내 실행 (큐가 비면 조건 변수로 대기, 폴링 없음)"""
+        while True:
+            stale_tasks = []
+            with self._condition:
+                entry = self._next_entry(stale_tasks)
+                stopping = entry is None and self.shutdown_flag
+            for task in stale_tasks:
+                task.cancel()
+            if entry is None:
+                if stopping:
+                    return  # 종료
+                continue
+            _, _, task, fn, args, kwargs = entry
+            if not task.set_running_or_notify_cancel():
+                continue  # 대기 중 취소된 작업
             try:
-                # 1. 높은 우선순위 큐 먼저 확인
-                task_info = self.task_queues['high'].get_nowait()
-            except queue.Empty:
-                try:
-                    # 2. 중간 우선순위 큐 확인
-                    task_info = self.task_queues['medium'].get_nowait()
-                except queue.Empty:
-                    try:
-                        # 3. 낮은 우선순위 큐 확인
-                        task_info = self.task_queues['low'].get_nowait()
-                    except queue.Empty:
-                        # 모든 큐가 비어있으면 잠시 대기
-                        time.sleep(0.05)
-                        continue  # 루프의 처음으로 돌아가 다시 확인
-
-            # task_info가 성공적으로 가져와졌다면 작업 제출
-            if task_info:
-                # task_info는 (wrapper_function, args, kwargs) 튜플
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                task.set_exception(e)
+            else:
+                task.set_result(result)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """스레드 풀 종료 (cancel_futures=True면 대기 중인 작업을 모두 취소)"""
+        with self._condition:
+            self.shutdown_flag = True
+            pending = [entry[2] for entry in self._heap if entry[2] is not None] if cancel_futures else []
+            if cancel_futures:
+                self._heap.clear()
+            self._condition.notify_all()
+            threads = list(self._threads)
+        for task in pending:
+            task.cancel()
+        if wait:
+            for worker in threads:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+class SharedMemorySlabPool:
+    """
+    부모 프로세스가 소유하는 재사용 공유 메모리 슬랩 풀.
+    작업을 보낼 때 빈 슬랩 이름을 함께 보내면 디코더 프로세스가 픽셀을 슬랩에 직접 쓰고,
+    큐로는 슬랩 이름과 형태만 돌아옵니다. 결과를 QImage로 옮긴 뒤 release()로 반납합니다.
+    슬랩이 작아 결과를 담지 못했으면 release(needed_bytes=...)가 더 큰 슬랩으로 교체합니다.
+    (Windows는 마지막 핸들이 닫히면 세그먼트가 사라지므로 생성/해제는 항상 부모 쪽에서 합니다)
+    """
+
+    def __init__(self, slab_count, slab_bytes):
+        self.slab_count = max(1, slab_count)
+        self.slab_bytes = slab_bytes
+        self._lock = threading.Lock()
+        self._slabs = {}  # 슬랩 이름 -> SharedMemory
+        self._free = []   # 빈 슬랩 이름 (LIFO: 최근에 쓴 슬랩이 캐시에 남아 있을 가능성이 높음)
+        self._closed = False
+
+    def acquire(self):
+        """빈 슬랩 이름 반환 (필요하면 새로 생성). 모두 사용 중이면 None (호출자는 큐 전송으로 폴백)"""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._free:
+                return self._free.pop()
+            if len(self._slabs) >= self.slab_count:
+                return None
+            try:
+                slab = SharedMemory(create=True, size=self.slab_bytes)
+            except Exception as e:
+                logging.warning(f"공유 메모리 슬랩 생성 실패 ({self.slab_bytes / (1024 * 1024):.0f}MB): {e}")
+                return None
+            self._slabs[slab.name] = slab
+            return slab.name
+
+    def buffer(self, name):
+        """슬랩 전체 버퍼 (memoryview)"""
+        return self._slabs[name].buf
+
+    def release(self, name, needed_bytes=0):
+        """슬랩 반납. needed_bytes가 슬랩보다 크면 그 크기로 교체해 다음 작업부터 슬랩에 담기게 함"""
+        with self._lock:
+            slab = self._slabs.get(name)
+            if slab is None:
+                return
+            if self._closed:
+                del self._slabs[name]
+                self._destroy(slab)
+                return
+            if needed_bytes > slab.size:
+                self.slab_bytes = max(self.slab_bytes, needed_bytes)
+                del self._slabs[name]
+                self._destroy(slab)
                 try:
-                    super().submit(task_info[0], *task_info[1], **task_info[2])
+                    slab = SharedMemory(create=True, size=self.slab_bytes)
                 except Exception as e:
-                    logging.error(f"작업 제출 실패: {e}")
-    
-    def submit_with_priority(self, priority, fn, *args, **kwargs):
-        """우선순위와 함께 작업 제출"""
-        if priority not in self.task_queues:
-            priority = 'low'  # 기본값
-        
-        from concurrent.futures import Future
-        future = Future()
+                    logging.warning(f"공유 메모리 슬랩 확장 실패 ({self.slab_bytes / (1024 * 1024):.0f}MB): {e}")
+                    return
+                self._slabs[slab.name] = slab
+            self._free.append(slab.name)
+
+    def trim(self):
+        """빈 슬랩을 모두 해제하고 해제한 바이트 수 반환 (풀은 계속 사용 가능, 다음 acquire에서 다시 생성)"""
+        with self._lock:
+            freed = 0
+            for name in self._free:
+                slab = self._slabs.pop(name)
+                freed += slab.size
+                self._destroy(slab)
+            self._free.clear()
+            return freed
+
+    def close(self):
+        """모든 빈 슬랩 해제 (사용 중인 슬랩은 반납될 때 해제)"""
+        with self._lock:
+            self._closed = True
+            for name in self._free:
+                self._destroy(self._slabs.pop(name))
+            self._free.clear()
+
+    @staticmethod
+    def _destroy(slab):
+        try:
+            slab.close()
+            slab.unlink()
+        except (BufferError, FileNotFoundError, OSError) as e:
+            logging.debug(f"공유 메모리 슬랩 해제 실패 ({slab.name}): {e}")
+
+
+def decoder_process_context():
+    """
+    디코더 프로세스 생성 컨텍스트 (RAW/일반 이미지 디코더 풀 공용). POSIX에서는 앱 모듈과 rawpy/numpy를 미리 import한
+    forkserver에서 fork하므로 Qt와 작업 스레드를 가진 GUI 프로세스를 직접 fork하지 않고(상속된 락으로 인한 교착 방지),
+    첫 시작과 재시작 모두 import 비용 없이 뜹니다 (Windows와 동결 실행 파일은 기본 컨텍스트).
+    """
+    if getattr(sys, 'frozen', False) or 'forkserver' not in get_all_start_methods():
+        return get_context()
+    context = get_context('forkserver')
+    context.set_forkserver_preload(['__main__', 'rawpy', 'numpy'])
+    return context
+
+
+def decode_image_in_process(input_queue, output_queue, slot=0, current_tasks=None):
+    """
+    별도 프로세스에서 일반 이미지(JPEG/HEIC/PNG 등) 디코딩 처리 - 픽셀은 공유 메모리 슬랩으로 반환.
+    current_tasks는 부모의 감독자와 공유하는 슬롯별 배열로, 처리 중인 task_id를 기록합니다.
+    """
+    logging.info(f"이미지 디코더 프로세스 시작됨 (PID: {os.getpid()})")
+    try:
+        pillow_heif.register_heif_opener()
+    except Exception as e:
+        logging.warning(f"이미지 디코더 프로세스: HEIC 오프너 등록 실패: {e}")
+
+    attached = {}  # 슬랩 이름 -> SharedMemory (프로세스 수명 동안 재사용)
 
-        # 실제 실행될 함수를 래핑하여 future 결과를 설정하도록 함
-        def wrapper():
+    while True:
+        try:
+            task = input_queue.get()
+            if task is None:  # 종료 신호
+                break
+            task_id, file_path, fit_size, slab_name = task
+            if current_tasks is not None:
+                current_tasks[slot] = task_id
             try:
-                result = fn(*args, **kwargs)
-                future.set_result(result)
+                with Image.open(file_path) as image:
+                    orientation = image.getexif().get(0x0112, 1)
+                    reduced_from = None
+                    if fit_size and image.format == 'JPEG':
+                        # ImageLoader._draft_for_fit과 같은 DCT 축소 디코딩
+                        width, height = fit_size
+                        if orientation in (5, 6, 7, 8):
+                            width, height = height, width
+                        original_size = image.size
+                        image.draft(None, (width, height))
+                        if image.size != original_size:
+                            reduced_from = original_size[::-1] if orientation in (5, 6, 7, 8) else original_size
+                    image.load()
+                    icc_profile = image.info.get('icc_profile')
+                    if image.mode not in ImageConverter.PIL_FORMATS:
+                        image = image.convert('RGBA' if image.mode in ('P', 'PA', 'LA', 'RGBa') else 'RGB')
+                    # 부모가 같은 표의 QImage 형식으로 감싸므로 배치는 ImageConverter.PIL_FORMATS를 그대로 사용
+                    rawmode, _, bytes_per_pixel = ImageConverter.PIL_FORMATS[image.mode]
+                    data = ImageConverter._pack(image, rawmode, bytes_per_pixel)
+                    result = {
+                        'task_id': task_id,
+                        'success': True,
+                        'file_path': file_path,
+                        'mode': image.mode,
+                        'width': image.width,
+                        'height': image.height,
+                        'bytes_per_line': image.width * bytes_per_pixel,
+                        'nbytes': len(data),
+                        'orientation': orientation,
+                        'icc_profile': icc_profile,
+                        'reduced_from': reduced_from,
+                    }
+                slab = None
+                if slab_name:
+                    slab = attached.get(slab_name)
+                    if slab is None:
+                        slab = attached[slab_name] = SharedMemory(name=slab_name)
+                if slab is not None and slab.size >= len(data):
+                    slab.buf[:len(data)] = data
+                    result['in_slab'] = True
+                else:
+                    # 슬랩이 없거나 작으면 큐로 전송 (부모가 다음 작업부터 슬랩을 키움)
+                    result['data'] = bytes(data)
+                    result['in_slab'] = False
+                del data
+                output_queue.put(result)
             except Exception as e:
-                future.set_exception(e)
+                output_queue.put({'task_id': task_id, 'success': False, 'file_path': file_path, 'error': str(e)})
+            if current_tasks is not None:
+                current_tasks[slot] = -1
+        except Exception as main_error:
+            logging.error(f"이미지 디코더 프로세스 주 루프 오류: {main_error}")
 
-        # 큐에 (래핑된 함수, 빈 인자, 빈 키워드 인자, future 객체)를 추가
-        self.task_queues[priority].put((wrapper, (), {}))
+    for slab in attached.values():
+        try:
+            slab.close()
+        except BufferError:
+            pass
+    logging.info(f"이미지 디코더 프로세스 종료 (PID: {os.getpid()})")
+
+
+class ImageDecodeProcessPool:
+    """
+    일반 이미지 프로세스 디코딩 엔진 (선택 사항, 워크스테이션 프로필에서 사용).
+    디코딩을 별도 프로세스에서 수행해 GIL 경합 없이 물리 코어 수만큼 병렬로 처리합니다.
+    이미징 스레드가 decode()를 호출하면 결과가 올 때까지 (GIL 없이) 대기한 뒤,
+    공유 메모리 슬랩의 픽셀을 QImage로 한 번 복사하고 슬랩을 바로 반납합니다.
+    프로세스는 첫 요청 때 필요한 만큼만 시작하며, 수집 스레드가 죽은 프로세스를 감지하면 처리 중이던 작업을
+    바로 실패로 돌려(호출자는 스레드 디코딩으로 폴백) 프로세스를 다시 띄웁니다.
+    """
+
+    SLAB_BYTES = 48 * 1024 * 1024  # 4K Fit 디코딩이 들어가는 크기, 큰 결과가 오면 자동 확장
+    RESULT_TIMEOUT = 30.0          # 이 시간 안에 결과가 없으면 호출자는 스레드 디코딩으로 폴백
+    SUPERVISE_INTERVAL = 0.5       # 디코더 프로세스 생존 확인 간격 (초)
+    MAX_CRASHES = 5                # 디코더 프로세스가 이만큼 비정상 종료하면 엔진을 끄고 스레드 디코딩만 사용
+
+    def __init__(self, num_processes):
+        logging.info(f"ImageDecodeProcessPool 초기화: 최대 {num_processes}개 프로세스 (첫 요청 시 시작)")
+        self.num_processes = max(1, num_processes)
+        self._context = decoder_process_context()
+        self.input_queue = self._context.Queue()
+        self.output_queue = self._context.Queue()
+        # 프로세스당 디코딩 중 1개 + 부모 쪽 복사 대기 1개
+        self.slabs = SharedMemorySlabPool(self.num_processes * 2, self.SLAB_BYTES)
+        self.workers = {}  # 슬롯 -> 실행 중인 디코더 프로세스 (필요할 때 _ensure_workers가 시작)
+        self._current_tasks = self._context.Array('l', [-1] * self.num_processes, lock=False)  # 슬롯별 처리 중인 task_id
+        self._crashes = 0
+        self._lock = threading.Lock()
+        self._tasks = {}  # task_id -> (Future, 슬랩 이름)
+        self._next_task_id = 0
+        self._running = True
+        self._collector = threading.Thread(target=self._collect_results, name="ImageDecodeCollector", daemon=True)
+        self._collector.start()
+
+    def _ensure_workers(self):
+        """대기/처리 중인 작업 수만큼 프로세스를 최대 num_processes까지 시작 (락 보유 상태에서 호출)"""
+        while len(self.workers) < min(self.num_processes, len(self._tasks)):
+            slot = next(i for i in range(self.num_processes) if i not in self.workers)
+            self._current_tasks[slot] = -1
+            p = self._context.Process(target=decode_image_in_process,
+                                      args=(self.input_queue, self.output_queue, slot, self._current_tasks), daemon=True)
+            p.start()
+            self.workers[slot] = p
+            logging.info(f"이미지 디코더 프로세스 시작됨 (PID: {p.pid}, {len(self.workers)}/{self.num_processes})")
+
+    def submit(self, file_path, fit_size=None):
+        """디코딩 요청 (결과 dict를 담는 Future 반환, 종료 후에는 None)"""
+        with self._lock:
+            if not self._running:
+                return None
+            task_id = self._next_task_id
+            self._next_task_id += 1
+            future = Future()
+            slab_name = self.slabs.acquire()
+            self._tasks[task_id] = (future, slab_name)
+            try:
+                self._ensure_workers()
+            except Exception as e:
+                logging.warning(f"이미지 디코더 프로세스 시작 실패: {e}")
+                if not self.workers:
+                    del self._tasks[task_id]
+                    if slab_name:
+                        self.slabs.release(slab_name)
+                    return None
+        self.input_queue.put((task_id, str(file_path), fit_size, slab_name))
         return future
-    
-    def shutdown(self, wait=True, cancel_futures=False):
-        """스레드 풀 종료"""
-        self.shutdown_flag = True
-        super().shutdown(wait=wait, cancel_futures=cancel_futures)
 
-def decode_raw_in_process(input_queue, output_queue):
-    """별도 프로세스에서 RAW 디코딩 처리"""
+    def decode(self, file_path, fit_size=None, timeout=None):
+        """
+        동기 디코딩 (작업 스레드에서 호출). 성공하면 결과 dict에 'image'(QImage, 방향/색 공간 적용 전)를 담아 반환하고,
+        실패/시간 초과/종료 시 None을 반환합니다.
+        """
+        future = self.submit(file_path, fit_size)
+        if future is None:
+            return None
+        try:
+            result = future.result(timeout or self.RESULT_TIMEOUT)
+        except FutureTimeoutError:
+            if future.cancel():  # 결과가 나중에 오면 수집 스레드가 슬랩만 반납
+                logging.warning(f"프로세스 디코딩 시간 초과: {Path(file_path).name}")
+                return None
+            result = future.result()
+        except Exception:
+            return None
+        if not result.get('success'):
+            if result.get('slab'):
+                self.slabs.release(result['slab'])
+            logging.debug(f"프로세스 디코딩 실패 ({Path(file_path).name}): {result.get('error')}")
+            return None
+        result['image'] = self._take_image(result)
+        return result
+
+    def _take_image(self, result):
+        """결과 픽셀을 자체 버퍼를 가진 QImage로 옮기고 슬랩 반납"""
+        qformat = ImageConverter.PIL_FORMATS[result['mode']][1]
+        width, height, bytes_per_line = result['width'], result['height'], result['bytes_per_line']
+        slab_name = result.get('slab')
+        try:
+            if result.get('in_slab'):
+                view = self.slabs.buffer(slab_name)[:result['nbytes']]
+                wrapped = QImage(view, width, height, bytes_per_line, qformat)
+                image = wrapped.copy()
+                del wrapped
+                try:
+                    view.release()
+                except BufferError:
+                    pass  # 감싼 QImage가 아직 해제되지 않았으면 GC에 맡김
+                return image
+            return QImage(result.pop('data'), width, height, bytes_per_line, qformat)  # 큐 폴백: 받은 bytes를 그대로 감쌈
+        finally:
+            if slab_name:
+                self.slabs.release(slab_name, 0 if result.get('in_slab') else result['nbytes'])
+
+    def _collect_results(self):
+        """출력 큐에서 결과를 받아 해당 Future에 전달 (수집 전용 스레드, SUPERVISE_INTERVAL마다 프로세스 생존 확인)"""
+        next_check = time.monotonic() + self.SUPERVISE_INTERVAL
+        while True:
+            try:
+                result = self.output_queue.get(timeout=self.SUPERVISE_INTERVAL)
+            except queue.Empty:
+                result = False
+            except (EOFError, OSError):
+                break
+            if result is None:  # 종료 신호
+                break
+            if result:
+                self._complete(result['task_id'], result)
+            if time.monotonic() >= next_check:
+                self._supervise()
+                next_check = time.monotonic() + self.SUPERVISE_INTERVAL
+
+    def _complete(self, task_id, result):
+        """작업 결과를 Future에 전달 (이미 끝났거나 취소된 작업이면 슬랩만 반납)"""
+        with self._lock:
+            future, slab_name = self._tasks.pop(task_id, (None, None))
+        result['slab'] = slab_name
+        if future is None or not future.set_running_or_notify_cancel():
+            if slab_name:
+                self.slabs.release(slab_name)
+            return
+        future.set_result(result)
+
+    def _supervise(self):
+        """
+        죽은 디코더 프로세스 정리 (수집 스레드). 처리 중이던 작업은 바로 실패로 돌려 호출자가 RESULT_TIMEOUT을
+        기다리지 않고 스레드 디코딩으로 폴백하게 하고, 남은 작업이 있으면 프로세스를 다시 띄웁니다.
+        비정상 종료가 MAX_CRASHES번 쌓이면 엔진을 끄고 대기 중인 작업을 모두 실패로 돌립니다.
+        """
+        failed, dead, survivors = [], [], None
+        with self._lock:
+            if not self._running:
+                return
+            for slot, p in list(self.workers.items()):
+                if p.is_alive():
+                    continue
+                del self.workers[slot]
+                dead.append(p)
+                self._crashes += 1
+                task_id = self._current_tasks[slot]
+                self._current_tasks[slot] = -1
+                logging.warning(f"이미지 디코더 프로세스 #{slot} (PID: {p.pid}) 비정상 종료 (exit code {p.exitcode})")
+                if task_id >= 0:
+                    failed.append((task_id, f"디코더 프로세스 비정상 종료 (exit code {p.exitcode})"))
+            if dead and self._crashes >= self.MAX_CRASHES:
+                logging.error(f"이미지 디코더 프로세스가 {self._crashes}번 비정상 종료하여 스레드 디코딩으로 전환")
+                self._running = False
+                survivors = list(self.workers.items())
+                self.workers.clear()
+                failed.extend((task_id, "프로세스 디코딩 엔진 중지") for task_id in self._tasks)
+            elif dead:
+                try:
+                    self._ensure_workers()
+                except Exception as e:
+                    logging.warning(f"이미지 디코더 프로세스 재시작 실패: {e}")
+        for p in dead:
+            p.join(0.1)
+        if survivors is not None:
+            # 남은 프로세스가 반납될 슬랩에 더 쓰지 않도록 먼저 멈추고, 보내 둔 작업을 비운 뒤 작업을 실패로 돌림
+            self._stop_workers(survivors, graceful=False)
+            self._drain_input()
+        for task_id, error in failed:
+            self._complete(task_id, {'task_id': task_id, 'success': False, 'error': error})
+        if survivors is not None:
+            self.slabs.close()  # 빈 슬랩 해제 (호출자가 아직 쥔 슬랩은 반납될 때 해제)
+
+    def _stop_workers(self, workers, graceful=True):
+        """디코더 프로세스 종료 (graceful이면 종료 신호를 보내고 기다린 뒤, 응답하지 않으면 강제 종료)"""
+        if graceful:
+            for _ in workers:
+                self.input_queue.put(None)
+        for slot, p in workers:
+            if graceful:
+                p.join(0.5)
+            if p.is_alive():
+                if graceful:
+                    logging.info(f"이미지 디코더 프로세스 #{slot + 1} (PID: {p.pid})이 응답하지 않아 강제 종료")
+                p.terminate()
+            p.join(1.0)
+
+    def _drain_input(self):
+        """입력 큐에 남은 (더 처리할 프로세스가 없는) 작업 버림"""
+        try:
+            while True:
+                self.input_queue.get_nowait()
+        except (queue.Empty, EOFError, OSError):
+            pass
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._tasks)
+
+    def shutdown(self):
+        """프로세스 풀 종료 (대기 중인 호출자는 None을 받고 스레드 디코딩으로 폴백)"""
+        with self._lock:
+            self._running = False
+            pending = list(self._tasks.values())
+            self._tasks.clear()
+            workers = list(self.workers.items())
+            self.workers.clear()
+        if self._collector is None:
+            return
+        for future, slab_name in pending:
+            future.cancel()
+            if slab_name:
+                self.slabs.release(slab_name)
+        self._stop_workers(workers)
+        self.output_queue.put(None)
+        self._collector.join(1.0)
+        self._collector = None
+        self.slabs.close()
+        logging.info("ImageDecodeProcessPool 종료 완료")
+
+    @classmethod
+    def run_benchmark(cls, paths, num_processes=None, repeat=2):
+        """
+        처리량 벤치마크: 같은 수의 작업 스레드로 (1) 스레드 안에서 PIL 디코딩, (2) 프로세스 엔진 디코딩을
+        각각 수행해 초당 이미지 수를 출력합니다. 결과는 모두 자체 버퍼를 가진 QImage까지 만듭니다.
+        """
+        files = []
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                files.extend(sorted(f for f in path.iterdir() if f.suffix.lower() in ImageConverter.BENCHMARK_EXTENSIONS))
+            elif path.is_file():
+                files.append(path)
+        if not files:
+            print("사용법: PhotoSort.py --benchmark-decode <이미지 폴더 또는 파일...>")
+            return
+        if num_processes is None:
+            num_processes = psutil.cpu_count(logical=False) or cpu_count()
+        pillow_heif.register_heif_opener()
+        files = files * repeat
+
+        def decode_in_thread(file_path):
+            with Image.open(file_path) as image:
+                image.load()
+                return ImageConverter.pil_to_image(image, image.getexif().get(0x0112, 1))
+
+        engine = cls(num_processes)
+        try:
+            # 프로세스 기동/슬랩 생성 비용은 측정에서 제외 (작업자 수만큼 동시에 요청해 프로세스를 모두 띄움)
+            with ThreadPoolExecutor(max_workers=num_processes) as executor:
+                list(executor.map(engine.decode, files[:num_processes]))
+            results = {}
+            for label, decode in (('thread', decode_in_thread), ('process', lambda f: (engine.decode(f) or {}).get('image'))):
+                with ThreadPoolExecutor(max_workers=num_processes) as executor:
+                    start = time.perf_counter()
+                    decoded = sum(1 for image in executor.map(decode, files) if image is not None and not image.isNull())
+                    elapsed = time.perf_counter() - start
+                results[label] = decoded / elapsed if elapsed > 0 else 0.0
+                print(f"{'스레드' if label == 'thread' else '프로세스'} 디코딩: {decoded}장 / {elapsed:.2f}초 = {results[label]:.1f}장/초")
+        finally:
+            engine.shutdown()
+        speedup = results['process'] / results['thread'] if results.get('thread') else 0.0
+        print(f"작업자 {num_processes}개 기준 처리량: 프로세스 엔진이 스레드 대비 {speedup:.2f}배")
+
+
+def decode_raw_in_process(input_queue, output_queue, idle_timeout=None, slot=0, heartbeats=None, current_tasks=None):
+    """
+    별도 프로세스에서 RAW 디코딩 처리 (idle_timeout초 동안 작업이 없으면 부모에 알리고 종료).
+    heartbeats/current_tasks는 부모의 감독자와 공유하는 슬롯별 배열로, 하트비트 시각과 처리 중인 task_id를 기록합니다.
+    """
     logging.info(f"RAW 디코더 프로세스 시작됨 (PID: {os.getpid()})")
+    if heartbeats is not None:
+        # 하트비트 스레드: LibRaw 처리 중에도(GIL 해제) 주기적으로 생존 신호 기록
+        def beat():
+            while True:
+                heartbeats[slot] = time.time()
+                time.sleep(RawDecoderPool.HEARTBEAT_INTERVAL)
+        threading.Thread(target=beat, name="RawDecoderHeartbeat", daemon=True).start()
     try:
         import rawpy
         import numpy as np
     except ImportError as e:
         logging.error(f"RAW 디코더 프로세스 초기화 오류 (모듈 로드 실패): {e}")
+        output_queue.put({'worker_exit': os.getpid(), 'error': str(e)})
         return
     
     memory_warning_shown = False
     last_memory_log_time = 0  # 마지막 메모리 경고 로그 시간
     memory_log_cooldown = 60  # 메모리 경고 로그 출력 간격 (초)
+    attached = {}  # 슬랩 이름 -> SharedMemory (프로세스 수명 동안 재사용)
     
     while True:
         try:
-            task = input_queue.get()
+            try:
+                task = input_queue.get(timeout=idle_timeout)
+            except queue.Empty:
+                # 유휴 종료: 부모가 프로세스 목록에서 빼고, 밀린 작업이 있으면 새 프로세스를 띄움
+                logging.info(f"RAW 디코더 프로세스 유휴 종료 (PID: {os.getpid()}, {idle_timeout}초 동안 작업 없음)")
+                output_queue.put({'worker_exit': os.getpid()})
+                break
             if task is None:  # 종료 신호
                 logging.info(f"RAW 디코더 프로세스 종료 신호 수신 (PID: {os.getpid()})")
                 break
                 
-            file_path, task_id = task
+            file_path, task_id, slab_name, fit_size, cache_stem, attempt = task
+            if current_tasks is not None:
+                current_tasks[slot] = task_id
             
             # 작업 시작 전 메모리 확인
             try:
@@ -2089,14 +3018,7 @@ def decode_raw_in_process(input_queue, output_queue):
                     last_memory_log_time = current_time
                 elif memory_percent <= 75:
                     memory_warning_shown = False
-                    
-                # 메모리가 매우 부족하면 작업 연기 (95% 이상)
-                if memory_percent > 95:
-                    logging.warning(f"심각한 메모리 부족 ({memory_percent}%): RAW 디코딩 작업 {os.path.basename(file_path)} 연기")
-                    # 작업을 큐에 다시 넣고 잠시 대기
-                    input_queue.put((file_path, task_id))
-                    time.sleep(5)  # 조금 더 길게 대기
-                    continue
+                # 메모리 부족 시 작업 연기는 부모 쪽 스케줄러(RawDecoderPool._admit)가 처리
             except:
                 pass  # psutil 사용 불가 시 무시
             
@@ -2109,35 +3031,76 @@ def decode_raw_in_process(input_queue, output_queue):
                     except:
                         pass
                         
+                    # 2단계 디코딩: Fit 표시 배율이 절반 이하이면 half_size(디모자이크 생략, 약 4배 빠름)로 먼저 디코딩하고
+                    # 원본 품질은 GUI가 현재 이미지에 대해서만 따로 요청합니다 (fit_size가 None이면 원본 품질).
+                    sizes = raw.sizes
+                    full_size = (sizes.height, sizes.width) if sizes.flip in (5, 6) else (sizes.width, sizes.height)
+                    fast_tier = bool(fit_size) and min(fit_size[0] / full_size[0], fit_size[1] / full_size[1]) <= 0.6
+
                     # 이미지 처리
-                    rgb = raw.postprocess(use_camera_wb=True, output_bps=8)
+                    rgb = raw.postprocess(use_camera_wb=True, output_bps=8, half_size=fast_tier)
                     
                     # 결과 메타데이터 준비
                     result = {
                         'task_id': task_id,
+                        'attempt': attempt,
                         'width': rgb.shape[1],
                         'height': rgb.shape[0],
                         'success': True,
-                        'file_path': file_path
+                        'file_path': file_path,
+                        'tier': 'fast' if fast_tier else 'full',
+                        'reduced_from': full_size if fast_tier else None,
                     }
                     
                     # 데이터 형태 확인하고 전송 준비
                     if rgb.dtype == np.uint8 and rgb.ndim == 3:
-                        # 메모리 공유를 위해 numpy 배열을 바이트로 직렬화
-                        result['data'] = rgb.tobytes()
                         result['shape'] = rgb.shape
                         result['dtype'] = str(rgb.dtype)
+                        result['nbytes'] = rgb.nbytes
+                        slab = None
+                        if slab_name:
+                            slab = attached.get(slab_name)
+                            if slab is None:
+                                slab = attached[slab_name] = SharedMemory(name=slab_name)
+                        if slab is not None and slab.size >= rgb.nbytes:
+                            # 부모가 준 공유 메모리 슬랩에 직접 기록 (큐로는 슬랩 이름과 형태만 전송)
+                            target = np.ndarray(rgb.shape, dtype=np.uint8, buffer=slab.buf)
+                            np.copyto(target, rgb)
+                            del target
+                            result['in_slab'] = True
+                        else:
+                            # 슬랩이 없거나 작으면 큐로 전송 (부모가 다음 작업부터 슬랩을 키움)
+                            result['data'] = rgb.tobytes()
+                            result['in_slab'] = False
                         
                         # 큰 데이터는 로그에 출력하지 않음
-                        data_size_mb = len(result['data']) / (1024*1024)
-                        logging.info(f"RAW 디코딩 완료: {os.path.basename(file_path)} - {rgb.shape}, {data_size_mb:.2f}MB")
+                        data_size_mb = rgb.nbytes / (1024*1024)
+                        logging.info(f"RAW 디코딩 완료: {os.path.basename(file_path)} - {rgb.shape}, {data_size_mb:.2f}MB, {'슬랩' if result['in_slab'] else '큐'} 전송")
                     else:
                         # 예상치 못한 데이터 형식인 경우
                         logging.warning(f"디코딩된 데이터 형식 문제: {rgb.dtype}, shape={rgb.shape}")
                         result['success'] = False
                         result['error'] = f"Unexpected data format: {rgb.dtype}, shape={rgb.shape}"
                     
-                    # 처리 결과 전송 전 메모리에서 큰 객체 제거
+                    output_queue.put(result)
+                    
+                    # 디스크 캐시 기록: 결과를 먼저 보낸 뒤 기록하므로 표시가 늦어지지 않음
+                    if cache_stem and result['success']:
+                        cache_path = f"{cache_stem}_{result['tier']}.npy"
+                        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+                        try:
+                            with open(temp_path, 'wb') as f:
+                                np.save(f, rgb)
+                            os.replace(temp_path, cache_path)
+                            output_queue.put({'disk_cached': cache_path, 'bytes': os.path.getsize(cache_path)})
+                        except OSError as e:
+                            logging.warning(f"RAW 디스크 캐시 기록 실패: {os.path.basename(file_path)} - {e}")
+                            try:
+                                os.remove(temp_path)
+                            except OSError:
+                                pass
+                    
+                    # 메모리에서 큰 객체 제거
                     rgb = None
                     
                     # 명시적 가비지 컬렉션
@@ -2147,18 +3110,19 @@ def decode_raw_in_process(input_queue, output_queue):
                     except:
                         pass
                     
-                    output_queue.put(result)
-                    
             except Exception as e:
                 logging.error(f"RAW 디코딩 중 오류: {os.path.basename(file_path)} - {e}")
                 import traceback
                 traceback.print_exc()
                 output_queue.put({
                     'task_id': task_id, 
+                    'attempt': attempt,
                     'success': False, 
                     'file_path': file_path,
                     'error': str(e)
                 })
+            if current_tasks is not None:
+                current_tasks[slot] = -1
                 
         except Exception as main_error:
             logging.error(f"RAW 디코더 프로세스 주 루프 오류: {main_error}")
@@ -2166,70 +3130,616 @@ def decode_raw_in_process(input_queue, output_queue):
             traceback.print_exc()
             # 루프 계속 실행: 한 작업이 실패해도 프로세스는 계속 실행
 
+    for slab in attached.values():
+        try:
+            slab.close()
+        except BufferError:
+            pass
     logging.info(f"RAW 디코더 프로세스 종료 (PID: {os.getpid()})")
 
+class RawFrameDiskCache:
+    """
+    디코딩된 RAW 프레임의 영구 디스크 캐시 (RGB888 배열을 .npy로 저장, np.load(mmap_mode='r')로 바로 매핑 가능).
+    키는 파일 내용(크기 + 앞/뒤 SAMPLE_BYTES 해시)이라 파일을 옮기거나 이름을 바꿔도 적중하며,
+    디코딩 단계별('fast' = half_size, 'full' = 원본 품질)로 따로 저장합니다.
+    파일은 디코더 프로세스가 결과를 보낸 뒤 임시 파일 → os.replace로 기록하고, 부모는 record()로 색인에 반영합니다.
+    byte_budget(여유 디스크 공간의 1/4 이내)을 넘으면 가장 오래 쓰지 않은 파일부터 지우며,
+    적중 시 파일 수정 시각을 갱신하므로 재시작 후에도 LRU 순서가 유지됩니다.
+    """
+    DIR_NAME = "raw_frames"  # 사용자별 캐시 폴더(QStandardPaths.CacheLocation) 아래 하위 폴더
+    SAMPLE_BYTES = 64 * 1024
+
+    def __init__(self, directory, byte_budget):
+        self.directory = Path(directory)
+        self.byte_budget = byte_budget
+        self._lock = threading.Lock()
+        self._index = None  # 파일명 -> 바이트 수 (LRU 순서, 처음 사용할 때 폴더를 읽어 구성)
+        self._total = 0
+
+    def _ensure_index(self):
+        """캐시 폴더를 읽어 색인 구성 (락 보유 상태에서 호출)"""
+        if self._index is not None:
+            return
+        self._index = OrderedDict()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.npy'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+                elif entry.name.endswith('.tmp'):
+                    try:
+                        os.remove(entry.path)  # 기록 도중 중단된 임시 파일
+                    except OSError:
+                        pass
+            for _, name, size in sorted(entries):
+                self._index[name] = size
+                self._total += size
+            self.byte_budget = min(self.byte_budget, self._total + shutil.disk_usage(self.directory).free // 4)
+            logging.info(f"RAW 디스크 캐시 열림: {self.directory} ({len(self._index)}개, "
+                         f"{self._total / (1024 ** 3):.2f}GB / {self.byte_budget / (1024 ** 3):.1f}GB)")
+        except OSError as e:
+            logging.warning(f"RAW 디스크 캐시 폴더를 읽을 수 없음: {e}")
+
+    def content_key(self, file_path):
+        """파일 크기와 앞/뒤 SAMPLE_BYTES의 해시 (파일 전체를 읽지 않는 내용 기반 키)"""
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+            digest.update(f.read(self.SAMPLE_BYTES))
+            if size > self.SAMPLE_BYTES:
+                f.seek(max(self.SAMPLE_BYTES, size - self.SAMPLE_BYTES))
+                digest.update(f.read(self.SAMPLE_BYTES))
+        return digest.hexdigest()
+
+    def stem(self, key):
+        """디코더 프로세스에 넘길 기록 경로 접두사 (프로세스가 f"{stem}_{tier}.npy"로 저장)"""
+        return str(self.directory / key)
+
+    def load(self, key, tier):
+        """캐시된 프레임 반환 (없거나 손상되었으면 None)"""
+        name = f"{key}_{tier}.npy"
+        with self._lock:
+            self._ensure_index()
+            if name not in self._index:
+                return None
+            self._index.move_to_end(name)
+        path = self.directory / name
+        try:
+            frame = np.load(path)
+            os.utime(path)
+        except FileNotFoundError:
+            self._remove([name])  # 다른 인스턴스가 정리한 파일
+            return None
+        except (OSError, ValueError) as e:
+            logging.warning(f"RAW 디스크 캐시 파일 손상, 삭제: {name} - {e}")
+            self._remove([name])
+            return None
+        if frame.dtype != np.uint8 or frame.ndim != 3:
+            self._remove([name])
+            return None
+        return frame
+
+    def record(self, path, nbytes):
+        """디코더 프로세스가 기록한 파일을 색인에 추가하고 예산을 넘으면 오래된 파일 삭제"""
+        name = Path(path).name
+        with self._lock:
+            self._ensure_index()
+            self._total += nbytes - self._index.pop(name, 0)
+            self._index[name] = nbytes
+            victims = []
+            while self._total > self.byte_budget and len(self._index) > 1:
+                victim, size = self._index.popitem(last=False)
+                self._total -= size
+                victims.append(victim)
+        if victims:
+            self._delete(victims)
+            logging.debug(f"RAW 디스크 캐시 정리: {len(victims)}개 삭제")
+
+    def _remove(self, names):
+        with self._lock:
+            for name in names:
+                self._total -= self._index.pop(name, 0)
+        self._delete(names)
+
+    def _delete(self, names):
+        for name in names:
+            try:
+                os.remove(self.directory / name)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.debug(f"RAW 디스크 캐시 파일 삭제 실패: {name} - {e}")  # 다른 프로세스가 열고 있는 경우 등
+
+class RawResultNotifier(QObject):
+    """RAW 디코딩 결과 도착 알림 (수신 스레드에서 emit하면 GUI 스레드의 슬롯이 큐 연결로 호출됨)"""
+    resultsReady = Signal()
+
 class RawDecoderPool:
-    """RAW 디코더 프로세스 풀"""
-    def __init__(self, num_processes=None):
+    """
+    RAW 디코더 프로세스 풀 (부모 쪽 스케줄러).
+    요청은 부모 쪽 우선순위 힙에 쌓이고, 쉬는 디코더 프로세스가 있을 때만 입력 큐로 내보냅니다.
+    입력 큐에는 곧 실행될 작업만 있으므로 대기 작업의 재정렬/취소는 힙에서 처리합니다.
+    - 중복 제거: 같은 (경로, 단계) 요청은 기존 작업에 콜백만 붙입니다 (원본 품질 작업은 빠른 단계 요청도 만족).
+    - 취소: 같은 group으로 새 요청이 오면 그 그룹의 다른 경로 대기 작업은 지나간 탐색 대상이므로 취소합니다.
+    - 입장 제어: 메모리가 부족하면 디코더 프로세스를 막지 않고 힙에서 대기시키며 한 번에 하나씩만 내보냅니다.
+    - 지연 시작: 프로세스는 첫 요청 때 하나만 띄우고, 실행 중인 작업이 프로세스 수보다 많을 때 최대
+      max_processes까지 늘립니다. idle_timeout초 동안 작업이 없는 프로세스는 스스로 종료해 메모리를 돌려줍니다.
+    디코딩 결과 픽셀은 SharedMemorySlabPool의 슬랩으로 받고 큐로는 슬랩 이름과 형태만 오갑니다.
+    콜백에는 result['data']로 슬랩 memoryview가 전달되며 콜백이 끝나면 슬랩이 반납되므로,
+    결과를 보관하려면 콜백 안에서 복사해야 합니다.
+    결과는 수신 스레드가 출력 큐에서 바로 받아 두고, 비어 있던 수신함에 결과가 들어올 때만
+    notifier.resultsReady를 emit해 GUI 이벤트 루프를 깨웁니다 (주기적 폴링 없음).
+    수신 스레드는 감독자 역할도 합니다: 죽었거나 하트비트/진행이 멈춘 프로세스를 정리하고, 처리 중이던 작업은
+    한 번 재시도하며, 디코더를 QUARANTINE_CRASHES번 중단시킨 파일은 격리해 이후 요청을 바로 실패 처리합니다.
+    disk_cache(RawFrameDiskCache)를 주면 새 작업은 먼저 캐시 조회 스레드에서 디스크 캐시를 확인하고('probing'),
+    적중하면 프로세스에 보내지 않고 바로 결과를 전달합니다. 놓치면 디코더 프로세스가 디코딩 후 캐시에 기록합니다.
+    """
+
+    SLAB_BYTES = 144 * 1024 * 1024  # 45MP RGB888 프레임(약 136MB)까지 수용, 더 큰 결과가 오면 자동 확장
+    ADMISSION_MEMORY_PERCENT = 95    # 메모리 사용률이 이 이상이면 실행 중인 작업이 끝날 때까지 새 작업을 보류
+    MEMORY_CHECK_INTERVAL = 1.0      # 메모리 사용률 확인 간격 (초)
+    DEFAULT_IDLE_TIMEOUT = 60.0      # 작업 없는 디코더 프로세스가 종료되기까지의 시간 (초)
+    HEARTBEAT_INTERVAL = 2.0         # 디코더 프로세스 하트비트 간격 (초)
+    HEARTBEAT_TIMEOUT = 15.0         # 이 시간 동안 하트비트가 없으면 멈춘 것으로 보고 강제 종료
+    TASK_TIMEOUT = 180.0             # 한 파일 디코딩이 이보다 오래 걸리면 멈춘 것으로 보고 강제 종료
+    SUPERVISE_INTERVAL = 1.0         # 감독 주기 (초)
+    QUARANTINE_CRASHES = 2           # 디코더를 이 횟수만큼 중단시킨 파일은 격리
+    STARTUP_CRASH_LIMIT = 5          # 작업을 받기 전에 연속으로 이만큼 비정상 종료하면 RAW 디코딩 중지
+    RESTART_BACKOFF = 1.0            # 시작 직후 비정상 종료한 뒤 다시 띄우기까지의 대기 시간 (연속 종료마다 2배, 최대 30초)
+
+    def __init__(self, num_processes=None, idle_timeout=None, disk_cache=None):
         if num_processes is None:
         # 코어 수에 비례하되 상한선 설정
             available_cores = cpu_count()
             num_processes = min(2, max(1, available_cores // 4))
             # 8코어: 2개, 16코어: 4개, 32코어: 8개로 제한
             
-        logging.info(f"RawDecoderPool 초기화: {num_processes}개 프로세스")
-        self.input_queue = Queue()
-        self.output_queue = Queue()
-        self.processes = []
-        
-        # 디코더 프로세스 시작
-        for i in range(num_processes):
-            p = Process(
+        self.max_processes = max(1, num_processes)
+        self.idle_timeout = idle_timeout or self.DEFAULT_IDLE_TIMEOUT
+        logging.info(f"RawDecoderPool 초기화: 최대 {self.max_processes}개 프로세스 (첫 요청 시 시작, {self.idle_timeout:.0f}초 유휴 시 종료)")
+        self._context = decoder_process_context()
+        self.input_queue = self._context.Queue()
+        self.output_queue = self._context.Queue()
+        # 프로세스당 디코딩 중 1개 + GUI 처리 대기 1개 (많아도 여분 4개까지만)
+        self.slabs = SharedMemorySlabPool(min(num_processes * 2, num_processes + 4), self.SLAB_BYTES)
+        self.workers = {}  # 슬롯 -> 실행 중인 디코더 프로세스 (필요할 때 _ensure_workers가 시작)
+        # 슬롯별 공유 상태 (프로세스가 쓰고 감독자가 읽음): 마지막 하트비트 시각, 처리 중인 task_id (-1이면 대기)
+        self._heartbeats = self._context.Array('d', self.max_processes, lock=False)
+        self._current_tasks = self._context.Array('l', [-1] * self.max_processes, lock=False)
+        self._task_seen = {}     # 슬롯 -> (task_id, 감독자가 처음 본 시각)
+        self._crash_counts = {}  # 파일 경로 -> 디코더 중단 횟수
+        self.quarantined = set()  # 디코더를 반복해서 중단시켜 격리된 파일 경로
+        self._fatal_error = None  # 디코더 프로세스를 시작할 수 없는 경우 (예: rawpy 로드 실패)
+        self._startup_crashes = 0  # 작업을 받기 전에 연속으로 비정상 종료한 횟수 (작업 처리가 확인되면 0)
+        self._restart_after = 0.0  # 이 시각(time.monotonic) 전에는 프로세스를 다시 띄우지 않음
+        self.disk_cache = disk_cache
+        self._probe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RawDiskCache") if disk_cache else None
+        
+        self._lock = threading.RLock()  # decode_raw는 이미징 스레드, process_results는 GUI 스레드에서 호출됨
+        self.next_task_id = 0
+        self.tasks = {}       # task_id -> 작업 dict (대기 + 실행 중)
+        self._by_key = {}     # (경로, 'fit' 또는 'full') -> 작업 dict (중복 제거용)
+        self._heap = []       # [우선순위, 순번, 작업 dict] (우선순위가 바뀐 이전 항목은 꺼낼 때 건너뜀)
+        self._seq = 0
+        self._dispatched = 0  # 입력 큐로 내보낸(실행 중인) 작업 수
+        self._memory_checked_at = 0.0
+        self._memory_pressure = False
+        self._running = True
+
+        # 결과 수신 스레드: 출력 큐에서 결과를 받아 수신함에 넣고 GUI 스레드에 알림
+        self.notifier = RawResultNotifier()
+        self._results = deque()
+        self._listener = threading.Thread(target=self._listen, name="RawResultListener", daemon=True)
+        self._listener.start()
+
+    def _listen(self):
+        """
+        출력 큐 대기 (수신 전용 스레드). 수신함이 비어 있다가 결과가 들어올 때만 알림을 보내며,
+        SUPERVISE_INTERVAL마다 디코더 프로세스 상태를 점검합니다.
+        """
+        next_check = time.monotonic() + self.SUPERVISE_INTERVAL
+        while True:
+            try:
+                result = self.output_queue.get(timeout=self.SUPERVISE_INTERVAL)
+            except queue.Empty:
+                result = False
+            except (EOFError, OSError):
+                break
+            if result is None:  # 종료 신호
+                break
+            if result and 'worker_exit' in result:
+                self._on_worker_exit(result['worker_exit'], result.get('error'))
+            elif result and 'disk_cached' in result:
+                if self.disk_cache is not None:
+                    self.disk_cache.record(result['disk_cached'], result['bytes'])
+            elif result:
+                self._deliver([result])
+            if time.monotonic() >= next_check:
+                self._supervise()
+                next_check = time.monotonic() + self.SUPERVISE_INTERVAL
+
+    def _deliver(self, results):
+        """결과를 수신함에 넣고 비어 있었으면 GUI 스레드에 알림"""
+        with self._lock:
+            notify = not self._results
+            self._results.extend(results)
+        if notify and results:
+            self.notifier.resultsReady.emit()
+
+    def _ensure_workers(self):
+        """실행 중인(입력 큐로 내보낸) 작업 수만큼 프로세스를 최대 max_processes까지 시작 (락 보유 상태에서 호출)"""
+        if time.monotonic() < self._restart_after:
+            return  # 시작 직후 비정상 종료 후 대기 중 (감독 주기마다 다시 확인)
+        while len(self.workers) < min(self.max_processes, self._dispatched) and self._fatal_error is None:
+            slot = next(i for i in range(self.max_processes) if i not in self.workers)
+            self._heartbeats[slot] = time.time()  # 시작(import) 시간 동안은 시작 시각을 하트비트로 간주
+            self._current_tasks[slot] = -1
+            p = self._context.Process(
                 target=decode_raw_in_process, 
-                args=(self.input_queue, self.output_queue),
+                args=(self.input_queue, self.output_queue, self.idle_timeout,
+                      slot, self._heartbeats, self._current_tasks),
                 daemon=True  # 메인 프로세스가 종료하면 함께 종료
             )
             p.start()
-            logging.info(f"RAW 디코더 프로세스 #{i+1} 시작됨 (PID: {p.pid})")
-            self.processes.append(p)
-        
-        self.next_task_id = 0
-        self.tasks = {}  # task_id -> callback
-        self._running = True
-    
-    def decode_raw(self, file_path, callback):
-        """RAW 디코딩 요청 (비동기)"""
-        if not self._running:
-            print("RawDecoderPool이 이미 종료됨")
+            self.workers[slot] = p
+            logging.info(f"RAW 디코더 프로세스 시작됨 (PID: {p.pid}, {len(self.workers)}/{self.max_processes})")
+
+    def _on_worker_exit(self, pid, error=None):
+        """
+        스스로 종료한 프로세스 정리 (수신 스레드). 유휴 종료이면 그사이 내보낸 작업을 처리할 프로세스를 띄우고,
+        시작 실패(error)이면 더 띄우지 않고 남은 작업을 모두 실패 처리합니다.
+        """
+        failed = []
+        with self._lock:
+            exited = [(slot, p) for slot, p in self.workers.items() if p.pid == pid]
+            for slot, _ in exited:
+                del self.workers[slot]
+            if error:
+                logging.error(f"RAW 디코더 프로세스를 시작할 수 없음: {error}")
+                failed = self._fail_all(error)
+            else:
+                logging.info(f"RAW 디코더 프로세스 유휴 종료 정리 (PID: {pid}, 남은 프로세스 {len(self.workers)}개)")
+                if self._running:
+                    self._ensure_workers()
+                if not self.workers and not any(task['state'] in ('probing', 'pending', 'running')
+                                                for task in self.tasks.values()):
+                    # 마지막 프로세스가 유휴 종료하면 빈 슬랩도 돌려줌 (다음 RAW 디코딩 때 다시 생성)
+                    freed = self.slabs.trim()
+                    if freed:
+                        logging.info(f"RAW 디코더 유휴: 공유 메모리 슬랩 {freed / (1024 * 1024):.0f}MB 해제")
+        # join은 락 밖에서 (종료 중인 프로세스가 큐를 비우는 동안 GUI 스레드의 decode_raw/process_results를 막지 않도록)
+        for _, p in exited:
+            p.join(1.0)
+        self._deliver(failed)
+
+    def _fail_all(self, error):
+        """디코더를 더 띄우지 않도록 중지하고 남은 작업의 실패 결과 목록 반환 (락 보유 상태에서 호출)"""
+        self._fatal_error = error
+        failed = []
+        for task in list(self.tasks.values()):
+            if task['state'] == 'failed':
+                continue  # 이미 실패 결과가 전달된 작업
+            if task['state'] in ('probing', 'pending'):
+                task['state'] = 'running'  # 결과 처리에서 정리되도록 실행 중으로 표시
+                self._dispatched += 1
+            failed.append(self._failure_result(task, error))
+        self._heap.clear()
+        return failed
+
+    @staticmethod
+    def _failure_result(task, error):
+        return {'task_id': task['id'], 'success': False, 'file_path': task['file_path'], 'error': error}
+
+    def _supervise(self):
+        """
+        죽었거나 멈춘 디코더 프로세스 정리 (수신 스레드). 처리 중이던 작업은 다른 프로세스에서 한 번 재시도하고,
+        같은 파일이 다시 디코더를 중단시키면 격리한 뒤 실패 결과를 전달합니다. 필요한 만큼 프로세스를 다시 띄웁니다.
+        """
+        failed, stopped = [], []
+        with self._lock:
+            if not self._running:
+                return
+            now = time.time()
+            for slot, p in list(self.workers.items()):
+                task_id = self._current_tasks[slot]
+                seen = self._task_seen.get(slot)
+                if task_id < 0:
+                    self._task_seen.pop(slot, None)
+                    seen = None
+                else:
+                    self._startup_crashes = 0  # 작업을 받았으므로 시작은 정상
+                    if seen is None or seen[0] != task_id:
+                        seen = self._task_seen[slot] = (task_id, now)
+
+                if not p.is_alive():
+                    if p.exitcode == 0 and task_id < 0:
+                        del self.workers[slot]  # 유휴 종료 (종료 알림이 곧 도착)
+                        continue
+                    reason = f"비정상 종료 (exit code {p.exitcode})"
+                elif now - self._heartbeats[slot] > self.HEARTBEAT_TIMEOUT:
+                    reason = f"하트비트 없음 ({now - self._heartbeats[slot]:.0f}초)"
+                elif seen is not None and now - seen[1] > self.TASK_TIMEOUT:
+                    reason = f"디코딩 시간 초과 ({now - seen[1]:.0f}초)"
+                else:
+                    continue
+
+                logging.warning(f"RAW 디코더 프로세스 #{slot} (PID: {p.pid}) {reason}: 정리 후 다시 시작")
+                if p.is_alive():
+                    p.terminate()
+                stopped.append(p)
+                del self.workers[slot]
+                self._task_seen.pop(slot, None)
+                self._current_tasks[slot] = -1
+                if task_id >= 0:
+                    result = self._recover_task(task_id)
+                    if result is not None:
+                        failed.append(result)
+                elif not p.is_alive() and self._fatal_error is None:
+                    # 작업을 받기 전에 종료: 파일 격리로는 잡히지 않으므로 풀 단위로 세어 간격을 늘리며 다시 띄움
+                    self._startup_crashes += 1
+                    if self._startup_crashes >= self.STARTUP_CRASH_LIMIT:
+                        error = LanguageManager.translate("RAW 디코더 프로세스가 시작 직후 반복해서 종료되어 RAW 디코딩을 중지합니다")
+                        logging.error(f"RAW 디코더 프로세스가 시작 직후 {self._startup_crashes}번 연속 종료: 재시작 중지")
+                        failed.extend(self._fail_all(error))
+                    else:
+                        self._restart_after = time.monotonic() + min(30.0, self.RESTART_BACKOFF * 2 ** (self._startup_crashes - 1))
+            self._dispatch()
+        for p in stopped:
+            p.join(1.0)  # 락 밖에서 (GUI 스레드의 decode_raw/process_results를 막지 않도록)
+        self._deliver(failed)
+
+    def _recover_task(self, task_id):
+        """중단된 프로세스가 처리하던 작업 복구 (락 보유 상태에서 호출). 재시도하면 None, 실패 처리하면 실패 결과 반환"""
+        task = self.tasks.get(task_id)
+        if task is None or task['state'] != 'running':
             return None
-        
-        task_id = self.next_task_id
-        self.next_task_id += 1
-        self.tasks[task_id] = callback
-        
-        print(f"RAW 디코딩 요청: {os.path.basename(file_path)} (task_id: {task_id})")
-        self.input_queue.put((file_path, task_id))
-        return task_id
+        file_path = task['file_path']
+        crashes = self._crash_counts[file_path] = self._crash_counts.get(file_path, 0) + 1
+        if crashes >= self.QUARANTINE_CRASHES:
+            self.quarantined.add(file_path)
+            logging.error(f"RAW 디코더를 {crashes}번 중단시킨 파일 격리: {os.path.basename(file_path)}")
+            return self._failure_result(task, LanguageManager.translate("디코더를 반복해서 중단시킨 파일이라 RAW 디코딩을 건너뜁니다"))
+        if not task['callbacks']:
+            return self._failure_result(task, LanguageManager.translate("RAW 디코더가 비정상 종료되었습니다"))
+        # 다른 프로세스에서 한 번 더 시도 (슬랩은 반납하고 다시 내보낼 때 새로 받음)
+        logging.info(f"중단된 RAW 디코딩 작업 재시도: {os.path.basename(file_path)}")
+        task['state'] = 'pending'
+        self._dispatched -= 1
+        if task['slab']:
+            self.slabs.release(task['slab'])
+            task['slab'] = None
+        self._push(task)
+        return None
+
+    @staticmethod
+    def _variant(fit_size):
+        return 'fit' if fit_size else 'full'
+
+    def _push(self, task):
+        self._seq += 1
+        heapq.heappush(self._heap, [task['priority'], self._seq, task])
+
+    def _find_shared(self, file_path, variant):
+        """요청을 만족하는 대기/실행 중 작업 조회. 원본 품질 요청은 아직 내보내지 않은 빠른 단계 작업을 원본 품질로 올려 재사용"""
+        task = self._by_key.get((file_path, variant))
+        if task is not None:
+            return task
+        if variant == 'fit':
+            return self._by_key.get((file_path, 'full'))
+        task = self._by_key.get((file_path, 'fit'))
+        if task is not None and task['state'] in ('probing', 'pending'):
+            del self._by_key[(file_path, 'fit')]
+            task['fit_size'] = None
+            self._by_key[(file_path, 'full')] = task
+            return task
+        return None
+
+    def decode_raw(self, file_path, callback, fit_size=None, priority='high', group=None):
+        """
+        RAW 디코딩 요청 (비동기). fit_size를 주면 그 크기에 충분한 빠른 단계(half_size)로 디코딩될 수 있음.
+        group을 주면 같은 그룹의 다른 경로 대기 작업을 취소합니다. 작업 ID 반환 (종료 후에는 None).
+        """
+        with self._lock:
+            if not self._running:
+                print("RawDecoderPool이 이미 종료됨")
+                return None
+            if group is not None:
+                self._cancel_group(group, keep_path=file_path)
+            if file_path in self.quarantined or self._fatal_error is not None:
+                # 격리된 파일이거나 디코더를 시작할 수 없으면 프로세스에 보내지 않고 바로 실패 결과 전달
+                task_id = self.next_task_id
+                self.next_task_id += 1
+                task = {
+                    'id': task_id, 'file_path': file_path, 'fit_size': fit_size, 'priority': 0,
+                    'group': None, 'callbacks': [callback], 'slab': None, 'state': 'failed',
+                }
+                self.tasks[task_id] = task
+                error = self._fatal_error or LanguageManager.translate("디코더를 반복해서 중단시킨 파일이라 RAW 디코딩을 건너뜁니다")
+                self._deliver([self._failure_result(task, error)])
+                return task_id
+            value = PriorityThreadPoolExecutor.priority_value(priority)
+            task = self._find_shared(file_path, self._variant(fit_size))
+            if task is not None:
+                task['callbacks'].append(callback)
+                if task['group'] != group:
+                    task['group'] = None  # 다른 요청자가 기다리면 그룹 취소 대상에서 제외
+                if task['state'] in ('probing', 'pending') and value < task['priority']:
+                    task['priority'] = value
+                    if task['state'] == 'pending':
+                        self._push(task)  # 조회 중인 작업은 캐시를 놓칠 때 바뀐 우선순위로 들어감
+                logging.debug(f"RAW 디코딩 요청 합류: {os.path.basename(file_path)} (task_id: {task['id']})")
+                return task['id']
+
+            task_id = self.next_task_id
+            self.next_task_id += 1
+            task = {
+                'id': task_id, 'file_path': file_path, 'fit_size': fit_size, 'priority': value,
+                'group': group, 'callbacks': [callback], 'slab': None, 'state': 'pending',
+            }
+            self.tasks[task_id] = task
+            self._by_key[(file_path, self._variant(fit_size))] = task
+            print(f"RAW 디코딩 요청: {os.path.basename(file_path)} (task_id: {task_id})")
+            if self._probe_executor is not None:
+                task['state'] = 'probing'
+                self._probe_executor.submit(self._probe_disk_cache, task)
+            else:
+                self._push(task)
+                self._dispatch()
+            return task_id
+
+    @staticmethod
+    def _fast_frame_enough(frame, fit_size):
+        """half_size 프레임이 fit_size 표시에 충분한지 (디코더 프로세스의 빠른 단계 판정과 같은 기준)"""
+        full_w, full_h = frame.shape[1] * 2, frame.shape[0] * 2
+        return bool(fit_size) and min(fit_size[0] / full_w, fit_size[1] / full_h) <= 0.6
+
+    def _probe_disk_cache(self, task):
+        """
+        디스크 캐시 확인 (캐시 조회 스레드). 적중하면 디코더 프로세스를 거치지 않고 결과를 전달하고,
+        놓치면 기록 위치를 붙여 대기열에 넣습니다. 조회 중 취소된 작업은 버립니다.
+        """
+        key = frame = tier = None
+        try:
+            key = self.disk_cache.content_key(task['file_path'])
+            with self._lock:
+                fit_size = task['fit_size']
+            for candidate in (('fast', 'full') if fit_size else ('full',)):
+                frame = self.disk_cache.load(key, candidate)
+                if frame is not None and (candidate == 'full' or self._fast_frame_enough(frame, fit_size)):
+                    tier = candidate
+                    break
+                frame = None
+        except Exception as e:
+            logging.debug(f"RAW 디스크 캐시 조회 실패: {os.path.basename(task['file_path'])} - {e}")
+            frame = None
+
+        with self._lock:
+            if task['state'] != 'probing' or not self._running:
+                return
+            if frame is not None and tier == 'fast' and not task['fit_size']:
+                frame = None  # 조회 중 원본 품질 요청으로 올라간 작업
+            if frame is None:
+                task['cache_stem'] = self.disk_cache.stem(key) if key else None
+                task['state'] = 'pending'
+                self._push(task)
+                self._dispatch()
+                return
+            task['state'] = 'cached'
+        height, width = frame.shape[:2]
+        logging.debug(f"RAW 디스크 캐시 적중: {os.path.basename(task['file_path'])} ({tier}, {width}x{height})")
+        self._deliver([{
+            'task_id': task['id'], 'success': True, 'file_path': task['file_path'],
+            'width': width, 'height': height, 'shape': frame.shape, 'dtype': str(frame.dtype),
+            'nbytes': frame.nbytes, 'in_slab': False, 'data': memoryview(frame.reshape(-1)),
+            'tier': tier, 'reduced_from': (width * 2, height * 2) if tier == 'fast' else None,
+            'from_disk_cache': True,
+        }])
+
+    def _admit(self):
+        """입장 제어: 메모리 부족 시 실행 중인 작업이 있으면 새 작업을 내보내지 않음"""
+        now = time.monotonic()
+        if now - self._memory_checked_at >= self.MEMORY_CHECK_INTERVAL:
+            self._memory_checked_at = now
+            try:
+                pressure = psutil.virtual_memory().percent >= self.ADMISSION_MEMORY_PERCENT
+            except Exception:
+                pressure = False
+            if pressure and not self._memory_pressure:
+                logging.warning("심각한 메모리 부족: RAW 디코딩 작업을 한 번에 하나씩만 실행")
+            self._memory_pressure = pressure
+        return not self._memory_pressure or self._dispatched == 0
+
+    def _dispatch(self):
+        """쉬는 디코더 프로세스 수만큼 우선순위가 가장 높은 대기 작업을 입력 큐로 내보냄 (락 보유 상태에서 호출)"""
+        while self._heap and self._dispatched < self.max_processes and self._admit():
+            value, _, task = heapq.heappop(self._heap)
+            if task['state'] != 'pending' or value != task['priority']:
+                continue  # 취소되었거나 우선순위가 바뀐 이전 항목
+            task['state'] = 'running'
+            task['slab'] = self.slabs.acquire()
+            task['attempt'] = task.get('attempt', 0) + 1  # 재시도 후 늦게 도착한 이전 시도 결과를 구분
+            self._dispatched += 1
+            self.input_queue.put((task['file_path'], task['id'], task['slab'], task['fit_size'], task.get('cache_stem'),
+                                  task['attempt']))
+        self._ensure_workers()
+
+    def _forget(self, task):
+        """작업을 추적 목록에서 제거 (락 보유 상태에서 호출)"""
+        self.tasks.pop(task['id'], None)
+        key = (task['file_path'], self._variant(task['fit_size']))
+        if self._by_key.get(key) is task:
+            del self._by_key[key]
+
+    def _cancel_group(self, group, keep_path=None):
+        """그룹의 대기 작업 중 keep_path가 아닌 작업 취소 (락 보유 상태에서 호출). 취소한 수 반환"""
+        stale = [task for task in self.tasks.values()
+                 if task['state'] in ('probing', 'pending') and task['group'] == group and task['file_path'] != keep_path]
+        for task in stale:
+            task['state'] = 'cancelled'
+            self._forget(task)
+        if stale:
+            logging.debug(f"RAW 디코딩 대기 작업 {len(stale)}개 취소 (그룹: {group})")
+        return len(stale)
+
+    def cancel_group(self, group):
+        """그룹의 모든 대기 작업 취소"""
+        with self._lock:
+            return self._cancel_group(group)
+
+    def pending_count(self):
+        with self._lock:
+            return sum(1 for task in self.tasks.values() if task['state'] in ('probing', 'pending'))
     
-    def process_results(self, max_results=5):
-        """완료된 결과 처리 (메인 스레드에서 주기적으로 호출)"""
+    def process_results(self, max_results=None):
+        """수신함에 도착한 결과 처리 (GUI 스레드에서 resultsReady에 연결해 호출). max_results가 None이면 모두 처리"""
         if not self._running:
             return 0
             
         processed = 0
-        while processed < max_results:
+        while max_results is None or processed < max_results:
             try:
-                # non-blocking 확인
-                if self.output_queue.empty():
-                    break
-                    
-                result = self.output_queue.get_nowait()
+                with self._lock:
+                    if not self._results:
+                        break
+                    result = self._results.popleft()
                 task_id = result['task_id']
+                with self._lock:
+                    task = self.tasks.get(task_id)
+                    if task is not None and 'attempt' in result and (
+                            task['state'] != 'running' or result['attempt'] != task.get('attempt')):
+                        # 시간 초과로 강제 종료된 뒤 재시도 중인 작업의 이전 시도 결과: 슬랩은 이미 반납되었으므로 버림
+                        logging.debug(f"RAW 디코딩 이전 시도 결과 무시: {os.path.basename(task['file_path'])} (task_id: {task_id})")
+                        processed += 1
+                        continue
+                    if task is not None:
+                        self._forget(task)
+                        if task['state'] == 'running':
+                            self._dispatched -= 1
+                    if 'attempt' in result:
+                        self._startup_crashes = 0  # 디코더 프로세스가 작업을 끝냈으므로 시작은 정상
                 
-                if task_id in self.tasks:
-                    callback = self.tasks.pop(task_id)
-                    # 성공 여부와 관계없이 콜백 호출
-                    callback(result)
+                if task is not None:
+                    slab_name = task['slab']
+                    view = None
+                    try:
+                        if result.get('in_slab'):
+                            view = self.slabs.buffer(slab_name)[:result['nbytes']]
+                            result['data'] = view
+                        # 성공 여부와 관계없이 콜백 호출 (취소된 작업은 슬랩만 반납)
+                        for callback in task['callbacks']:
+                            callback(result)
+                    finally:
+                        result.pop('data', None)
+                        if view is not None:
+                            try:
+                                view.release()
+                            except BufferError:
+                                pass  # 콜백이 만든 래퍼가 아직 남아 있으면 GC에 맡김
+                        if slab_name:
+                            # 슬랩이 작아 큐로 받은 경우 다음 작업부터 담기도록 키움
+                            self.slabs.release(slab_name, 0 if result.get('in_slab') else result.get('nbytes', 0))
                 else:
                     logging.warning(f"경고: task_id {task_id}에 대한 콜백을 찾을 수 없음")
                 
@@ -2238,7 +3748,14 @@ class RawDecoderPool:
             except Exception as e:
                 logging.error(f"결과 처리 중 오류: {e}")
                 break
-                
+
+        # 끝난 작업 자리에 대기 작업 투입 (메모리 부족으로 보류된 작업도 여기서 다시 확인)
+        with self._lock:
+            if self._running:
+                self._dispatch()
+            leftover = bool(self._results)
+        if leftover:
+            self.notifier.resultsReady.emit()  # max_results로 남긴 결과는 다음 이벤트 루프에서 이어서 처리
         return processed
     
     def shutdown(self):
@@ -2248,23 +3765,54 @@ class RawDecoderPool:
             return
             
         print("RawDecoderPool 종료 중...")
-        self._running = False
+        with self._lock:
+            self._running = False
+            self._heap.clear()
+            processes = list(self.workers.values())
+            self.workers.clear()
         
         # 모든 프로세스에 종료 신호 전송
-        for _ in range(len(self.processes)):
+        for _ in range(len(processes)):
             self.input_queue.put(None)
         
         # 프로세스 종료 대기
-        for i, p in enumerate(self.processes):
+        for i, p in enumerate(processes):
             p.join(0.5)  # 각 프로세스별로 최대 0.5초 대기
             if p.is_alive():
                 logging.info(f"프로세스 #{i+1} (PID: {p.pid})이 응답하지 않아 강제 종료")
                 p.terminate()
                 
-        self.processes.clear()
-        self.tasks.clear()
+        self.output_queue.put(None)  # 수신 스레드 종료
+        self._listener.join(1.0)
+        if self._probe_executor is not None:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._results.clear()
+            for task in self.tasks.values():
+                if task['slab']:
+                    self.slabs.release(task['slab'])
+            self.tasks.clear()
+            self._by_key.clear()
+        self.slabs.close()
         logging.info("RawDecoderPool 종료 완료")
 
+    def cancel_all(self):
+        """
+        대기 중인 작업을 모두 취소합니다. 이미 디코딩 중인 작업은 결과가 도착하면
+        콜백 없이 슬랩만 반납되도록 콜백을 비웁니다.
+        """
+        with self._lock:
+            for task in list(self.tasks.values()):
+                task['callbacks'] = []
+                if task['state'] in ('probing', 'pending'):
+                    task['state'] = 'cancelled'
+                    self._forget(task)
+                else:
+                    key = (task['file_path'], self._variant(task['fit_size']))
+                    if self._by_key.get(key) is task:
+                        del self._by_key[key]  # 새 요청이 취소된 실행 중 작업에 합류하지 않도록
+            self._heap.clear()
+
 class ResourceManager:
     """스레드 풀과 프로세스 풀을 통합 관리하는 싱글톤 클래스"""
     _instance = None
@@ -2285,19 +3833,39 @@ class ResourceManager:
         HardwareProfileManager.initialize() # 앱의 이 시점에서 초기화
         max_imaging_threads = HardwareProfileManager.get("max_imaging_threads")
         raw_processes = HardwareProfileManager.get("max_raw_processes")
+        decode_processes = HardwareProfileManager.get("image_decode_processes") or 0
+
+        # 일반 이미지 프로세스 디코딩 엔진 (워크스테이션 프로필). 이미징 스레드는 결과를 기다리는 동안 GIL을 놓으므로
+        # 디코더 프로세스 수(물리 코어 비례)만큼 스레드를 늘리고, 썸네일/RAW 미리보기용으로 2개를 더 둡니다.
+        self.image_decode_pool = None
+        if decode_processes > 0:
+            try:
+                self.image_decode_pool = ImageDecodeProcessPool(decode_processes)
+                max_imaging_threads = max(max_imaging_threads, decode_processes + 2)
+            except Exception as e:
+                logging.warning(f"이미지 디코더 프로세스 풀 시작 실패, 스레드 디코딩 사용: {e}")
+                decode_processes = 0
 
         # 통합 이미징 스레드 풀
         self.imaging_thread_pool = PriorityThreadPoolExecutor(
             max_workers=max_imaging_threads,
             thread_name_prefix="Imaging"
         )
-        # RAW 디코더 프로세스 풀
-        self.raw_decoder_pool = RawDecoderPool(num_processes=raw_processes)
+        # RAW 디코더 프로세스 풀 (프로세스는 첫 RAW 디코딩 요청 때 시작하고, 유휴 시 종료)
+        # 디코딩 결과는 사용자별 캐시 폴더의 디스크 캐시에 남겨 다시 열 때 디코더 프로세스를 거치지 않음 (예산 0이면 끔)
+        # 앱 폴더는 쓰기 권한이 없을 수 있고 macOS에서는 서명된 앱 번들을 변경하게 되므로 쓰지 않음
+        raw_disk_cache = None
+        raw_cache_gb = HardwareProfileManager.get("raw_disk_cache_gb") or 0
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        if raw_cache_gb > 0 and cache_root:
+            raw_disk_cache = RawFrameDiskCache(Path(cache_root) / RawFrameDiskCache.DIR_NAME, int(raw_cache_gb * 1024 ** 3))
+        self.raw_decoder_pool = RawDecoderPool(num_processes=raw_processes,
+                                               idle_timeout=HardwareProfileManager.get("raw_decoder_idle_seconds"),
+                                               disk_cache=raw_disk_cache)
         
         self.active_tasks = set()
-        self.pending_tasks = {}
         self._running = True
-        logging.info(f"ResourceManager 초기화 ({HardwareProfileManager.get_current_profile_name()}): 이미징 스레드 {max_imaging_threads}개, RAW 디코더 프로세스 {raw_processes}개")
+        logging.info(f"ResourceManager 초기화 ({HardwareProfileManager.get_current_profile_name()}): 이미징 스레드 {max_imaging_threads}개, RAW 디코더 프로세스 최대 {raw_processes}개, 이미지 디코더 프로세스 {decode_processes}개")
         
         # 작업 모니터링 타이머 (이 부분은 유지)
         self.monitor_timer = QTimer()
@@ -2327,32 +3895,26 @@ class ResourceManager:
 
     def cancel_low_priority_tasks(self):
         """우선순위가 낮은 작업 취소"""
-        # low 우선순위 작업 전체 취소
-        if 'low' in self.pending_tasks:
-            for task in list(self.pending_tasks['low']):
-                task.cancel()
-            self.pending_tasks['low'] = []
-            
-        # 필요시 medium 우선순위 작업 일부 취소 (최대 절반)
-        if 'medium' in self.pending_tasks and len(self.pending_tasks['medium']) > 4:
-            # 절반만 유지
-            keep = len(self.pending_tasks['medium']) // 2
-            to_cancel = self.pending_tasks['medium'][keep:]
-            self.pending_tasks['medium'] = self.pending_tasks['medium'][:keep]
-            
-            for task in to_cancel:
-                task.cancel()
+        # 대기 중인 low 우선순위(및 뒤로 미뤄진) 작업 전체 취소
+        cancelled = self.imaging_thread_pool.cancel_pending('low')
+        logging.info(f"ResourceManager: 대기 중인 낮은 우선순위 작업 {cancelled}개 취소")
 
+    def advance_imaging_generation(self, group, stale_policy='cancel'):
+        """작업 그룹의 세대를 올려 이전 세대의 대기 작업을 한 번에 무효화 (O(1), 갱신된 작업은 유지)"""
+        return self.imaging_thread_pool.advance_generation(group, stale_policy)
     
-    def submit_imaging_task_with_priority(self, priority, fn, *args, **kwargs):
-        """이미지 처리 작업을 우선순위와 함께 제출"""
+    def submit_imaging_task_with_priority(self, priority, fn, *args, task_group=None, **kwargs):
+        """
+        이미지 처리 작업을 우선순위와 함께 제출하고 ImagingTask 핸들을 반환합니다.
+        task_group을 주면 advance_imaging_generation으로 묶어서 무효화할 수 있습니다.
+        """
         if not self._running:
             return None
             
         # 우선순위 스레드 풀에 작업 제출
         if isinstance(self.imaging_thread_pool, PriorityThreadPoolExecutor):
             
-            future = self.imaging_thread_pool.submit_with_priority(priority, fn, *args, **kwargs)
+            future = self.imaging_thread_pool.submit_task(priority, fn, args, kwargs, group=task_group)
             if future: # 반환된 future가 유효한지 확인 (선택적이지만 안전함)
                 self.active_tasks.add(future)
                 future.add_done_callback(lambda f: self.active_tasks.discard(f))
@@ -2373,14 +3935,17 @@ class ResourceManager:
         future.add_done_callback(lambda f: self.active_tasks.discard(f))
         return future
     
-    def submit_raw_decoding(self, file_path, callback):
-        """RAW 디코딩 작업 제출"""
+    def submit_raw_decoding(self, file_path, callback, fit_size=None, priority='high', task_group=None):
+        """
+        RAW 디코딩 작업 제출 (fit_size: 빠른 단계 디코딩 기준 크기, None이면 원본 품질).
+        task_group을 주면 같은 그룹의 다른 파일 대기 작업은 취소됩니다.
+        """
         if not self._running:
             return None
-        return self.raw_decoder_pool.decode_raw(file_path, callback)
+        return self.raw_decoder_pool.decode_raw(file_path, callback, fit_size, priority, task_group)
     
-    def process_raw_results(self, max_results=5):
-        """RAW 디코딩 결과 처리"""
+    def process_raw_results(self, max_results=None):
+        """RAW 디코딩 결과 처리 (max_results가 None이면 도착한 결과를 모두 처리)"""
         if not self._running:
             return 0
         return self.raw_decoder_pool.process_results(max_results)
@@ -2394,25 +3959,10 @@ class ResourceManager:
             future.cancel()
         self.active_tasks.clear()
         
-        # 2. RAW 디코더 풀 작업 취소 (input_queue 비우기 추가)
+        # 2. RAW 디코더 풀 작업 취소 (입력/출력 큐를 비우고 슬랩 반납)
         if hasattr(self, 'raw_decoder_pool') and self.raw_decoder_pool:
             try:
-                # 입력 큐 비우기 시도 (가능한 경우)
-                while not self.raw_decoder_pool.input_queue.empty():
-                    try:
-                        self.raw_decoder_pool.input_queue.get_nowait()
-                    except:
-                        break
-                
-                # 출력 큐 비우기 시도 (가능한 경우)
-                while not self.raw_decoder_pool.output_queue.empty():
-                    try:
-                        self.raw_decoder_pool.output_queue.get_nowait()
-                    except:
-                        break
-                        
-                # 작업 추적 정보 비우기
-                self.raw_decoder_pool.tasks.clear()
+                self.raw_decoder_pool.cancel_all()
                 print("RAW 디코더 작업 큐 및 작업 추적 정보 초기화됨")
             except Exception as e:
                 logging.error(f"RAW 디코더 풀 작업 취소 중 오류: {e}")
@@ -2430,6 +3980,10 @@ class ResourceManager:
         # 활성 작업 취소 (기존 로직 유지)
         self.cancel_all_tasks() 
         
+        # 이미지 디코더 프로세스 풀 먼저 종료 (결과를 기다리던 이미징 스레드가 바로 풀려나도록)
+        if self.image_decode_pool is not None:
+            self.image_decode_pool.shutdown()
+
         # 스레드 풀 종료
         logging.info("ResourceManager: 이미징 스레드 풀 종료 시도 (wait=True)...")
         self.imaging_thread_pool.shutdown(wait=True, cancel_futures=True)
@@ -2440,6 +3994,170 @@ class ResourceManager:
         
         print("ResourceManager: 리소스 종료 완료")
 
+class ImageFileTable:
+    """이미지 파일 목록을 위한 압축 테이블 (list[Path] 호환 시퀀스)
+
+    폴더 경로(구분자 포함 접두사)는 ID로 인터닝하고, 행마다 폴더 ID 배열 + 파일명만 보관합니다.
+    str 키와 Path 객체는 조회할 때 접두사 + 파일명으로 만들며, 역색인도 폴더 ID별 {파일명: 행}이라
+    경로 문자열을 따로 들고 있지 않습니다.
+    중간 삽입/삭제는 역색인을 그 행부터만 무효로 표시하고, 다음 조회 때 무효 구간만 다시 계산합니다.
+    PhotoSortApp, ThumbnailModel, 그리드 페이징, Undo가 같은 인스턴스를 공유합니다.
+    """
+
+    __slots__ = ('_dirs', '_dir_ids_by_path', '_dir_ids', '_names', '_rows', '_stale_from')
+
+    def __init__(self, paths=()):
+        self._dirs = []                 # 폴더 ID → 폴더 접두사 (접두사 + 파일명 = 원래 str 경로)
+        self._dir_ids_by_path = {}      # 폴더 접두사 → 폴더 ID
+        self._dir_ids = array('I')      # 행 → 폴더 ID
+        self._names = []                # 행 → 파일명
+        self._rows = {}                 # 폴더 ID → {파일명: 행} 역색인 (파일명 문자열은 _names와 공유)
+        self._stale_from = None         # 이 행부터는 역색인의 행 번호가 낡았을 수 있음 (None이면 최신)
+        self.extend(paths)
+
+    def _split(self, path):
+        """경로를 (폴더 ID, 파일명)으로 분해 (폴더 접두사는 인터닝)"""
+        key = os.fspath(path)
+        name = os.path.basename(key)
+        prefix = key[:len(key) - len(name)]
+        dir_id = self._dir_ids_by_path.get(prefix)
+        if dir_id is None:
+            dir_id = len(self._dirs)
+            self._dirs.append(prefix)
+            self._dir_ids_by_path[prefix] = dir_id
+        return dir_id, name
+
+    def _mark_stale(self, row):
+        if self._stale_from is None or row < self._stale_from:
+            self._stale_from = row
+
+    def _refresh_index(self):
+        """낡은 구간의 역색인 갱신 (중복 키는 list.index처럼 첫 번째 행)"""
+        start = self._stale_from
+        if start is None:
+            return
+        self._stale_from = None
+        dir_ids, names, rows = self._dir_ids, self._names, self._rows
+        for row in range(len(names) - 1, start - 1, -1):
+            by_name = rows.get(dir_ids[row])
+            if by_name is None:
+                by_name = rows[dir_ids[row]] = {}
+            current = by_name.get(names[row])
+            if current is None or current >= start:
+                by_name[names[row]] = row
+
+    # --- 조회 ---
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Path(self.key(row)) for row in range(*index.indices(len(self._names)))]
+        return Path(self.key(index))
+
+    def __iter__(self):
+        for key in self.iter_keys():
+            yield Path(key)
+
+    def __contains__(self, path):
+        return self.index_of(path) >= 0
+
+    def __eq__(self, other):
+        if isinstance(other, ImageFileTable):
+            return list(self.iter_keys()) == list(other.iter_keys())
+        try:
+            return list(self.iter_keys()) == [os.fspath(path) for path in other]
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ImageFileTable({len(self._names)} files, {len(self._dirs)} folders)"
+
+    def key(self, row):
+        """행의 str 경로 (Path 생성 없이)"""
+        return self._dirs[self._dir_ids[row]] + self._names[row]
+
+    def name(self, row):
+        """행의 파일명"""
+        return self._names[row]
+
+    def folder(self, row):
+        """행의 폴더 경로 문자열"""
+        return os.path.dirname(self.key(row))
+
+    def iter_keys(self):
+        """모든 행의 str 경로를 순서대로 반환"""
+        dirs = self._dirs
+        return (dirs[dir_id] + name for dir_id, name in zip(self._dir_ids, self._names))
+
+    def index_of(self, path):
+        """경로의 행 번호 조회 (역색인, 없으면 -1)"""
+        try:
+            key = os.fspath(path)
+        except TypeError:
+            return -1
+        name = os.path.basename(key)
+        dir_id = self._dir_ids_by_path.get(key[:len(key) - len(name)])
+        if dir_id is None:
+            return -1
+        self._refresh_index()
+        return self._rows.get(dir_id, {}).get(name, -1)
+
+    def index(self, path):
+        """list.index 호환 (없으면 ValueError)"""
+        row = self.index_of(path)
+        if row < 0:
+            raise ValueError(f"{path} is not in image file table")
+        return row
+
+    # --- 변경 ---
+    def append(self, path):
+        self.insert(len(self._names), path)
+
+    def extend(self, paths):
+        for path in paths:
+            self.append(path)
+
+    def insert(self, row, path):
+        dir_id, name = self._split(path)
+        if row < 0:
+            row = max(0, len(self._names) + row)
+        row = min(row, len(self._names))
+        self._dir_ids.insert(row, dir_id)
+        self._names.insert(row, name)
+        if row == len(self._names) - 1:
+            # 끝에 붙이는 경우는 바로 역색인에 추가 (기존 행 번호는 그대로)
+            self._rows.setdefault(dir_id, {}).setdefault(name, row)
+        else:
+            self._mark_stale(row)  # 뒤 행 번호가 모두 밀림
+
+    def pop(self, row=-1):
+        if row < 0:
+            row += len(self._names)
+        key = self.key(row)
+        dir_id = self._dir_ids.pop(row)
+        name = self._names.pop(row)
+        by_name = self._rows.get(dir_id)
+        current = by_name.get(name) if by_name else None
+        if current is not None and (current == row or (self._stale_from is not None and current >= self._stale_from)):
+            del by_name[name]  # 같은 키가 뒤에 또 있으면 갱신 때 다시 들어감
+        if row < len(self._names):
+            self._mark_stale(row)
+        return Path(key)
+
+    def remove(self, path):
+        self.pop(self.index(path))
+
+    def clear(self):
+        self._dirs.clear()
+        self._dir_ids_by_path.clear()
+        self._dir_ids = array('I')
+        self._names.clear()
+        self._rows = {}
+        self._stale_from = None
+
 class ThumbnailModel(QAbstractListModel):
     """썸네일 패널을 위한 가상화된 리스트 모델"""
     
@@ -2449,7 +4167,7 @@ class ThumbnailModel(QAbstractListModel):
     
     def __init__(self, image_files=None, image_loader=None, parent=None):
         super().__init__(parent)
-        self._image_files = image_files or []         # ← 첫 번째 버전과 동일하게 _image_files 사용
+        self._image_files = self._as_table(image_files)  # PhotoSortApp과 공유하는 ImageFileTable
         self.image_loader = image_loader              # ← 새로 추가
         self._current_index = -1                      # 현재 선택된 인덱스
         self._thumbnail_cache = {}                    # 썸네일 캐시 {파일경로: QPixmap}
@@ -2459,10 +4177,17 @@ class ThumbnailModel(QAbstractListModel):
         # ResourceManager 인스턴스 참조
         self.resource_manager = ResourceManager.instance()
         
+    @staticmethod
+    def _as_table(image_files):
+        """ImageFileTable은 그대로 공유하고, 일반 리스트는 테이블로 변환"""
+        if isinstance(image_files, ImageFileTable):
+            return image_files
+        return ImageFileTable(image_files or ())
+
     def set_image_files(self, image_files):
         """이미지 파일 목록 설정"""
         self.beginResetModel()
-        self._image_files = image_files or []
+        self._image_files = self._as_table(image_files)
         self._current_index = -1
         self._thumbnail_cache.clear()
         self._loading_set.clear()
@@ -2470,7 +4195,34 @@ class ThumbnailModel(QAbstractListModel):
         
         # 캐시에서 불필요한 항목 제거
         self._cleanup_cache()
-        
+
+    def insert_files(self, insertions):
+        """정렬된 위치에 파일을 행 단위로 삽입 (썸네일 캐시와 현재 선택 유지)
+        insertions: [(삽입 행, 파일 경로)] - 행 오름차순, 각 행은 앞선 삽입이 반영된 위치
+        """
+        for row, file_path in insertions:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._image_files.insert(row, file_path)
+            if 0 <= row <= self._current_index:
+                self._current_index += 1
+            self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """지정한 행들을 제거 (행 단위 remove 시그널, 남은 항목의 썸네일 캐시 유지)"""
+        for row in sorted(rows, reverse=True):
+            if not 0 <= row < len(self._image_files):
+                continue
+            self.beginRemoveRows(QModelIndex(), row, row)
+            removed_path = self._image_files.key(row)
+            self._image_files.pop(row)
+            self._thumbnail_cache.pop(removed_path, None)
+            self._loading_set.discard(removed_path)
+            if row < self._current_index:
+                self._current_index -= 1
+            elif row == self._current_index:
+                self._current_index = -1
+            self.endRemoveRows()
+
     def set_current_index(self, index):
         """현재 선택 인덱스 설정"""
         if 0 <= index < len(self._image_files) and index != self._current_index:
@@ -2504,18 +4256,19 @@ class ThumbnailModel(QAbstractListModel):
             return None
             
         row = index.row()
-        file_path = str(self._image_files[row])
+        file_path = self._image_files.key(row)
+        file_name = self._image_files.name(row)
         
         # 기본 호출 로그 추가
-        logging.debug(f"ThumbnailModel.data 호출: row={row}, role={role}, file={Path(file_path).name}")
+        logging.debug(f"ThumbnailModel.data 호출: row={row}, role={role}, file={file_name}")
         
         if role == Qt.DisplayRole:
             # 파일명만 반환
-            return Path(file_path).name
+            return file_name
             
         elif role == Qt.DecorationRole:
             # 썸네일 이미지 반환
-            logging.debug(f"ThumbnailModel.data: Qt.DecorationRole 요청 - {Path(file_path).name}")
+            logging.debug(f"ThumbnailModel.data: Qt.DecorationRole 요청 - {file_name}")
             return self._get_thumbnail(file_path, row)
             
         elif role == Qt.UserRole:
@@ -2528,7 +4281,7 @@ class ThumbnailModel(QAbstractListModel):
             
         elif role == Qt.ToolTipRole:
             # 툴팁: 파일명 + 경로
-            return f"{Path(file_path).name}\n{file_path}"
+            return f"{file_name}\n{file_path}"
             
         return None
     
@@ -2586,12 +4339,11 @@ class ThumbnailModel(QAbstractListModel):
         # 로딩 상태에서 제거
         self._loading_set.discard(file_path)
         
-        # 해당 인덱스 찾아서 UI 업데이트
-        for i, image_file in enumerate(self._image_files):
-            if str(image_file) == file_path:
-                index = self.createIndex(i, 0)
-                self.dataChanged.emit(index, index, [Qt.DecorationRole])
-                break
+        # 해당 인덱스 찾아서 UI 업데이트 (테이블 역색인으로 O(1) 조회)
+        row = self._image_files.index_of(file_path)
+        if row >= 0:
+            index = self.createIndex(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
     
     def _cleanup_cache(self):
         """불필요한 캐시 항목 제거"""
@@ -2600,7 +4352,7 @@ class ThumbnailModel(QAbstractListModel):
             return
             
         # 현재 이미지 파일 목록에 없는 캐시 항목 제거
-        current_paths = {str(f) for f in self._image_files}
+        current_paths = set(self._image_files.iter_keys())
         cached_paths = set(self._thumbnail_cache.keys())
         
         for path in cached_paths - current_paths:
@@ -2615,22 +4367,652 @@ class ThumbnailModel(QAbstractListModel):
         """중심 인덱스 주변의 썸네일 미리 로딩"""
         if not self._image_files or center_index < 0:
             return
-            
-        start = max(0, center_index - radius)
-        end = min(len(self._image_files), center_index + radius + 1)
-        
-        for i in range(start, end):
-            file_path = str(self._image_files[i])
-            if (file_path not in self._thumbnail_cache and 
-                file_path not in self._loading_set):
-                self._loading_set.add(file_path)
-                self.thumbnailRequested.emit(file_path, i)
+            
+        start = max(0, center_index - radius)
+        end = min(len(self._image_files), center_index + radius + 1)
+        
+        for i in range(start, end):
+            file_path = self._image_files.key(i)
+            if (file_path not in self._thumbnail_cache and 
+                file_path not in self._loading_set):
+                self._loading_set.add(file_path)
+                self.thumbnailRequested.emit(file_path, i)
+
+class ImageConverter:
+    """
+    디코딩된 PIL/NumPy 버퍼를 QPixmap으로 바꾸는 변환 계층.
+    PIL transpose/convert 중간 이미지를 만들지 않고 미리 할당한 버퍼 하나에 픽셀을 한 번 기록한 뒤,
+    그 버퍼를 stride와 함께 QImage로 감쌉니다 (복사 없음). EXIF 방향은 QImage 단계에서 한 번의 변환으로 적용합니다.
+    stats 딕셔너리를 넘기면 변환 중 만들어진 네이티브 버퍼(PIL/QImage 중간 이미지)의 크기가 'native_bytes'에,
+    QPixmap 생성량이 'upload_bytes'에 누적됩니다. Python 힙 할당(tobytes, NumPy 복사)은 벤치마크가 tracemalloc으로 측정합니다.
+    """
+
+    # PIL 모드 → (tobytes rawmode, QImage 형식, 픽셀당 바이트). 여기에 없는 모드만 PIL convert를 거칩니다.
+    PIL_FORMATS = {
+        'RGB': ('RGB', QImage.Format_RGB888, 3),  # RGBX8888보다 버퍼가 1/4 작고 QPixmap 업로드(RGB32 변환)도 더 빠름
+        'RGBA': ('RGBA', QImage.Format_RGBA8888, 4),
+        'L': ('L', QImage.Format_Grayscale8, 1),
+    }
+    BENCHMARK_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tif', '.tiff', '.webp', '.heic', '.heif')
+    PACK_STRIP_BYTES = 1024 * 1024  # _pack이 한 번에 tobytes하는 가로 띠 크기
+
+    @staticmethod
+    def _count(stats, key, nbytes):
+        if stats is not None:
+            stats[key] = stats.get(key, 0) + nbytes
+
+    @staticmethod
+    def _pack(image, rawmode, bytes_per_pixel):
+        """
+        PIL 이미지를 미리 할당한 버퍼 하나에 rawmode로 기록합니다. 이미지 전체를 tobytes하면 조각을 모은 뒤 join하므로
+        변환 중 최대 사용량이 결과의 2배가 됩니다. 가로 띠(PACK_STRIP_BYTES 내외)로 잘라 tobytes한 뒤 버퍼에 복사하여
+        추가 사용량을 띠 하나 크기로 제한합니다.
+        """
+        image.load()
+        width, height = image.size
+        row_bytes = width * bytes_per_pixel
+        buffer = bytearray(row_bytes * height)
+        strip_rows = max(1, ImageConverter.PACK_STRIP_BYTES // max(1, row_bytes))
+        for top in range(0, height, strip_rows):
+            bottom = min(height, top + strip_rows)
+            buffer[top * row_bytes:bottom * row_bytes] = image.crop((0, top, width, bottom)).tobytes('raw', rawmode)
+        return buffer
+
+    @staticmethod
+    def _pil_storage_bytes(image):
+        """PIL 내부 저장 크기 (1/L/P는 픽셀당 1바이트, 나머지는 4바이트)"""
+        return image.width * image.height * (1 if image.mode in ('1', 'L', 'P') else 4)
+
+    @classmethod
+    def _apply_orientation(cls, qimage, orientation, stats=None):
+        """EXIF 방향을 QImage 변환 한 번으로 적용 (5/7은 회전 결과 버퍼에서 제자리 반전)"""
+        if orientation == 2:
+            result = qimage.mirrored(True, False)
+        elif orientation == 3:
+            result = qimage.mirrored(True, True)
+        elif orientation == 4:
+            result = qimage.mirrored(False, True)
+        elif orientation in (5, 6, 7, 8):
+            result = qimage.transformed(QTransform().rotate(270 if orientation == 8 else 90))
+            if orientation in (5, 7):
+                horizontal = orientation == 5
+                if hasattr(result, 'mirror'):
+                    result.mirror(horizontal, not horizontal)  # 회전 결과는 자체 버퍼이므로 추가 할당 없음
+                else:
+                    cls._count(stats, 'native_bytes', result.sizeInBytes())
+                    result = result.mirrored(horizontal, not horizontal)
+        else:
+            return qimage
+        cls._count(stats, 'native_bytes', result.sizeInBytes())
+        return result
+
+    @classmethod
+    def _finish(cls, qimage, orientation, color_space, stats):
+        """
+        방향 적용 → 색 공간 지정. 방향 변환이 없으면 반환된 QImage는 원본 버퍼를 그대로 감싸며,
+        PySide6가 버퍼 참조를 QImage 수명 동안 유지하므로 캐시에 보관하거나 다른 스레드로 넘겨도 안전합니다.
+        """
+        if orientation and orientation > 1:
+            qimage = cls._apply_orientation(qimage, orientation, stats)
+        if color_space is not None and color_space.isValid() and not qimage.isNull():
+            qimage.setColorSpace(color_space)
+        return qimage
+
+    @classmethod
+    def to_pixmap(cls, qimage, stats=None):
+        """QImage → QPixmap 업로드 (GUI 스레드 전용)"""
+        pixmap = QPixmap.fromImage(qimage)
+        cls._count(stats, 'upload_bytes', pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8)
+        return pixmap
+
+    @classmethod
+    def pil_to_image(cls, image, orientation=1, color_space=None, stats=None):
+        """로드된 PIL 이미지를 EXIF 방향과 색 공간을 반영한 QImage로 변환 (작업 스레드에서 호출 가능)"""
+        if image.mode not in cls.PIL_FORMATS:
+            image = image.convert('RGBA' if image.mode in ('P', 'PA', 'LA', 'RGBa') else 'RGB')
+            cls._count(stats, 'native_bytes', cls._pil_storage_bytes(image))
+        rawmode, qformat, bytes_per_pixel = cls.PIL_FORMATS[image.mode]
+        buffer = cls._pack(image, rawmode, bytes_per_pixel)
+        qimage = QImage(buffer, image.width, image.height, image.width * bytes_per_pixel, qformat)
+        return cls._finish(qimage, orientation, color_space, stats)
+
+    @classmethod
+    def rgb_buffer_to_image(cls, buffer, width, height, bytes_per_line=None, color_space=None, stats=None):
+        """RGB888 버퍼(bytes/memoryview)를 복사 없이 QImage로 감쌈"""
+        qimage = QImage(buffer, width, height, bytes_per_line or width * 3, QImage.Format_RGB888)
+        return cls._finish(qimage, 1, color_space, stats)
+
+    @classmethod
+    def array_to_image(cls, array, color_space=None, stats=None):
+        """(높이, 너비, 3) uint8 RGB 배열을 행 stride 그대로 QImage로 감쌈 (행 내부가 연속이 아닐 때만 복사)"""
+        if array.dtype != np.uint8 or array.strides[2] != 1 or array.strides[1] != 3:
+            array = np.ascontiguousarray(array)
+        height, width = array.shape[:2]
+        return cls.rgb_buffer_to_image(array.data, width, height, array.strides[0], color_space, stats)
+
+    @classmethod
+    def pil_to_pixmap(cls, image, orientation=1, color_space=None, stats=None):
+        """로드된 PIL 이미지를 QPixmap으로 변환 (GUI 스레드 전용)"""
+        return cls.to_pixmap(cls.pil_to_image(image, orientation, color_space, stats), stats)
+
+    @classmethod
+    def rgb_buffer_to_pixmap(cls, buffer, width, height, bytes_per_line=None, color_space=None, stats=None):
+        """RGB888 버퍼를 QPixmap으로 변환 (GUI 스레드 전용)"""
+        return cls.to_pixmap(cls.rgb_buffer_to_image(buffer, width, height, bytes_per_line, color_space, stats), stats)
+
+    @classmethod
+    def array_to_pixmap(cls, array, color_space=None, stats=None):
+        """RGB 배열을 QPixmap으로 변환 (GUI 스레드 전용)"""
+        return cls.to_pixmap(cls.array_to_image(array, color_space, stats), stats)
+
+    @classmethod
+    def _legacy_pil_to_pixmap(cls, image, orientation=1, color_space=None, stats=None):
+        """이전 변환 경로 (transpose → convert → tobytes → QImage → QPixmap) - 벤치마크 비교용"""
+        transpose_methods = {2: Image.FLIP_LEFT_RIGHT, 3: Image.ROTATE_180, 4: Image.FLIP_TOP_BOTTOM,
+                             5: Image.TRANSPOSE, 6: Image.ROTATE_270, 7: Image.TRANSVERSE, 8: Image.ROTATE_90}
+        if orientation in transpose_methods:
+            image = image.transpose(transpose_methods[orientation])
+            cls._count(stats, 'native_bytes', cls._pil_storage_bytes(image))
+        if image.mode == 'P' or image.mode == 'RGBA':
+            image = image.convert('RGBA')
+            cls._count(stats, 'native_bytes', cls._pil_storage_bytes(image))
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+            cls._count(stats, 'native_bytes', cls._pil_storage_bytes(image))
+        bytes_per_pixel = 4 if image.mode == 'RGBA' else 3
+        data = image.tobytes('raw', image.mode)
+        qimage = QImage(data, image.width, image.height, image.width * bytes_per_pixel,
+                        QImage.Format_RGBA8888 if image.mode == 'RGBA' else QImage.Format_RGB888)
+        return cls.to_pixmap(cls._finish(qimage, 1, color_space, stats), stats)
+
+    @classmethod
+    def run_benchmark(cls, paths, repeat=3):
+        """
+        변환 경로 마이크로 벤치마크: 이미지마다 이전/현재 경로의 할당량과 변환 시간을 출력합니다.
+        (디코딩 시간은 제외하고, 이미 로드된 PIL 이미지 → QPixmap 구간만 측정)
+        - Python 힙: tracemalloc으로 변환 1회 동안의 최대 사용량(tobytes 버퍼 등)을 측정
+        - 네이티브: 변환 중 실제로 만들어진 PIL/QImage 중간 이미지의 크기 합 (QPixmap 업로드는 양쪽 동일하므로 제외)
+        """
+        files = []
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                files.extend(sorted(f for f in path.iterdir() if f.suffix.lower() in cls.BENCHMARK_EXTENSIONS))
+            elif path.is_file():
+                files.append(path)
+        if not files:
+            print("사용법: PhotoSort.py --benchmark-conversion <이미지 폴더 또는 파일...>")
+            return
+        mb = 1024 * 1024
+        totals = {'legacy': [0, 0, 0.0], 'current': [0, 0, 0.0]}  # [Python 힙 최대, 네이티브, 시간 ms]
+        measured = 0
+        tracemalloc.start()
+        try:
+            for file_path in files:
+                try:
+                    with Image.open(file_path) as image:
+                        image.load()
+                        orientation = image.getexif().get(0x0112, 1)
+                        line = [f"{file_path.name}: {image.width}x{image.height} {image.mode} 방향 {orientation}"]
+                        for label, convert in (('legacy', cls._legacy_pil_to_pixmap), ('current', cls.pil_to_pixmap)):
+                            # 할당량: 변환 1회 (결과 QPixmap은 측정 후 해제)
+                            stats = {}
+                            tracemalloc.reset_peak()
+                            baseline = tracemalloc.get_traced_memory()[0]
+                            pixmap = convert(image, orientation, stats=stats)
+                            python_peak = tracemalloc.get_traced_memory()[1] - baseline
+                            del pixmap
+                            native = stats.get('native_bytes', 0)
+                            # 시간: repeat회 평균
+                            start = time.perf_counter()
+                            for _ in range(repeat):
+                                convert(image, orientation)
+                            elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+                            totals[label][0] += python_peak
+                            totals[label][1] += native
+                            totals[label][2] += elapsed_ms
+                            line.append(f"{'이전' if label == 'legacy' else '현재'} Python {python_peak / mb:.1f}MB + "
+                                        f"네이티브 {native / mb:.1f}MB, {elapsed_ms:.1f}ms")
+                        measured += 1
+                        print(" | ".join(line))
+                except Exception as e:
+                    print(f"{file_path.name}: 건너뜀 ({e})")
+        finally:
+            tracemalloc.stop()
+        if not measured:
+            return
+        legacy = [value / measured for value in totals['legacy']]
+        current = [value / measured for value in totals['current']]
+        legacy_bytes, current_bytes = legacy[0] + legacy[1], current[0] + current[1]
+        reduction = (1 - current_bytes / legacy_bytes) * 100 if legacy_bytes else 0.0
+        print(f"이미지당 평균 할당량: 이전 {legacy_bytes / mb:.1f}MB (Python {legacy[0] / mb:.1f} + 네이티브 {legacy[1] / mb:.1f}) → "
+              f"현재 {current_bytes / mb:.1f}MB (Python {current[0] / mb:.1f} + 네이티브 {current[1] / mb:.1f}), {reduction:.0f}% 감소 | "
+              f"평균 변환 시간: 이전 {legacy[2]:.1f}ms → 현재 {current[2]:.1f}ms (QPixmap 업로드 복사는 양쪽 동일하게 제외)")
+
+
+class DecodedImageCache:
+    """
+    ImageLoader의 스레드 안전 디코딩 캐시.
+    작업 스레드는 QImage만 저장/조회하고(락으로 보호되는 LRU), QPixmap 승격은 GUI 스레드에서
+    실제로 표시되는 이미지에 대해서만 수행합니다. 승격된 QPixmap은 작은 GUI 전용 LRU에 보관되며
+    작업 스레드의 캐시 축출은 이 LRU를 건드리지 않습니다 (QPixmap을 GUI 스레드 밖에서 해제하지 않기 위함).
+    """
+
+    def __init__(self, limit, pixmap_limit=4):
+        self.limit = limit
+        self.pixmap_limit = pixmap_limit
+        self._lock = threading.RLock()
+        self._images = OrderedDict()   # 파일 경로 -> QImage (LRU)
+        self._reduced = {}             # 축소 디코딩된 항목 {파일 경로: (원본 너비, 원본 높이)}
+        self._pixmaps = OrderedDict()  # 파일 경로 -> (QImage.cacheKey, QPixmap), GUI 스레드 전용
+
+    def __len__(self):
+        with self._lock:
+            return len(self._images)
+
+    def __contains__(self, file_path):
+        with self._lock:
+            return file_path in self._images
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def keys(self):
+        """현재 키 목록의 스냅샷 (오래된 항목부터). 순회 중 다른 스레드가 캐시를 바꿔도 안전합니다."""
+        with self._lock:
+            return list(self._images.keys())
+
+    def get_image(self, file_path, touch=True):
+        """캐시된 QImage 반환 (없으면 None). touch=True면 최근 사용으로 표시"""
+        with self._lock:
+            image = self._images.get(file_path)
+            if image is not None and touch:
+                self._images.move_to_end(file_path)
+            return image
+
+    def put(self, file_path, image, reduced_from=None):
+        """QImage를 LRU 방식으로 저장 (작업 스레드에서 호출 가능)"""
+        if image is None or image.isNull():
+            return
+        with self._lock:
+            while len(self._images) >= self.limit and file_path not in self._images:
+                evicted_path, _ = self._images.popitem(last=False)
+                self._reduced.pop(evicted_path, None)
+            self._images[file_path] = image
+            self._images.move_to_end(file_path)
+            if reduced_from:
+                self._reduced[file_path] = reduced_from
+            else:
+                self._reduced.pop(file_path, None)
+
+    def is_reduced(self, file_path):
+        with self._lock:
+            return file_path in self._reduced and file_path in self._images
+
+    def pop(self, file_path, default=None):
+        """항목 제거 (GUI 스레드 전용 - 승격된 QPixmap도 함께 해제)"""
+        self._pixmaps.pop(file_path, None)
+        with self._lock:
+            self._reduced.pop(file_path, None)
+            return self._images.pop(file_path, default)
+
+    def __delitem__(self, file_path):
+        self.pop(file_path)
+
+    def clear(self):
+        """전체 초기화 (GUI 스레드 전용)"""
+        self._pixmaps.clear()
+        with self._lock:
+            self._images.clear()
+            self._reduced.clear()
+
+    def evict_oldest(self, count, preserved_paths=()):
+        """보존 대상을 제외하고 가장 오래된 항목부터 count개 제거 (GUI 스레드 전용). 제거한 개수 반환"""
+        with self._lock:
+            victims = [key for key in self._images if key not in preserved_paths][:max(0, count)]
+        for key in victims:
+            self.pop(key)
+        return len(victims)
+
+    def promote(self, file_path, image, keep=True):
+        """QImage를 QPixmap으로 승격 (GUI 스레드 전용). keep=True면 빠른 재표시를 위해 승격 결과를 보관"""
+        if image is None or image.isNull():
+            return QPixmap()
+        cached = self._pixmaps.get(file_path)
+        if cached is not None and cached[0] == image.cacheKey():
+            self._pixmaps.move_to_end(file_path)
+            return cached[1]
+        pixmap = ImageConverter.to_pixmap(image)
+        if keep and not pixmap.isNull():
+            self._pixmaps[file_path] = (image.cacheKey(), pixmap)
+            self._pixmaps.move_to_end(file_path)
+            while len(self._pixmaps) > self.pixmap_limit:
+                self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def pixmap(self, file_path, keep=True):
+        """캐시된 이미지를 QPixmap으로 반환 (GUI 스레드 전용, 없으면 None)"""
+        image = self.get_image(file_path)
+        if image is None:
+            self._pixmaps.pop(file_path, None)
+            return None
+        return self.promote(file_path, image, keep)
+
+    def get(self, file_path, default=None):
+        """이전 dict 인터페이스 호환: GUI 스레드에서 QPixmap 반환"""
+        pixmap = self.pixmap(file_path)
+        return default if pixmap is None else pixmap
+
+
+class PreloadPlanner:
+    """
+    현재 위치 기준 미리 로드 목표 창을 계산합니다.
+    최근 이동 기록으로 방향과 속도(장/초)를 추정해, 진행 방향은 더 멀리(빠를수록 더 앞까지),
+    반대 방향은 가중치를 둔 거리로 섞어 '다음에 볼 가능성이 높은 순서'의 인덱스 목록을 만듭니다.
+    작업 제출/재순위는 호출자가 이 목록과 이전 목표를 비교(diff)해 수행합니다.
+    """
+
+    BACKWARD_WEIGHT = 2.0    # 반대 방향 이미지는 같은 거리의 진행 방향 이미지보다 2배 멀다고 간주
+    LEAD_SECONDS = 1.0       # 빠르게 넘길 때 진행 방향으로 추가로 내다보는 시간
+    VELOCITY_WINDOW = 1.5    # 속도 계산에 쓰는 최근 이동 기록 범위 (초)
+
+    def __init__(self):
+        self._moves = deque(maxlen=16)  # (시각, 부호 있는 이동 칸 수)
+        self._last_index = None
+        self.direction = 1
+        self.velocity = 0.0
+
+    def reset(self):
+        self._moves.clear()
+        self._last_index = None
+        self.direction = 1
+        self.velocity = 0.0
+
+    @staticmethod
+    def _signed_step(previous, current, total):
+        """순환 목록에서 previous → current의 최단 이동 칸 수 (앞으로 양수)"""
+        step = (current - previous) % total
+        return step - total if step > total // 2 else step
+
+    def record(self, index, total, now=None):
+        """이동 기록 갱신 후 (방향, 속도) 반환. 같은 인덱스 재호출은 기록하지 않습니다."""
+        now = time.monotonic() if now is None else now
+        if self._last_index is not None and total > 0 and index != self._last_index:
+            step = self._signed_step(self._last_index, index, total)
+            self._moves.append((now, step))
+            if step:
+                self.direction = 1 if step > 0 else -1
+        self._last_index = index
+        recent = [(t, step) for t, step in self._moves if now - t <= self.VELOCITY_WINDOW]
+        if len(recent) >= 2:
+            elapsed = max(now - recent[0][0], 0.05)
+            self.velocity = sum(abs(step) for _, step in recent[1:]) / elapsed
+        else:
+            self.velocity = 0.0
+        return self.direction, self.velocity
+
+    def target_offsets(self, forward_count, backward_count):
+        """현재 위치 기준 부호 있는 오프셋 목록 (볼 가능성이 높은 순)"""
+        lead = min(forward_count, int(round(self.velocity * self.LEAD_SECONDS)))
+        scored = [(offset, offset * self.direction) for offset in range(1, forward_count + lead + 1)]
+        scored += [(offset * self.BACKWARD_WEIGHT, -offset * self.direction) for offset in range(1, backward_count + 1)]
+        scored.sort(key=lambda item: item[0])  # 안정 정렬: 같은 거리면 진행 방향 우선
+        return [offset for _, offset in scored]
+
+    def plan(self, current_index, total, forward_count, backward_count, now=None):
+        """이동을 기록하고 목표 인덱스 목록을 순위 순으로 반환 (현재 이미지와 중복 제외)"""
+        if total <= 1:
+            return []
+        self.record(current_index, total, now)
+        seen = {current_index}
+        indices = []
+        for offset in self.target_offsets(forward_count, backward_count):
+            index = (current_index + offset) % total
+            if index not in seen:
+                seen.add(index)
+                indices.append(index)
+        return indices
+
+    @staticmethod
+    def priority_for_rank(rank):
+        """목표 순위 → 이미징 풀 숫자 우선순위 (현재 이미지 'high' 바로 뒤부터, 'low'에서 상한)"""
+        priorities = PriorityThreadPoolExecutor.PRIORITIES
+        return min(priorities['high'] + 1 + rank, priorities['low'])
+
+
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb2', 'smb3', 'afpfs', 'webdav', 'davfs', 'fuse.sshfs', '9p'}
+
+
+def storage_kind(path):
+    """경로가 위치한 저장장치 종류: 'network' (UNC/NFS/SMB 등), 'removable' (카드 리더 등), 'local' (확인할 수 없을 때 포함)"""
+    path = str(path)
+    if path.startswith('\\\\') or path.startswith('//'):
+        return 'network'  # UNC 경로 (네트워크 공유)
+    try:
+        resolved = os.path.realpath(path)
+        best_match = None
+        for partition in psutil.disk_partitions(all=True):
+            mount_point = partition.mountpoint
+            if mount_point and (resolved == mount_point or resolved.startswith(mount_point.rstrip(os.sep) + os.sep)):
+                if best_match is None or len(mount_point) > len(best_match.mountpoint):
+                    best_match = partition
+        if best_match is not None:
+            fstype = (best_match.fstype or '').lower()
+            opts = (best_match.opts or '').lower().split(',')
+            if fstype in NETWORK_FS_TYPES or 'remote' in opts:
+                return 'network'
+            if 'removable' in opts or 'cdrom' in opts:
+                return 'removable'
+    except Exception as e:
+        logging.debug(f"저장장치 종류 확인 실패 ({path}): {e}")
+    return 'local'
+
+
+class ImagePipeline:
+    """
+    일반 이미지(JPEG/HEIC/PNG 등) 로딩의 단계 분리 파이프라인.
+    - I/O 단계: 전용 스레드(io_workers개)가 미리 로드 대상 파일의 바이트를 읽습니다. 읽기 직전에
+      posix_fadvise(WILLNEED)로 커널 readahead를 요청하고, 읽기 창 밖의 다음 파일들은 readahead 힌트만 줍니다.
+    - 준비 큐: 읽은 바이트를 ready_limit개 / ready_bytes_limit 바이트까지만 보관하는 유한 큐. 가득 차면 I/O 단계가 대기합니다.
+    - 디코딩 단계: 이미징 풀 작업자가 take()로 바이트를 받아 디코딩합니다 (준비되지 않았으면 직접 읽음).
+    - 마무리 단계: 방향/색 공간 변환 (ImageConverter). stage()로 구간을 감싸 단계별 동시 실행 수를 집계합니다.
+      디코딩 직후 같은 이미징 작업에서 실행되므로 동시성은 이미징 풀(디코딩 단계)과 같이 늘어납니다.
+    stats()로 단계별 큐 깊이를 확인하고, configure()로 저장장치 특성(네트워크 저장소는 I/O 동시성↑)에 맞게 조정합니다.
+    """
+
+    DEFAULT_IO_WORKERS = 2
+    DEFAULT_READY_LIMIT = 8
+    DEFAULT_READY_BYTES_LIMIT = 256 * 1024 * 1024
+    READAHEAD_HINT_COUNT = 8  # 읽기 창 밖에서 readahead 힌트만 줄 파일 수
+
+    def __init__(self, io_workers=None, ready_limit=None, ready_bytes_limit=None):
+        self.io_workers = io_workers or self.DEFAULT_IO_WORKERS
+        self.ready_limit = ready_limit or self.DEFAULT_READY_LIMIT
+        self.ready_bytes_limit = ready_bytes_limit or self.DEFAULT_READY_BYTES_LIMIT
+        self._condition = threading.Condition()
+        self._pending = deque()      # I/O 단계 대기열: (파일 경로, 'read' 또는 'hint')
+        self._reading = set()        # I/O 단계에서 읽는 중인 경로
+        self._discarded = set()      # 읽는 중에 discard된 경로 (읽기가 끝나면 결과를 버림)
+        self._ready = OrderedDict()  # 준비 큐: 파일 경로 -> bytes
+        self._ready_bytes = 0
+        self._active = {'decode': 0, 'finish': 0}
+        self._counters = {'prefetched': 0, 'hits': 0, 'direct_reads': 0, 'hints': 0, 'dropped': 0}
+        self._threads = []
+        self._running = True
+
+    def configure(self, io_workers=None, ready_limit=None, ready_bytes_limit=None):
+        """I/O 동시성과 준비 큐 한도 조정 (I/O 스레드는 필요할 때 늘어나며 줄일 때는 남는 스레드가 대기만 함)"""
+        with self._condition:
+            if io_workers:
+                self.io_workers = io_workers
+            if ready_limit:
+                self.ready_limit = ready_limit
+            if ready_bytes_limit:
+                self.ready_bytes_limit = ready_bytes_limit
+            self._condition.notify_all()
+
+    def prefetch(self, file_paths, hint_only=False):
+        """
+        미리 로드 창 설정 (순위 순). 앞쪽 ready_limit개는 바이트를 읽어 두고, 그다음 파일들은 readahead 힌트만 줍니다.
+        이전 창에서 빠진 대기 읽기와 준비된 바이트는 버립니다.
+        hint_only이면 (디코더 프로세스가 파일을 직접 읽는 경우) 바이트는 읽지 않고 창 전체에 readahead 힌트만 줍니다.
+        """
+        file_paths = list(dict.fromkeys(file_paths))
+        wanted = set(file_paths)
+        with self._condition:
+            if not self._running:
+                return
+            for path in [path for path in self._ready if path not in wanted]:
+                self._ready_bytes -= len(self._ready.pop(path))
+                self._counters['dropped'] += 1
+            self._pending.clear()
+            read_paths = [path for path in file_paths if path not in self._ready and path not in self._reading]
+            read_count = 0 if hint_only else max(0, self.ready_limit - len(self._ready) - len(self._reading))
+            hint_count = self.READAHEAD_HINT_COUNT + (self.ready_limit if hint_only else 0)
+            for path in read_paths[:read_count]:
+                self._pending.append((path, 'read'))
+            for path in read_paths[read_count:read_count + hint_count]:
+                self._pending.append((path, 'hint'))
+            while len(self._threads) < min(self.io_workers, len(self._pending)):
+                self._start_io_worker()
+            self._condition.notify_all()
+
+    def take(self, file_path):
+        """디코딩 단계용 파일 바이트. 준비 큐에 있으면 꺼내고, I/O 단계가 읽는 중이면 기다리며, 없으면 직접 읽습니다."""
+        with self._condition:
+            while file_path in self._reading:
+                self._condition.wait()
+            data = self._ready.pop(file_path, None)
+            if data is not None:
+                self._ready_bytes -= len(data)
+                self._counters['hits'] += 1
+                self._condition.notify_all()  # 준비 큐에 자리가 생김
+                return data
+            self._pending = deque(item for item in self._pending if item[0] != file_path)
+            self._counters['direct_reads'] += 1
+        return self._read_file(file_path)
+
+    @contextmanager
+    def stage(self, name):
+        """디코딩/마무리 단계 구간 표시 (stats의 단계별 실행 수 집계용)"""
+        with self._condition:
+            self._active[name] = self._active.get(name, 0) + 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active[name] -= 1
+
+    def stats(self):
+        """단계별 큐 깊이와 누적 카운터"""
+        with self._condition:
+            return {
+                'io_pending': sum(1 for _, kind in self._pending if kind == 'read'),
+                'io_hints_pending': sum(1 for _, kind in self._pending if kind == 'hint'),
+                'io_active': len(self._reading),
+                'ready': len(self._ready),
+                'ready_bytes': self._ready_bytes,
+                'decode_active': self._active.get('decode', 0),
+                'finish_active': self._active.get('finish', 0),
+                **self._counters,
+            }
+
+    def discard(self, file_paths):
+        """변경/삭제된 파일의 대기 읽기와 준비된 바이트 제거 (읽는 중인 파일은 읽기가 끝나면 결과를 버림)"""
+        file_paths = set(file_paths)
+        with self._condition:
+            self._pending = deque(item for item in self._pending if item[0] not in file_paths)
+            self._discarded |= file_paths & self._reading
+            for path in file_paths & self._ready.keys():
+                self._ready_bytes -= len(self._ready.pop(path))
+            self._condition.notify_all()
+
+    def clear(self):
+        with self._condition:
+            self._pending.clear()
+            self._ready.clear()
+            self._ready_bytes = 0
+            self._condition.notify_all()
+
+    def shutdown(self):
+        with self._condition:
+            self._running = False
+            self._pending.clear()
+            self._ready.clear()
+            self._ready_bytes = 0
+            self._condition.notify_all()
+
+    @staticmethod
+    def _advise_willneed(fd):
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+
+    @classmethod
+    def _read_file(cls, file_path):
+        with open(file_path, 'rb') as f:
+            cls._advise_willneed(f.fileno())
+            return f.read()
+
+    def _start_io_worker(self):
+        """I/O 스레드 추가 (호출자가 조건 변수 락 보유)"""
+        worker_index = len(self._threads)
+        worker = threading.Thread(target=self._io_loop, args=(worker_index,), daemon=True, name=f"ImageIO_{worker_index}")
+        self._threads.append(worker)
+        worker.start()
+
+    def _ready_full(self):
+        return len(self._ready) >= self.ready_limit or self._ready_bytes >= self.ready_bytes_limit
+
+    def _io_loop(self, worker_index):
+        while True:
+            with self._condition:
+                # 대기열이 비었거나, 준비 큐가 가득 찼는데 다음 작업이 읽기이거나, 동시성 한도를 넘은 스레드는 대기
+                while self._running and (not self._pending or worker_index >= self.io_workers
+                                         or (self._pending[0][1] == 'read' and self._ready_full())):
+                    self._condition.wait()
+                if not self._running:
+                    return
+                file_path, kind = self._pending.popleft()
+                if kind == 'read':
+                    self._reading.add(file_path)
+            try:
+                if kind == 'hint':
+                    fd = os.open(file_path, os.O_RDONLY)
+                    try:
+                        self._advise_willneed(fd)
+                    finally:
+                        os.close(fd)
+                    data = None
+                else:
+                    data = self._read_file(file_path)
+            except OSError as e:
+                logging.debug(f"ImagePipeline: 미리 읽기 실패 ({Path(file_path).name}): {e}")
+                data = None
+            with self._condition:
+                if kind == 'hint':
+                    self._counters['hints'] += 1
+                    continue
+                self._reading.discard(file_path)
+                if file_path in self._discarded:
+                    self._discarded.discard(file_path)
+                    if data is not None:
+                        self._counters['dropped'] += 1
+                    data = None  # 읽는 동안 변경/삭제된 파일이므로 이전 내용을 버림
+                if data is not None and self._running:
+                    self._ready[file_path] = data
+                    self._ready_bytes += len(data)
+                    self._counters['prefetched'] += 1
+                self._condition.notify_all()
+
 
 class ImageLoader(QObject):
     """이미지 로딩 및 캐싱을 관리하는 클래스"""
 
-    imageLoaded = Signal(int, QPixmap, str)  # 인덱스, 픽스맵, 이미지 경로
-    loadCompleted = Signal(QPixmap, str, int)  # pixmap, image_path, requested_index
+    imageLoaded = Signal(int, QImage, str)  # 인덱스, 디코딩된 QImage, 이미지 경로 (QPixmap 승격은 GUI 스레드에서)
+    loadCompleted = Signal(QImage, str, int)  # image, image_path, requested_index
     loadFailed = Signal(str, str, int)  # error_message, image_path, requested_index
     decodingFailedForFile = Signal(str) # 디코딩 실패 시 PhotoSortApp에 알리기 위한 새 시그널(실패한 파일 경로 전달)
 
@@ -2645,11 +5027,7 @@ class ImageLoader(QObject):
         # 시스템 메모리 기반 캐시 크기 조정
         self.system_memory_gb = self.get_system_memory_gb()
         self.cache_limit = self.calculate_adaptive_cache_size()
-        self.cache = self.create_lru_cache(self.cache_limit)
-
-        # 디코딩 이력 추적 (중복 디코딩 방지용)
-        self.recently_decoded = {}  # 파일명 -> 마지막 디코딩 시간
-        self.decoding_cooldown = 30  # 초 단위 (이 시간 내 중복 디코딩 방지)
+        self.cache = DecodedImageCache(self.cache_limit)  # 작업 스레드와 공유되는 QImage 캐시
 
         # 주기적 캐시 건전성 확인 타이머 추가
         self.cache_health_timer = QTimer()
@@ -2664,14 +5042,22 @@ class ImageLoader(QObject):
         self.active_futures = []  # 현재 활성화된 로딩 작업 추적
         self.last_requested_page = -1  # 마지막으로 요청된 페이지
         self._raw_load_strategy = "preview" # PhotoSortApp에서 명시적으로 설정하기 전까지의 기본값
-        self.load_executor = self.resource_manager.imaging_thread_pool
-        
-        # RAW 디코딩 보류 중인 파일 추적 
-        self.pending_raw_decoding = set()
+
+
+        # Fit 보기용 축소 디코딩 (JPEG DCT 스케일링)
+        self.fit_decode_size = None  # (너비, 높이) 물리 픽셀, None이면 항상 원본 해상도로 디코딩
 
         # 전략 결정을 위한 락 추가
         self._strategy_lock = threading.Lock()
 
+        # 일반 이미지 단계 분리 파이프라인 (I/O 스레드 + 유한 준비 큐 → 디코딩 → 마무리)
+        self.pipeline = ImagePipeline()
+
+        # single-flight 요청 등록부: (파일 경로, 변형) -> Future
+        self._inflight_lock = threading.Lock()
+        self._queued_requests = {}   # 풀에 제출된 작업 (대기 + 실행)
+        self._running_decodes = {}   # 실제로 디코딩 중인 스레드의 결과
+
     def cancel_loading(self):
         """진행 중인 모든 이미지 로딩 작업을 취소합니다."""
         for future in self.active_futures:
@@ -2695,11 +5081,6 @@ class ImageLoader(QObject):
         logging.info(f"ImageLoader: 캐시 크기 설정 -> {size}개 이미지 ({HardwareProfileManager.get_current_profile_name()} 프로필)")
         return size
     
-    def create_lru_cache(self, max_size): # 이 함수는 OrderedDict를 반환하며, 실제 크기 제한은 _add_to_cache에서 self.cache_limit을 사용하여 관리됩니다.
-        """LRU 캐시 생성 (OrderedDict 기반)"""
-        from collections import OrderedDict
-        return OrderedDict()
-    
     def check_cache_health(self):
         """캐시 상태 확인 및 시스템 프로필에 따라 동적으로 축소"""
         try:
@@ -2758,28 +5139,13 @@ class ImageLoader(QObject):
                         preserved_paths.add(str(self.image_files[idx]))
         
         # 2. 가장 오래된 항목부터 제거하되, 보존 대상은 제외
-        items_to_remove = []
-        items_removed = 0
-        
-        for key in list(self.cache.keys()):
-            if items_removed >= count:
-                break
-                
-            if key not in preserved_paths:
-                items_to_remove.append(key)
-                items_removed += 1
-        
-        # 3. 실제 캐시에서 제거
-        for key in items_to_remove:
-            del self.cache[key]
-            
-        return items_removed  # 실제 제거된 항목 수 반환
+        return self.cache.evict_oldest(count, preserved_paths)  # 실제 제거된 항목 수 반환
 
 
     def cancel_all_raw_decoding(self):
         """진행 중인 모든 RAW 디코딩 작업 취소"""
-        # 보류 중인 RAW 디코딩 작업 목록 초기화
-        self.pending_raw_decoding.clear()
+        # 대기 중인 RAW 디코딩 작업 취소 (중복 제거/대기열은 RawDecoderPool이 관리)
+        self.resource_manager.raw_decoder_pool.cancel_all()
         
         # 캐시와 전략 초기화
         self._raw_load_strategy = "preview"
@@ -2790,23 +5156,19 @@ class ImageLoader(QObject):
         # 리소스 매니저를 통한 접근으로 변경
         self.resource_manager.process_raw_results(10)
 
-    def _add_to_cache(self, file_path, pixmap):
-        """PixMap을 LRU 방식으로 캐시에 추가"""
-        if pixmap and not pixmap.isNull():
-            # 캐시 크기 제한 확인
-            while len(self.cache) >= self.cache_limit:
-                # 가장 오래전에 사용된 항목 제거 (OrderedDict의 첫 번째 항목)
-                try:
-                    self.cache.popitem(last=False)
-                except:
-                    break  # 캐시가 비어있는 경우 예외 처리
-                    
-            # 새 항목 추가 또는 기존 항목 갱신 (최근 사용됨으로 표시)
-            self.cache[file_path] = pixmap
-            # 항목을 맨 뒤로 이동 (최근 사용)
-            self.cache.move_to_end(file_path)
+    def _add_to_cache(self, file_path, image, reduced_from=None):
+        """디코딩된 QImage를 LRU 방식으로 캐시에 추가 (작업 스레드에서 호출 가능)"""
+        self.cache.put(file_path, image, reduced_from)
       
     def _load_raw_preview_with_orientation(self, file_path):
+        """RAW 내장 미리보기를 QPixmap으로 로드 (GUI 스레드 전용). 반환: (pixmap, 너비, 높이)"""
+        image, preview_width, preview_height = self._load_raw_preview_image(file_path)
+        if image is None:
+            return None, None, None
+        return ImageConverter.to_pixmap(image), preview_width, preview_height
+
+    def _load_raw_preview_image(self, file_path):
+        """RAW 내장 미리보기를 방향을 적용한 QImage로 로드 (작업 스레드에서 호출 가능). 반환: (image, 너비, 높이)"""
         try:
             with rawpy.imread(file_path) as raw:
                 try:
@@ -2830,54 +5192,24 @@ class ImageLoader(QObject):
                             orientation = 1  # 실패 시 기본값
 
                     elif thumb.format == rawpy.ThumbFormat.BITMAP:
-                        # 비트맵 썸네일 처리
-                        thumb_image = Image.fromarray(thumb.data)
-                        preview_width, preview_height = thumb_image.size
+                        # 비트맵 썸네일 처리: NumPy 배열을 그대로 감싸 변환
+                        preview_height, preview_width = thumb.data.shape[:2]
+                        qimage = ImageConverter.array_to_image(thumb.data)
+                        if not qimage.isNull():
+                            logging.info(f"내장 미리보기 로드 성공 ({Path(file_path).name})")
+                            return qimage, preview_width, preview_height
+                        raise ValueError("미리보기 QImage 변환 실패")
                     
                     if thumb_image:
-                        # 방향에 따라 이미지 회전
-                        if orientation > 1:
-                            rotation_methods = {
-                                2: Image.FLIP_LEFT_RIGHT,
-                                3: Image.ROTATE_180,
-                                4: Image.FLIP_TOP_BOTTOM,
-                                5: Image.TRANSPOSE,
-                                6: Image.ROTATE_270,
-                                7: Image.TRANSVERSE,
-                                8: Image.ROTATE_90
-                            }
-                            if orientation in rotation_methods:
-                                thumb_image = thumb_image.transpose(rotation_methods[orientation])
-                        
-                        # PIL Image를 QImage로 수동 변환 (ImageQt 사용하지 않음)
-                        if thumb_image.mode == 'P' or thumb_image.mode == 'RGBA':
-                            thumb_image = thumb_image.convert('RGBA')
-                            img_format = QImage.Format_RGBA8888
-                            bytes_per_pixel = 4
-                        elif thumb_image.mode != 'RGB':
-                            thumb_image = thumb_image.convert('RGB')
-                            img_format = QImage.Format_RGB888
-                            bytes_per_pixel = 3
-                        else:
-                            img_format = QImage.Format_RGB888
-                            bytes_per_pixel = 3
+                        # 방향 적용과 QImage 변환을 ImageConverter에서 한 번에 처리 (PIL transpose/convert 중간 복사 없음)
+                        thumb_image.load()
+                        qimage = ImageConverter.pil_to_image(thumb_image, orientation)
                         
-                        data = thumb_image.tobytes('raw', thumb_image.mode)
-                        qimage = QImage(
-                            data,
-                            thumb_image.width,
-                            thumb_image.height,
-                            thumb_image.width * bytes_per_pixel,
-                            img_format
-                        )
-                        
-                        pixmap = QPixmap.fromImage(qimage)
-                        
-                        if pixmap and not pixmap.isNull():
+                        if not qimage.isNull():
                             logging.info(f"내장 미리보기 로드 성공 ({Path(file_path).name})")
-                            return pixmap, preview_width, preview_height  # Return pixmap and dimensions
+                            return qimage, preview_width, preview_height  # Return image and dimensions
                         else:
-                            raise ValueError("미리보기 QPixmap 변환 실패")
+                            raise ValueError("미리보기 QImage 변환 실패")
                     else:
                         raise rawpy.LibRawUnsupportedThumbnailError(f"지원하지 않는 미리보기 형식: {thumb.format}")
 
@@ -2895,104 +5227,317 @@ class ImageLoader(QObject):
         # Should not be reached, but as fallback
         return None, None, None
     
-    def load_image_with_orientation(self, file_path, strategy_override=None):
-        """EXIF 방향 및 ICC 색상 프로파일을 고려하여 이미지를 올바른 방향과 색상으로 로드합니다."""
-        logging.debug(f"ImageLoader ({id(self)}): load_image_with_orientation 호출됨. 파일: {Path(file_path).name}, 내부 전략: {self._raw_load_strategy}, 오버라이드: {strategy_override}")
-        if not ResourceManager.instance()._running:
-            logging.info(f"ImageLoader.load_image_with_orientation: ResourceManager 종료 중, 로드 중단 ({Path(file_path).name})")
+    def set_fit_decode_size(self, width, height):
+        """Fit 보기용 축소 디코딩 기준 크기 설정 (화면 물리 픽셀, 0 이하이면 축소 디코딩 끔)"""
+        self.fit_decode_size = (int(width), int(height)) if width > 0 and height > 0 else None
+
+    def is_reduced(self, file_path):
+        """캐시된 이미지가 Fit용 축소 디코딩 결과인지 확인 (100%/Spin 표시에는 원본 디코딩 필요)"""
+        return self.cache.is_reduced(file_path)
+
+    def _draft_for_fit(self, image, orientation):
+        """
+        JPEG DCT 스케일링(draft)으로 Fit 크기 이상인 가장 작은 배율(1/2, 1/4, 1/8)로 디코딩하도록 설정합니다.
+        image.load() 전에 호출해야 하며, 실제로 축소되면 True를 반환합니다.
+        """
+        if not self.fit_decode_size or image.format != 'JPEG':
+            return False
+        width, height = self.fit_decode_size
+        if orientation in (5, 6, 7, 8):  # 90도 회전 이미지는 파일 기준 가로/세로가 반대
+            width, height = height, width
+        original_size = image.size
+        try:
+            image.draft(None, (width, height))
+        except Exception as e:
+            logging.debug(f"축소 디코딩 설정 실패, 원본 해상도로 디코딩: {e}")
+            return False
+        return image.size != original_size
+
+    def load_image_with_orientation(self, file_path, strategy_override=None, full_resolution=False):
+        """
+        decode_image 결과를 QPixmap으로 승격해 반환합니다 (GUI 스레드 전용).
+        작업 스레드에서는 decode_image를 사용하고 결과 QImage를 시그널로 GUI 스레드에 넘겨야 합니다.
+        """
+        image = self.decode_image(file_path, strategy_override, full_resolution)
+        if image.isNull():
             return QPixmap()
-        
-        if strategy_override is None and file_path in self.cache:
-            self.cache.move_to_end(file_path)
-            return self.cache[file_path]
+        return self.cache.promote(file_path, image, keep=strategy_override is None)
+
+    def decode_image(self, file_path, strategy_override=None, full_resolution=False):
+        """EXIF 방향 및 ICC 색상 프로파일을 고려하여 이미지를 올바른 방향과 색상의 QImage로 로드합니다.
+        작업 스레드에서 호출할 수 있으며, 결과는 스레드 안전 QImage 캐시에 저장됩니다.
+        full_resolution=False이면 JPEG는 Fit 보기용 화면 해상도로 축소 디코딩될 수 있습니다 (100%/Spin은 True로 호출).
+        """
+        logging.debug(f"ImageLoader ({id(self)}): decode_image 호출됨. 파일: {Path(file_path).name}, 내부 전략: {self._raw_load_strategy}, 오버라이드: {strategy_override}")
+        if not ResourceManager.instance()._running:
+            logging.info(f"ImageLoader.decode_image: ResourceManager 종료 중, 로드 중단 ({Path(file_path).name})")
+            return QImage()
+        
+        cached_image = self._cached_decode(file_path, strategy_override, full_resolution)
+        if cached_image is not None:
+            return cached_image
+
+        # single-flight: 같은 경로/변형을 다른 스레드가 디코딩 중이면 새로 디코딩하지 않고 그 결과를 기다림
+        variant = self._decode_variant(full_resolution, strategy_override)
+        with self._inflight_lock:
+            running = self._find_inflight(self._running_decodes, file_path, variant)
+            if running is None:
+                future = Future()
+                self._running_decodes[(file_path, variant)] = future
+        if running is not None:
+            logging.debug(f"ImageLoader: 디코딩 중인 요청에 합류 ({Path(file_path).name}, {variant})")
+            return running.result()
+
+        try:
+            image = self._cached_decode(file_path, strategy_override, full_resolution)  # 대기 중 다른 스레드가 끝냈을 수 있음
+            if image is None:
+                image = self._decode_uncached(file_path, strategy_override, full_resolution)
+            future.set_result(image)
+            return image
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._running_decodes.pop((file_path, variant), None)
+
+    @staticmethod
+    def _decode_variant(full_resolution=False, strategy_override=None):
+        """
+        요청 변형 이름. 그리드 셀과 Fit 보기는 같은 디코딩 결과(캐시 항목)를 공유하므로 'fit'으로 합쳐지고,
+        썸네일 패널 요청은 호출자가 'thumb'으로 등록합니다.
+        """
+        if strategy_override:
+            return strategy_override
+        return "full" if full_resolution else "fit"
+
+    @staticmethod
+    def _find_inflight(registry, file_path, variant):
+        """진행 중인 Future 조회. 원본 해상도('full') 결과는 Fit 요청도 만족하므로 함께 확인 (호출자가 락 보유)"""
+        future = registry.get((file_path, variant))
+        if (future is None or future.done()) and variant == "fit":
+            future = registry.get((file_path, "full"))
+        return future if future is not None and not future.done() else None
+
+    def _cached_decode(self, file_path, strategy_override, full_resolution):
+        """요청을 만족하는 캐시 항목 반환 (없으면 None)"""
+        if strategy_override is not None or (full_resolution and self.cache.is_reduced(file_path)):
+            return None
+        return self.cache.get_image(file_path)
+
+    def request_shared(self, file_path, variant, submit, priority=None, group=None):
+        """
+        작업 제출 단계의 single-flight. 같은 (경로, 변형) 작업이 대기/실행 중이면 그 작업에 합류하고,
+        없으면 submit()을 호출해 새 작업을 등록합니다 (풀과 우선순위는 호출자가 선택). 제출 실패 시 None.
+        기존 작업이 아직 대기 중이면 priority로 우선순위를 올리고 현재 세대로 갱신해 무효화되지 않게 합니다.
+        ImagingTask는 요청자별 SharedTaskHandle로 반환하므로 한 요청자의 cancel()이 다른 요청자의 작업을 취소하지 않습니다
+        (group은 이 요청자의 세대 그룹).
+        """
+        with self._inflight_lock:
+            future = self._find_inflight(self._queued_requests, file_path, variant)
+            if future is not None:
+                if isinstance(future, ImagingTask):
+                    future.add_waiter(group)
+                    future.reprioritize(priority if priority is not None else future.priority, keep_higher=True)
+                    return SharedTaskHandle(future)
+                return future
+            future = submit()
+            if future is None:
+                return None
+            key = (file_path, variant)
+            self._queued_requests[key] = future
+        future.add_done_callback(lambda f, key=key: self._forget_request(key, f))
+        return SharedTaskHandle(future) if isinstance(future, ImagingTask) else future
+
+    def _forget_request(self, key, future):
+        with self._inflight_lock:
+            if self._queued_requests.get(key) is future:
+                del self._queued_requests[key]
+
+    def submit_decode(self, file_path, priority='low', full_resolution=False, strategy_override=None, task_group=None):
+        """
+        decode_image를 백그라운드로 제출합니다. 같은 경로/변형이 이미 대기/실행 중이면 기존 Future에 합류하고,
+        캐시로 충분하면 제출하지 않고 None을 반환합니다. task_group은 ResourceManager 세대 그룹입니다.
+        'decode' 방식 RAW는 RawDecoderPool로 보내고 None을 반환합니다 (submit_raw_decode 참고).
+        """
+        if self._cached_decode(file_path, strategy_override, full_resolution) is not None:
+            return None
+        if strategy_override is None and self.uses_raw_decoder(file_path):
+            self.submit_raw_decode(file_path, priority, full_resolution)
+            return None
+        submit = lambda: self.resource_manager.submit_imaging_task_with_priority(
+            priority, self.decode_image, file_path, strategy_override, full_resolution, task_group=task_group)
+        return self.request_shared(file_path, self._decode_variant(full_resolution, strategy_override), submit, priority,
+                                   task_group)
 
+    def uses_raw_decoder(self, file_path):
+        """RawDecoderPool로 디코딩하는 파일인지 ('decode' 방식의 RAW)"""
+        return self._raw_load_strategy == "decode" and Path(file_path).suffix.lower() in self.raw_extensions
+
+    def submit_raw_decode(self, file_path, priority='low', full_resolution=False, on_image=None):
+        """
+        'decode' 방식 RAW를 RawDecoderPool에 제출합니다. 탐색/미리 로드/그리드 요청이 풀의 (경로, 단계) 작업과
+        디스크 캐시를 공유하므로 같은 파일을 동시에 두 번 디코딩하지 않으며, Fit 요청은 빠른 단계로 디코딩될 수 있습니다.
+        결과는 GUI 스레드에서 캐시에 저장되고 on_image(QImage, 실패 시 빈 QImage)가 호출됩니다.
+        풀의 task_group은 그룹당 한 경로만 남기므로 미리 로드에는 쓰지 않습니다. 작업 ID 반환 (제출 실패 시 None).
+        """
+        def on_result(result):
+            image = QImage()
+            if result.get('success'):
+                try:
+                    image = self.cache_raw_result(result)
+                except Exception as e:
+                    logging.error(f"RAW 디코딩 결과 처리 오류 ({Path(file_path).name}): {e}")
+            else:
+                logging.debug(f"RAW 미리 로드 디코딩 실패 ({Path(file_path).name}): {result.get('error')}")
+            if on_image is not None:
+                on_image(image)
+
+        fit_size = None if full_resolution else self.fit_decode_size
+        return self.resource_manager.submit_raw_decoding(file_path, on_result, fit_size, priority)
+
+    def cache_raw_result(self, result):
+        """
+        RawDecoderPool의 성공 결과를 QImage로 만들어 캐시에 저장하고 반환합니다 (GUI 스레드의 결과 콜백에서 호출).
+        빠른 단계 결과는 축소 항목으로 캐시하고, 원본 품질이 먼저 캐시되어 있으면 늦게 온 빠른 단계 결과는 버립니다.
+        """
+        file_path = result.get('file_path')
+        data_bytes = result.get('data')  # 공유 메모리 슬랩/디스크 캐시 memoryview (이 콜백 동안만 유효) 또는 큐로 받은 bytes
+        shape = result.get('shape')
+        if not data_bytes or not shape:
+            raise ValueError("디코딩 결과 데이터 또는 형태 정보 누락")
+        height, width, _ = shape
+        # rawpy.postprocess의 기본 출력은 sRGB이므로, sRGB라고 명시해줍니다.
+        # 이 태그가 있으면 Qt가 자동으로 모니터 프로파일에 맞게 색상을 변환합니다.
+        decoded_image = ImageConverter.rgb_buffer_to_image(data_bytes, width, height,
+                                                           color_space=QColorSpace(QColorSpace.SRgb))
+        if decoded_image.isNull():
+            raise ValueError("디코딩된 데이터로 QImage 생성 실패")
+        if result.get('in_slab') or result.get('from_disk_cache'):
+            # 슬랩은 콜백이 끝나면 반납되고 디스크 캐시 배열도 풀에서 놓으므로 캐시용 자체 버퍼로 한 번만 복사
+            decoded_image = decoded_image.copy()
+
+        # 빠른 단계 결과는 축소 항목으로 캐시 (Fit 보기에는 그대로 쓰고, 100%/Spin 전환 시 원본 품질로 다시 디코딩)
+        reduced_from = result.get('reduced_from')
+        cached_image = self.cache.get_image(file_path) if reduced_from else None
+        if cached_image is not None and not self.is_reduced(file_path):
+            return cached_image  # 원본 품질이 먼저 도착했으면 늦게 온 빠른 단계 결과는 버림
+        self._add_to_cache(file_path, decoded_image, tuple(reduced_from) if reduced_from else None)
+        return decoded_image
+
+    def _decode_raw_and_wait(self, file_path, full_resolution=False):
+        """
+        동기 호출(비교 화면 등)의 'decode' 방식 RAW 디코딩. 직접 LibRaw를 돌리지 않고 RawDecoderPool 작업에 합류해 기다립니다.
+        결과 콜백은 GUI 스레드에서 실행되므로 GUI 스레드에서 부르면 기다리는 동안 도착한 결과를 직접 처리합니다.
+        """
+        done = threading.Event()
+        decoded = {}
+
+        def on_image(image):
+            decoded['image'] = image
+            done.set()
+
+        if self.submit_raw_decode(file_path, 'high', full_resolution, on_image) is None:
+            return QImage()
+        pool = self.resource_manager.raw_decoder_pool
+        app = QApplication.instance()
+        on_gui_thread = app is not None and QThread.currentThread() is app.thread()
+        deadline = time.monotonic() + RawDecoderPool.TASK_TIMEOUT
+        while not done.is_set() and time.monotonic() < deadline and self.resource_manager._running:
+            if on_gui_thread:
+                pool.process_results()
+            done.wait(0.02 if on_gui_thread else 0.1)
+        return decoded.get('image', QImage())
+
+    def _decode_uncached(self, file_path, strategy_override=None, full_resolution=False):
+        """실제 디코딩 (decode_image의 single-flight를 거쳐 호출)"""
         file_path_obj = Path(file_path)
         is_raw = file_path_obj.suffix.lower() in self.raw_extensions
-        pixmap = QPixmap()
+        qimage = QImage()
 
         if is_raw:
-            # RAW 파일 처리는 _load_image_task -> _on_raw_decoded_for_display에서 처리됩니다.
-            # 이 함수에서는 기존 로직을 유지합니다.
+            # 'decode' 방식 RAW는 RawDecoderPool을 거치며 캐시 저장도 결과 콜백에서 처리됩니다.
             current_processing_method = strategy_override if strategy_override else self._raw_load_strategy
+            if current_processing_method == "decode":
+                return self._decode_raw_and_wait(file_path, full_resolution)
             if current_processing_method == "preview":
-                preview_pixmap_result, _, _ = self._load_raw_preview_with_orientation(file_path)
-                pixmap = preview_pixmap_result if preview_pixmap_result and not preview_pixmap_result.isNull() else QPixmap()
-            elif current_processing_method == "decode":
-                # 실제 디코딩은 비동기로 처리되므로 여기서는 플레이스홀더나 빈 QPixmap을 반환할 수 있습니다.
-                # 이 경로는 주로 썸네일 생성 등 동기적 호출에서 사용될 수 있습니다.
-                try:
-                    with rawpy.imread(file_path) as raw:
-                        rgb = raw.postprocess(use_camera_wb=True, output_bps=8)
-                        height, width, _ = rgb.shape
-                        qimage = QImage(rgb.data, width, height, width * 3, QImage.Format_RGB888)
-                        pixmap = QPixmap.fromImage(qimage)
-                except Exception as e:
-                    logging.error(f"RAW 직접 디코딩 실패 (동기 호출): {e}")
-                    pixmap = QPixmap()
-            if pixmap and not pixmap.isNull() and strategy_override is None:
-                self._add_to_cache(file_path, pixmap)
-            return pixmap
+                preview_image, _, _ = self._load_raw_preview_image(file_path)
+                qimage = preview_image if preview_image is not None else QImage()
+            if not qimage.isNull() and strategy_override is None:
+                self._add_to_cache(file_path, qimage)
+            return qimage
         else:
             # --- 일반 이미지 (JPG, HEIC 등) 색상 관리 로직 ---
             try:
-                if not ResourceManager.instance()._running: return QPixmap()
+                if not ResourceManager.instance()._running: return QImage()
                 
-                with open(file_path, 'rb') as f:
-                    image = Image.open(f)
+                # 프로세스 디코딩 엔진이 있으면 GIL 밖에서 디코딩 (실패 시 아래 스레드 디코딩으로 폴백)
+                if self.resource_manager.image_decode_pool is not None:
+                    qimage = self._decode_in_process(file_path, full_resolution)
+                    if qimage is not None:
+                        return qimage
+
+                reduced_from = None
+                # I/O 단계: 미리 읽어 둔 바이트를 받거나 직접 읽음
+                data = self.pipeline.take(file_path)
+                with self.pipeline.stage('decode'):
+                    image = Image.open(io.BytesIO(data))
+                    if not full_resolution:
+                        # Fit 보기는 화면 크기면 충분하므로 JPEG는 DCT 단계에서 축소 디코딩
+                        header_orientation = image.getexif().get(0x0112, 1) if hasattr(image, 'getexif') else 1
+                        original_size = image.size
+                        if self._draft_for_fit(image, header_orientation):
+                            reduced_from = original_size[::-1] if header_orientation in (5, 6, 7, 8) else original_size
                     image.load()
+                del data
 
                 # 1. 이미지의 ICC 프로파일 추출
-                icc_profile = image.info.get('icc_profile')
-                source_color_space = None
-                if icc_profile:
-                    try:
-                        source_color_space = QColorSpace(icc_profile)
-                        if not source_color_space.isValid():
-                            logging.warning(f"이미지의 ICC 프로파일이 유효하지 않습니다: {file_path_obj.name}. sRGB로 간주합니다.")
-                            source_color_space = QColorSpace(QColorSpace.SRgb)
-                    except Exception as e:
-                        logging.warning(f"ICC 프로파일로 QColorSpace 생성 실패: {e}. sRGB로 간주합니다.")
-                        source_color_space = QColorSpace(QColorSpace.SRgb)
-                else:
-                    # 프로파일이 없으면 sRGB로 간주 (웹 표준)
-                    source_color_space = QColorSpace(QColorSpace.SRgb)
+                source_color_space = self._source_color_space(image.info.get('icc_profile'), file_path_obj.name)
                 
-                # 2. EXIF 방향 정보에 따라 이미지 회전
+                # 2. EXIF 방향 정보
                 orientation = 1
                 if hasattr(image, 'getexif'):
                     exif = image.getexif()
                     if exif and 0x0112 in exif: orientation = exif[0x0112]
-                if orientation > 1:
-                    # (회전 로직은 기존과 동일)
-                    if orientation == 2: image = image.transpose(Image.FLIP_LEFT_RIGHT)
-                    elif orientation == 3: image = image.transpose(Image.ROTATE_180)
-                    elif orientation == 4: image = image.transpose(Image.FLIP_TOP_BOTTOM)
-                    elif orientation == 5: image = image.transpose(Image.TRANSPOSE)
-                    elif orientation == 6: image = image.transpose(Image.ROTATE_270)
-                    elif orientation == 7: image = image.transpose(Image.TRANSVERSE)
-                    elif orientation == 8: image = image.transpose(Image.ROTATE_90)
-                
-                # 3. QImage로 변환
-                if image.mode == 'P' or image.mode == 'RGBA': image = image.convert('RGBA')
-                elif image.mode != 'RGB': image = image.convert('RGB')
-                img_format = QImage.Format_RGBA8888 if image.mode == 'RGBA' else QImage.Format_RGB888
-                bytes_per_pixel = 4 if image.mode == 'RGBA' else 3
-                data = image.tobytes('raw', image.mode)
-                qimage = QImage(data, image.width, image.height, image.width * bytes_per_pixel, img_format)
-
-                # 4. QImage에 소스 색상 공간(ICC 프로파일) 설정
-                if qimage and not qimage.isNull() and source_color_space:
-                    qimage.setColorSpace(source_color_space)
 
-                pixmap = QPixmap.fromImage(qimage)
-                if pixmap and not pixmap.isNull():
-                    self._add_to_cache(file_path, pixmap)
-                    return pixmap
-                else:
-                    return QPixmap()
+                # 3. 마무리 단계: 방향 + 색 공간을 적용해 QImage 생성 (버퍼 복사는 tobytes 한 번)
+                with self.pipeline.stage('finish'):
+                    qimage = ImageConverter.pil_to_image(image, orientation, source_color_space)
+                if not qimage.isNull():
+                    self._add_to_cache(file_path, qimage, reduced_from)
+                return qimage
             except Exception as e_img:
                 logging.error(f"일반 이미지 처리 오류 ({file_path_obj.name}): {e_img}")
-                return QPixmap()
+                return QImage()
+
+    @staticmethod
+    def _source_color_space(icc_profile, file_name):
+        """ICC 프로파일로 원본 색 공간 생성 (없거나 유효하지 않으면 sRGB로 간주)"""
+        if not icc_profile:
+            # 프로파일이 없으면 sRGB로 간주 (웹 표준)
+            return QColorSpace(QColorSpace.SRgb)
+        try:
+            source_color_space = QColorSpace(icc_profile)
+            if not source_color_space.isValid():
+                logging.warning(f"이미지의 ICC 프로파일이 유효하지 않습니다: {file_name}. sRGB로 간주합니다.")
+                source_color_space = QColorSpace(QColorSpace.SRgb)
+            return source_color_space
+        except Exception as e:
+            logging.warning(f"ICC 프로파일로 QColorSpace 생성 실패: {e}. sRGB로 간주합니다.")
+            return QColorSpace(QColorSpace.SRgb)
+
+    def _decode_in_process(self, file_path, full_resolution=False):
+        """프로세스 디코딩 엔진으로 디코딩 후 방향/색 공간을 적용해 캐시에 저장 (실패하면 None)"""
+        with self.pipeline.stage('decode'):
+            result = self.resource_manager.image_decode_pool.decode(
+                file_path, None if full_resolution else self.fit_decode_size)
+        if result is None or result['image'].isNull():
+            return None
+        color_space = self._source_color_space(result['icc_profile'], Path(file_path).name)
+        with self.pipeline.stage('finish'):
+            qimage = ImageConverter._finish(result['image'], result['orientation'], color_space, None)
+        self._add_to_cache(file_path, qimage, result['reduced_from'])
+        return qimage
 
     def set_raw_load_strategy(self, strategy: str):
         """이 ImageLoader 인스턴스의 RAW 처리 방식을 설정합니다 ('preview' 또는 'decode')."""
@@ -3003,47 +5548,34 @@ class ImageLoader(QObject):
         else:
             logging.warning(f"ImageLoader ({id(self)}): 알 수 없는 RAW 처리 방식 '{strategy}'. 변경 안 함. 현재: {self._raw_load_strategy}")
     
-    def _clean_old_decoding_history(self, current_time, max_entries=50):
-        """오래된 디코딩 이력 정리 (메모리 관리)"""
-        if len(self.recently_decoded) <= max_entries:
-            return
-            
-        # 현재 시간으로부터 일정 시간이 지난 항목 제거
-        old_threshold = current_time - (self.decoding_cooldown * 2)
-        keys_to_remove = []
-        
-        for file_name, decode_time in self.recently_decoded.items():
-            if decode_time < old_threshold:
-                keys_to_remove.append(file_name)
-        
-        # 실제 항목 제거
-        for key in keys_to_remove:
-            del self.recently_decoded[key]
-            
-        # 여전히 너무 많은 항목이 있으면 가장 오래된 것부터 제거
-        if len(self.recently_decoded) > max_entries:
-            items = sorted(self.recently_decoded.items(), key=lambda x: x[1])
-            to_remove = items[:len(items) - max_entries]
-            for file_name, _ in to_remove:
-                del self.recently_decoded[file_name]
-
     def preload_page(self, image_files, page_start_index, cells_per_page, strategy_override=None):
         """특정 페이지의 이미지를 미리 로딩"""
         self.last_requested_page = page_start_index // cells_per_page
         for future in self.active_futures:
             future.cancel()
         self.active_futures.clear()
+        if isinstance(image_files, ImageFileTable):
+            path_key = image_files.key
+        else:
+            path_key = lambda i: str(image_files[i])
         end_idx = min(page_start_index + cells_per_page, len(image_files))
         futures = []
         for i in range(page_start_index, end_idx):
             if i < 0 or i >= len(image_files):
                 continue
-            img_path = str(image_files[i])
-            if img_path in self.cache:
-                pixmap = self.cache[img_path]
-                self.imageLoaded.emit(i - page_start_index, pixmap, img_path)
+            img_path = path_key(i)
+            cached_image = self.cache.get_image(img_path)
+            if cached_image is not None:
+                self.imageLoaded.emit(i - page_start_index, cached_image, img_path)
+            elif strategy_override is None and self.uses_raw_decoder(img_path):
+                # 그리드 셀도 탐색/미리 로드와 같은 RawDecoderPool 작업을 공유 (결과는 GUI 스레드에서 셀로 전달)
+                self.submit_raw_decode(img_path, 'high', on_image=lambda image, cell=i - page_start_index, path=img_path:
+                                       self.imageLoaded.emit(cell, image, path))
             else:
-                future = self.load_executor.submit(self._load_and_signal, i - page_start_index, img_path, strategy_override)
+                future = self.resource_manager.submit_imaging_task_with_priority(
+                    'high', self._load_and_signal, i - page_start_index, img_path, strategy_override)
+                if future is None:
+                    continue
                 futures.append(future)
         self.active_futures = futures
         next_page_start = page_start_index + cells_per_page
@@ -3052,32 +5584,55 @@ class ImageLoader(QObject):
             for i in range(next_page_start, next_end):
                 if i >= len(image_files):
                     break
-                img_path = str(image_files[i])
+                img_path = path_key(i)
                 if img_path not in self.cache:
-                    future = self.load_executor.submit(self._preload_image, img_path, strategy_override)
-                    self.active_futures.append(future)
+                    future = self.submit_decode(img_path, 'low', strategy_override=strategy_override)
+                    if future is not None:
+                        self.active_futures.append(future)
     
     def _load_and_signal(self, cell_index, img_path, strategy_override=None):
         """이미지 로드 후 시그널 발생"""
         try:
-            pixmap = self.load_image_with_orientation(img_path, strategy_override=strategy_override)
-            self.imageLoaded.emit(cell_index, pixmap, img_path)
+            image = self.decode_image(img_path, strategy_override=strategy_override)
+            self.imageLoaded.emit(cell_index, image, img_path)
             return True
         except Exception as e:
             logging.error(f"이미지 로드 오류 (인덱스 {cell_index}): {e}")
             return False
     
-    def _preload_image(self, img_path, strategy_override=None):
-        """이미지 미리 로드 (시그널 없음)"""
-        try:
-            self.load_image_with_orientation(img_path, strategy_override=strategy_override)
-            return True
-        except:
-            return False
-    
+    def prefetch(self, file_paths):
+        """
+        미리 로드 대상(순위 순) 중 일반 이미지 파일의 바이트를 I/O 단계에서 미리 읽음 (RAW는 디코더가 직접 읽음).
+        프로세스 디코딩 엔진을 쓰면 디코더 프로세스가 파일을 직접 읽으므로 readahead 힌트만 줍니다.
+        """
+        self.pipeline.prefetch((path for path in file_paths if Path(path).suffix.lower() not in self.raw_extensions),
+                               hint_only=self.resource_manager.image_decode_pool is not None)
+
+    def configure_pipeline(self, folder_paths):
+        """
+        불러온 폴더의 저장장치와 성능 프로필에 맞게 I/O 단계 조정. 네트워크 저장소는 요청 지연을 가리도록 I/O 스레드를 늘리고,
+        준비 큐는 인접 미리 로드 창 크기만큼 보관합니다.
+        """
+        local_workers, network_workers = HardwareProfileManager.get("pipeline_io_workers")
+        network = any(storage_kind(path) == 'network' for path in folder_paths if path)
+        forward_count, backward_count = HardwareProfileManager.get("preload_range_adjacent")
+        self.pipeline.configure(io_workers=network_workers if network else local_workers,
+                                ready_limit=forward_count + backward_count,
+                                ready_bytes_limit=HardwareProfileManager.get("pipeline_ready_mb") * 1024 * 1024)
+        logging.info(f"ImagePipeline 설정: {'네트워크' if network else '로컬'} 저장소, I/O 스레드 {self.pipeline.io_workers}개, "
+                     f"준비 큐 {self.pipeline.ready_limit}개 / {self.pipeline.ready_bytes_limit // (1024 * 1024)}MB")
+
+    def invalidate_paths(self, file_paths):
+        """변경/삭제된 파일의 캐시 항목만 제거 (나머지 캐시는 유지)"""
+        file_paths = [str(file_path) for file_path in file_paths]
+        for file_path in file_paths:
+            self.cache.pop(file_path, None)
+        self.pipeline.discard(file_paths)
+
     def clear_cache(self):
         """캐시 초기화"""
         self.cache.clear()
+        self.pipeline.clear()
         logging.info(f"ImageLoader ({id(self)}): Cache cleared. RAW load strategy '{self._raw_load_strategy}' is preserved.") # 로그 수정
         
         # 활성 로딩 작업도 취소
@@ -3515,9 +6070,9 @@ class FileListDialog(QDialog):
         self.list_widget.setFont(list_font)
 
         # 파일 목록 채우기 (이전 코드 유지)
-        for i, file_path in enumerate(self.image_files):
-            item = QListWidgetItem(file_path.name)
-            item.setData(Qt.UserRole, str(file_path))
+        for i in range(len(self.image_files)):
+            item = QListWidgetItem(self.image_files.name(i))
+            item.setData(Qt.UserRole, self.image_files.key(i))
             self.list_widget.addItem(item)
 
         # 현재 항목 선택 및 스크롤 (이전 코드 유지)
@@ -3801,19 +6356,561 @@ def format_camera_name(make, model):
         return model_str
     return f"{make_str} {model_str}".strip()
 
+# --- 헤더 전용 촬영 시간 추출 (정렬 키 전용) ---
+# 파일 전체가 아닌 앞부분/TIFF IFD 체인만 읽어 DateTimeOriginal/SubSecTimeOriginal만 파싱합니다.
+_EXIF_HEADER_READ_SIZE = 64 * 1024
+_TIFF_TAG_DATETIME = 0x0132
+_TIFF_TAG_EXIF_IFD = 0x8769
+_EXIF_TAG_DATETIME_ORIGINAL = 0x9003
+_EXIF_TAG_SUBSEC_ORIGINAL = 0x9291
+
+
+def _read_tiff_ifd(f, tiff_base, ifd_offset, endian):
+    """TIFF IFD 하나를 읽어 {태그: (타입, 개수, 값/오프셋 4바이트)}를 반환합니다."""
+    f.seek(tiff_base + ifd_offset)
+    count_bytes = f.read(2)
+    if len(count_bytes) < 2:
+        return {}
+    entry_count = struct.unpack(endian + 'H', count_bytes)[0]
+    if entry_count == 0 or entry_count > 1000:  # 손상된 IFD 방어
+        return {}
+    data = f.read(entry_count * 12)
+    entries = {}
+    for i in range(len(data) // 12):
+        tag, field_type, count = struct.unpack(endian + 'HHI', data[i * 12:i * 12 + 8])
+        entries[tag] = (field_type, count, data[i * 12 + 8:i * 12 + 12])
+    return entries
+
+
+def _read_tiff_ascii(f, tiff_base, entry, endian):
+    """ASCII(타입 2) IFD 항목의 문자열 값을 읽습니다."""
+    if not entry or entry[0] != 2 or entry[1] == 0 or entry[1] > 64:
+        return None
+    _, count, raw_value = entry
+    if count <= 4:
+        value = raw_value[:count]
+    else:
+        f.seek(tiff_base + struct.unpack(endian + 'I', raw_value)[0])
+        value = f.read(count)
+    return value.split(b'\x00', 1)[0].decode('ascii', errors='ignore').strip()
+
+
+def _read_tiff_capture_datetime(f, tiff_base, first_ifd_is_exif=False):
+    """tiff_base 위치의 TIFF 헤더부터 IFD0 -> Exif IFD를 따라 촬영 시간 문자열들을 읽습니다."""
+    f.seek(tiff_base)
+    header = f.read(8)
+    if len(header) < 8 or header[:2] not in (b'II', b'MM'):
+        return None, None
+    endian = '<' if header[:2] == b'II' else '>'
+    first_ifd = struct.unpack(endian + 'I', header[4:8])[0]
+    ifd0 = _read_tiff_ifd(f, tiff_base, first_ifd, endian)
+    if first_ifd_is_exif:  # CR3 CMT2 박스는 Exif IFD가 바로 나옴
+        exif_ifd = ifd0
+    else:
+        exif_ifd = {}
+        exif_pointer = ifd0.get(_TIFF_TAG_EXIF_IFD)
+        if exif_pointer:
+            exif_ifd = _read_tiff_ifd(f, tiff_base, struct.unpack(endian + 'I', exif_pointer[2])[0], endian)
+    datetime_str = _read_tiff_ascii(f, tiff_base, exif_ifd.get(_EXIF_TAG_DATETIME_ORIGINAL), endian)
+    subsec_str = _read_tiff_ascii(f, tiff_base, exif_ifd.get(_EXIF_TAG_SUBSEC_ORIGINAL), endian)
+    if not datetime_str and not first_ifd_is_exif:
+        datetime_str = _read_tiff_ascii(f, tiff_base, ifd0.get(_TIFF_TAG_DATETIME), endian)
+    return datetime_str, subsec_str
+
+
+def _find_jpeg_exif_tiff_base(f, jpeg_base=0):
+    """JPEG 마커를 따라가며 APP1(Exif) 세그먼트의 TIFF 헤더 위치를 찾습니다."""
+    f.seek(jpeg_base)
+    if f.read(2) != b'\xff\xd8':
+        return None
+    position = jpeg_base + 2
+    while position - jpeg_base < _EXIF_HEADER_READ_SIZE:
+        f.seek(position)
+        marker = f.read(4)
+        if len(marker) < 4 or marker[0] != 0xFF:
+            return None
+        marker_type = marker[1]
+        segment_length = struct.unpack('>H', marker[2:4])[0]
+        if marker_type == 0xE1:
+            if f.read(6) == b'Exif\x00\x00':
+                return position + 10
+        elif marker_type in (0xDA, 0xD9):  # 스캔 데이터 시작 -> EXIF 없음
+            return None
+        position += 2 + segment_length
+    return None
+
+
+def read_capture_datetime_header(file_path):
+    """
+    파일 헤더만 읽어 촬영 시간(DateTimeOriginal + SubSecTimeOriginal)을 datetime으로 반환합니다.
+    JPEG, TIFF 기반 RAW(CR2/NEF/ARW/DNG/ORF/RW2/PEF 등), CR3, RAF를 지원하며 실패 시 None을 반환합니다.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(96)
+            datetime_str = subsec_str = None
+            if head[:2] == b'\xff\xd8':
+                tiff_base = _find_jpeg_exif_tiff_base(f)
+                if tiff_base is not None:
+                    datetime_str, subsec_str = _read_tiff_capture_datetime(f, tiff_base)
+            elif head[:2] in (b'II', b'MM'):
+                datetime_str, subsec_str = _read_tiff_capture_datetime(f, 0)
+            elif head[:16] == b'FUJIFILMCCD-RAW ' and len(head) >= 92:
+                jpeg_offset = struct.unpack('>I', head[84:88])[0]
+                tiff_base = _find_jpeg_exif_tiff_base(f, jpeg_offset)
+                if tiff_base is not None:
+                    datetime_str, subsec_str = _read_tiff_capture_datetime(f, tiff_base)
+            elif head[4:8] == b'ftyp' and head[8:12] == b'crx ':
+                f.seek(0)
+                block = f.read(_EXIF_HEADER_READ_SIZE)
+                box_index = block.find(b'CMT2')
+                if box_index > 4:
+                    datetime_str, subsec_str = _read_tiff_capture_datetime(f, box_index + 4, first_ifd_is_exif=True)
+                if not datetime_str:
+                    box_index = block.find(b'CMT1')
+                    if box_index > 4:
+                        datetime_str, _ = _read_tiff_capture_datetime(f, box_index + 4)
+            if not datetime_str:
+                return None
+            capture_dt = datetime.strptime(datetime_str[:19], '%Y:%m:%d %H:%M:%S')
+            if subsec_str and subsec_str.isdigit():
+                capture_dt = capture_dt.replace(microsecond=int(subsec_str[:6].ljust(6, '0')))
+            return capture_dt
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+class SortKeyExtractor:
+    """
+    폴더 스캔 시 정렬 키(촬영 시간)를 추출하는 단계.
+    카탈로그 -> 헤더 파싱 -> 기존 느린 경로(fallback) 순으로 시도하며, 저장장치 종류에 맞춰 크기가 정해진 스레드 풀에서 병렬로 실행됩니다.
+    """
+    def __init__(self, metadata_catalog=None, fallback_func=None):
+        self.metadata_catalog = metadata_catalog
+        self.fallback_func = fallback_func  # 헤더 파싱 실패 시 사용할 함수 (Path -> datetime)
+
+    @classmethod
+    def worker_count_for(cls, folder_path):
+        """폴더가 위치한 저장장치에 맞는 동시 작업 수를 결정합니다 (네트워크는 지연 시간 위주라 더 깊은 큐 사용)."""
+        cores = HardwareProfileManager._cpu_cores or cpu_count()
+        local_workers = max(4, min(16, cores * 2))
+        kind = storage_kind(folder_path)
+        if kind == 'network':
+            return 16
+        if kind == 'removable':
+            return 4  # 카드 리더 등 큐 깊이가 얕은 장치
+        return local_workers
+
+    def _extract_one(self, file_path, stat_key=None):
+        """단일 파일의 정렬 키 추출 (워커 스레드에서 실행)"""
+        path_str = str(file_path)
+        catalog = self.metadata_catalog
+        if catalog and catalog.available:
+            if stat_key is None:
+                stat_key = MetadataCatalog.stat_key(path_str)
+            if stat_key is not None:
+                cached_dt = catalog.get_capture_datetime(path_str, stat_key)
+                if cached_dt is not None:
+                    return cached_dt
+        capture_dt = read_capture_datetime_header(path_str)
+        if capture_dt is None:
+            if self.fallback_func is not None:
+                return self.fallback_func(Path(file_path))  # fallback이 카탈로그 저장까지 처리
+            try:
+                capture_dt = datetime.fromtimestamp(os.stat(path_str).st_mtime)
+            except OSError:
+                capture_dt = datetime.min
+        if catalog and stat_key is not None:
+            catalog.put_capture_datetime(path_str, capture_dt, stat_key)
+        return capture_dt
+
+    def extract(self, file_paths, folder_path=None, is_running=None, stat_keys=None):
+        """
+        여러 파일의 정렬 키를 병렬로 추출하여 {경로: datetime}을 반환합니다.
+        is_running 콜백이 False를 반환하면 남은 작업을 취소하고 None을 반환합니다.
+        stat_keys({경로: (크기, 수정시간 ns)})가 주어지면 stat 호출을 생략합니다.
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return {}
+        stat_keys = stat_keys or {}
+        if folder_path is None:
+            folder_path = Path(file_paths[0]).parent
+        worker_count = min(self.worker_count_for(folder_path), len(file_paths))
+        keys = {}
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, worker_count), thread_name_prefix="SortKey") as executor:
+            futures = {executor.submit(self._extract_one, path, stat_keys.get(str(path))): path for path in file_paths}
+            for future in as_completed(futures):
+                if is_running is not None and not is_running():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return None
+                path = futures[future]
+                try:
+                    keys[path] = future.result()
+                except Exception as e:
+                    logging.debug(f"정렬 키 추출 실패 ({Path(path).name}): {e}")
+                    keys[path] = datetime.min
+        if self.metadata_catalog:
+            self.metadata_catalog.flush()
+        logging.info(f"정렬 키 추출 완료: {len(keys)}개 파일, 워커 {worker_count}개, {time.time() - start_time:.2f}초")
+        return keys
+
+    def sort_files(self, file_paths, folder_path=None, is_running=None, stat_keys=None, keys_out=None):
+        """촬영 시간 순으로 정렬된 목록을 반환합니다 (중단 시 None). keys_out이 주어지면 추출한 정렬 키를 채워 넣습니다."""
+        file_paths = list(file_paths)
+        keys = self.extract(file_paths, folder_path, is_running, stat_keys)
+        if keys is None:
+            return None
+        if keys_out is not None:
+            keys_out.update(keys)
+        return sorted(file_paths, key=lambda path: (keys[path], Path(path).name))
+
+
+class FolderScanner:
+    """
+    os.scandir 기반 단일 패스 폴더 스캐너.
+    DirEntry에 캐시된 파일 종류/stat 정보를 그대로 사용하여 한 번의 디렉토리 순회로
+    이미지/RAW/기타 파일을 분류하고, 하위 캐시(메타데이터 카탈로그)에 쓸 (크기, 수정시간 ns)를 함께 돌려줍니다.
+    """
+
+    @staticmethod
+    def iter_files(folder_path, extensions=None, is_running=None):
+        """
+        폴더의 파일을 (Path, 소문자 확장자, (크기, 수정시간 ns)) 형태로 순회합니다.
+        extensions가 주어지면 해당 확장자만 반환하며, 제외되는 항목은 stat을 호출하지 않습니다.
+        is_running()이 False를 반환하면 순회를 중단합니다.
+        """
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if is_running is not None and not is_running():
+                    return
+                ext = os.path.splitext(entry.name)[1].lower()
+                if extensions is not None and ext not in extensions:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield Path(entry.path), ext, (st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def scan(folder_path, image_extensions=(), raw_extensions=(), is_running=None, collect_dirs=False, sidecar_extensions=()):
+        """
+        폴더를 한 번 순회하여 파일을 분류합니다 (RAW 확장자 우선).
+        반환: {'image_files', 'raw_files', 'sidecar_files', 'other_count', 'stat_keys', 'subdirs'} - stat_keys는 {str(경로): (크기, 수정시간 ns)}
+        collect_dirs=True이면 하위 폴더 목록도 수집합니다 (심볼릭 링크와 숨김 폴더 제외).
+        sidecar_extensions의 파일(XMP 등)은 짝 매칭용으로 stat 없이 sidecar_files에 모읍니다.
+        폴더를 읽을 수 없으면 OSError가 그대로 전달됩니다.
+        """
+        image_files = []
+        raw_files = []
+        sidecar_files = []
+        other_count = 0
+        stat_keys = {}
+        subdirs = []
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if is_running is not None and not is_running():
+                    break
+                if collect_dirs and not entry.name.startswith('.'):
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in raw_extensions:
+                    target = raw_files
+                elif ext in image_extensions:
+                    target = image_files
+                elif ext in sidecar_extensions:
+                    sidecar_files.append(Path(entry.path))
+                    continue
+                else:
+                    other_count += 1  # 기타 파일/폴더는 stat 없이 개수만 셈
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                file_path = Path(entry.path)
+                target.append(file_path)
+                stat_keys[str(file_path)] = (st.st_size, st.st_mtime_ns)
+        return {
+            'image_files': image_files,
+            'raw_files': raw_files,
+            'sidecar_files': sidecar_files,
+            'other_count': other_count,
+            'stat_keys': stat_keys,
+            'subdirs': subdirs,
+        }
+
+    @staticmethod
+    def has_files(folder_path, extensions):
+        """해당 확장자의 파일이 하나라도 있는지 확인 (첫 일치에서 즉시 반환, stat 호출 없음)"""
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() in extensions:
+                    try:
+                        if entry.is_file():
+                            return True
+                    except OSError:
+                        continue
+        return False
+
+
+class RawPairIndex:
+    """
+    이미지 ↔ RAW/사이드카 짝 매칭을 위한 해시 조인 인덱스.
+    파일명(확장자 제외)을 casefold로 정규화한 키로 묶으므로 대소문자만 다른 이름도 짝이 되고,
+    한 이미지에 여러 RAW 변형(예: CR3 + DNG)과 XMP 사이드카가 모두 연결됩니다.
+    스캔 중 발견하는 순서대로 add()를 호출하면 되며, 이미지와 동반 파일 중 어느 쪽이 먼저 와도 같은 버킷에서 만납니다.
+    """
+
+    SIDECAR_EXTENSIONS = frozenset({'.xmp'})
+    SECONDARY_RAW_EXTENSIONS = frozenset({'.dng'})  # 다른 RAW와 함께 있으면 보조 변형으로 취급
+
+    def __init__(self, raw_extensions, image_extensions=(), per_folder=False):
+        self.raw_extensions = frozenset(ext.lower() for ext in raw_extensions)
+        self.image_extensions = frozenset(ext.lower() for ext in image_extensions)
+        self.per_folder = per_folder  # 라이브러리 모드: 같은 폴더 안에서만 매칭
+        self._image_keys = set()
+        self._companions = {}         # 정규화 키 → [동반 파일 경로]
+
+    @staticmethod
+    def normalize_key(path, per_folder=False):
+        """짝 매칭 키 (casefold된 파일명, per_folder이면 폴더 경로 포함)"""
+        path = Path(path)
+        stem = path.stem.casefold()
+        if per_folder:
+            return os.path.join(os.path.normcase(str(path.parent)), stem)
+        return stem
+
+    def _companion_key(self, path, ext):
+        """동반 파일의 키 (IMG_0001.CR3.xmp처럼 원본 확장자를 포함한 사이드카 이름도 처리)"""
+        if ext in self.SIDECAR_EXTENSIONS:
+            inner_stem, inner_ext = os.path.splitext(path.stem)
+            if inner_ext.lower() in self.raw_extensions or inner_ext.lower() in self.image_extensions:
+                path = path.with_name(inner_stem + ext)
+        return self.normalize_key(path, self.per_folder)
+
+    def add_image(self, image_path):
+        self._image_keys.add(self.normalize_key(image_path, self.per_folder))
+
+    def add_companion(self, file_path, ext=None):
+        file_path = Path(file_path)
+        ext = ext if ext is not None else file_path.suffix.lower()
+        self._companions.setdefault(self._companion_key(file_path, ext), []).append(file_path)
+
+    def _companion_rank(self, file_path):
+        """기본 RAW → 보조 RAW(DNG) → 사이드카 순서"""
+        ext = file_path.suffix.lower()
+        if ext in self.SIDECAR_EXTENSIONS:
+            tier = 2
+        elif ext in self.SECONDARY_RAW_EXTENSIONS:
+            tier = 1
+        else:
+            tier = 0
+        return tier, file_path.name.casefold()
+
+    def pairs(self):
+        """
+        조인 결과 반환: (raw_files, paired_files)
+        raw_files: {키: 기본 RAW 경로} - 표시/RAW 디코딩에 쓰는 대표 RAW
+        paired_files: {키: [동반 파일 경로]} - 기본 RAW가 맨 앞이며, 이미지를 옮길 때 모두 함께 이동
+        """
+        raw_files = {}
+        paired_files = {}
+        for key, companions in self._companions.items():
+            if key not in self._image_keys:
+                continue
+            companions.sort(key=self._companion_rank)
+            paired_files[key] = companions
+            if companions[0].suffix.lower() in self.raw_extensions:
+                raw_files[key] = companions[0]
+        return raw_files, paired_files
+
+
+class LibraryWalker:
+    """
+    라이브러리 모드: 하나 이상의 루트 폴더 아래 전체 트리(예: YYYY/MM-DD/card1)를 병렬로 순회합니다.
+    폴더 하나가 작업 단위이며, 발견한 하위 폴더는 바로 워커 풀에 다시 제출됩니다.
+    RAW/사이드카 매칭은 같은 폴더 안에서만 이루어지므로 카드마다 같은 파일명이 있어도 섞이지 않습니다.
+    """
+
+    def __init__(self, image_extensions, raw_extensions, metadata_catalog=None):
+        self.image_extensions = set(image_extensions)
+        self.raw_extensions = set(raw_extensions)
+        self.metadata_catalog = metadata_catalog
+
+    def _scan_directory(self, folder_path, root):
+        """폴더 하나를 스캔하고 같은 폴더의 RAW/사이드카를 매칭 (워커 스레드에서 실행)"""
+        scan_result = FolderScanner.scan(folder_path, self.image_extensions, self.raw_extensions, collect_dirs=True,
+                                         sidecar_extensions=RawPairIndex.SIDECAR_EXTENSIONS)
+        if self.metadata_catalog and scan_result['image_files']:
+            self.metadata_catalog.prefetch_folder(folder_path)
+        pair_index = RawPairIndex(self.raw_extensions, self.image_extensions, per_folder=True)
+        for image_path in scan_result['image_files']:
+            pair_index.add_image(image_path)
+        for companion_path in scan_result['raw_files'] + scan_result['sidecar_files']:
+            pair_index.add_companion(companion_path)
+        scan_result['raw_pairs'], scan_result['paired_files'] = pair_index.pairs()
+        scan_result['root'] = root
+        return scan_result
+
+    def walk(self, roots, is_running=None):
+        """
+        루트 폴더들을 순회하여 폴더별 스캔 결과 목록을 반환합니다 (중단 시 None).
+        중첩된 루트나 같은 폴더는 한 번만 스캔합니다.
+        """
+        roots = [str(root) for root in roots if root and os.path.isdir(root)]
+        if not roots:
+            return []
+        worker_count = SortKeyExtractor.worker_count_for(roots[0])
+        visited = set()
+        results = []
+        start_time = time.time()
+
+        def visit_key(folder_path):
+            return os.path.normcase(os.path.realpath(folder_path))
+
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="LibraryWalk") as executor:
+            pending = set()
+            futures = {}
+
+            def submit(folder_path, root):
+                key = visit_key(folder_path)
+                if key in visited:
+                    return
+                visited.add(key)
+                future = executor.submit(self._scan_directory, folder_path, root)
+                futures[future] = folder_path
+                pending.add(future)
+
+            for root in roots:
+                submit(root, root)
+            while pending:
+                if is_running is not None and not is_running():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return None
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    folder_path = futures.pop(future)
+                    try:
+                        scan_result = future.result()
+                    except OSError as e:
+                        logging.warning(f"라이브러리 폴더 스캔 실패 ({folder_path}): {e}")
+                        continue
+                    scan_result['dir'] = folder_path
+                    results.append(scan_result)
+                    for subdir in scan_result['subdirs']:
+                        submit(subdir, scan_result['root'])
+
+        logging.info(f"라이브러리 탐색 완료: 루트 {len(roots)}개, 폴더 {len(results)}개, "
+                     f"이미지 {sum(len(r['image_files']) for r in results)}개, 워커 {worker_count}개, {time.time() - start_time:.2f}초")
+        return results
+
+
+class FolderWatcher(QObject):
+    """
+    로드된 폴더의 변경(생성/삭제/이름 변경)을 QFileSystemWatcher로 감지합니다.
+    연속으로 발생하는 이벤트는 디바운스하여 한 번만 처리하고, 스캔은 백그라운드 스레드에서 실행한 뒤
+    결과를 changesReady 시그널로 UI 스레드에 전달합니다.
+    """
+    DEBOUNCE_MS = 400     # 마지막 이벤트 후 대기 시간
+    MAX_DELAY_MS = 2000   # 이벤트가 계속 이어져도 이 시간 안에는 한 번 반영
+
+    changesReady = Signal(int, dict)  # (감시 세대, 스캔 결과)
+
+    def __init__(self, build_scan_task, parent=None):
+        super().__init__(parent)
+        self.build_scan_task = build_scan_task  # UI 스레드에서 호출, 백그라운드에서 실행할 함수(또는 None) 반환
+        self.generation = 0                     # 감시 대상이 바뀔 때마다 증가 (이전 결과 무시용)
+        self._first_event_time = None
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._flush)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FolderWatch")
+
+    def set_paths(self, paths):
+        """감시할 폴더 목록 설정 (빈 목록이면 감시 해제)"""
+        paths = [str(path) for path in paths if path and Path(path).is_dir()]
+        if sorted(paths) == sorted(self._watcher.directories()):
+            return
+        self.generation += 1
+        self._debounce_timer.stop()
+        self._first_event_time = None
+        if self._watcher.directories():
+            self._watcher.removePaths(self._watcher.directories())
+        if paths:
+            self._watcher.addPaths(paths)
+            logging.info(f"폴더 자동 감지 시작: {paths}")
+
+    def _on_directory_changed(self, path):
+        """이벤트마다 타이머를 재시작하되, 첫 이벤트 후 MAX_DELAY_MS가 지나면 바로 처리"""
+        now = time.time()
+        if self._first_event_time is None:
+            self._first_event_time = now
+        elapsed_ms = (now - self._first_event_time) * 1000
+        self._debounce_timer.start(max(0, min(self.DEBOUNCE_MS, int(self.MAX_DELAY_MS - elapsed_ms))))
+
+    def _flush(self):
+        """모아둔 이벤트를 한 번의 백그라운드 스캔으로 처리"""
+        self._first_event_time = None
+        scan_task = self.build_scan_task()
+        if scan_task is None:
+            return
+        generation = self.generation
+        self._executor.submit(self._run_scan, scan_task, generation)
+
+    def _run_scan(self, scan_task, generation):
+        """백그라운드 스레드에서 스캔 실행"""
+        try:
+            result = scan_task()
+        except Exception as e:
+            logging.warning(f"폴더 자동 감지 스캔 실패: {e}")
+            return
+        if generation == self.generation:
+            self.changesReady.emit(generation, result)
+
+    def shutdown(self):
+        """감시 해제 및 스캔 스레드 종료"""
+        self.generation += 1
+        self._debounce_timer.stop()
+        if self._watcher.directories():
+            self._watcher.removePaths(self._watcher.directories())
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class FolderLoaderWorker(QObject):
     """백그라운드 스레드에서 폴더 스캔, 파일 매칭, 정렬 작업을 수행하는 워커"""
-    startProcessing = Signal(str, str, str, list, list)
+    STREAM_FIRST_BATCH_SIZE = 48   # 첫 화면을 빨리 띄우기 위한 첫 배치 크기
+    STREAM_BATCH_SIZE = 512        # 이후 배치 크기
+
+    startProcessing = Signal(str, str, str, list, list, bool, int)
     
-    finished = Signal(list, dict, str, str, str)
+    finished = Signal(int, list, dict, str, str, str, dict, dict, dict)  # (로드 ID, ..., 정렬 키 {Path: datetime}, 스냅샷 {str 경로: (크기, 수정시간 ns)}, 짝 파일 {키: [경로]})
     progress = Signal(str)
     error = Signal(str, str)
+    batchReady = Signal(int, list, list)  # 스트리밍 로드: (로드 ID, 배치 내 정렬된 파일 목록, 정렬 키 목록)
+    cancelled = Signal(int)               # 사용자 취소로 중단됨 (로드 ID)
 
-    def __init__(self, raw_extensions, get_datetime_func):
+    def __init__(self, raw_extensions, sort_key_extractor, metadata_catalog=None):
         super().__init__()
         self.raw_extensions = raw_extensions
-        self.get_datetime_from_file_fast = get_datetime_func
+        self.sort_key_extractor = sort_key_extractor
+        self.metadata_catalog = metadata_catalog
         self._is_running = True
+        self._cancel_requested = False
         
         self.startProcessing.connect(self.process_folders)
 
@@ -3821,45 +6918,170 @@ class FolderLoaderWorker(QObject):
     def stop(self):
         self._is_running = False
 
-    @Slot(str, str, str, list, list)
-    def process_folders(self, jpg_folder_path, raw_folder_path, mode, raw_file_list_from_main, supported_extensions):
-        """메인 처리 함수 (mode에 따라 분기)"""
+    def cancel(self):
+        """사용자 취소 요청 (메인 스레드에서 호출, 진행 중인 스캔/정렬을 가능한 빨리 중단)"""
+        self._cancel_requested = True
+        self._is_running = False
+
+    def _abort(self, load_id):
+        """중단 처리: 사용자 취소인 경우에만 cancelled 시그널 전송"""
+        if self._cancel_requested:
+            logging.info(f"폴더 로딩 취소됨 (로드 ID: {load_id})")
+            self.cancelled.emit(load_id)
+
+    def _emit_stream_batch(self, batch, folder_path, load_id, sort_keys, stat_keys=None):
+        """배치의 정렬 키를 추출해 정렬된 상태로 전송합니다. 중단 시 False 반환."""
+        keys = self.sort_key_extractor.extract(batch, folder_path, is_running=lambda: self._is_running,
+                                               stat_keys=stat_keys)
+        if keys is None or not self._is_running:
+            return False
+        sort_keys.update(keys)
+        batch = sorted(batch, key=lambda path: (keys[path], path.name))
+        self.batchReady.emit(load_id, batch, [keys[path] for path in batch])
+        return True
+
+    def _stream_sort(self, file_paths, folder_path, load_id, sort_keys, stat_keys=None):
+        """파일 목록을 배치 단위로 정렬 키 추출/전송 후 전체 정렬 결과를 반환합니다 (중단 시 None)."""
+        batch_size = self.STREAM_FIRST_BATCH_SIZE
+        pending = []
+        for file_path in file_paths:
+            pending.append(file_path)
+            if len(pending) >= batch_size:
+                if not self._emit_stream_batch(pending, folder_path, load_id, sort_keys, stat_keys):
+                    return None
+                pending = []
+                batch_size = self.STREAM_BATCH_SIZE
+        if pending and not self._emit_stream_batch(pending, folder_path, load_id, sort_keys, stat_keys):
+            return None
+        return sorted(file_paths, key=lambda path: (sort_keys[path], path.name))
+
+    @Slot(str, str, str, list, list, bool, int)
+    def process_folders(self, jpg_folder_path, raw_folder_path, mode, raw_file_list_from_main, supported_extensions,
+                        streaming=False, load_id=0):
+        """메인 처리 함수 (mode에 따라 분기)
+        streaming=True이면 스캔 중 발견한 파일을 batchReady로 나누어 보내 첫 이미지를 먼저 표시할 수 있게 합니다.
+        mode가 'library'이면 raw_file_list_from_main에 라이브러리 루트 폴더 목록이 전달됩니다.
+        """
         self._is_running = True
+        self._cancel_requested = False
         try:
             image_files = []
             raw_files = {}
+            paired_files = {}
+            sort_keys = {}
+            stat_keys = {}
+
+            # 카탈로그에서 폴더의 기존 메타데이터를 한 번에 불러와 정렬 시 파일 접근을 피함
+            if self.metadata_catalog:
+                self.metadata_catalog.prefetch_folder(jpg_folder_path)
+
+            if mode == 'library':
+                self.progress.emit(LanguageManager.translate("라이브러리 폴더 탐색 중..."))
+                walker = LibraryWalker(supported_extensions, self.raw_extensions, self.metadata_catalog)
+                dir_results = walker.walk(raw_file_list_from_main, is_running=lambda: self._is_running)
+                if dir_results is None: return self._abort(load_id)
+                library_files = []
+                for dir_result in dir_results:
+                    library_files.extend(dir_result['image_files'])
+                    stat_keys.update(dir_result['stat_keys'])
+                    raw_files.update(dir_result['raw_pairs'])
+                    paired_files.update(dir_result['paired_files'])
+                if not library_files:
+                    self.error.emit(LanguageManager.translate("선택한 폴더에 지원하는 이미지 파일이 없습니다."), LanguageManager.translate("경고"))
+                    return
+                self.progress.emit(LanguageManager.translate("파일 정렬 중..."))
+                if streaming:
+                    image_files = self._stream_sort(library_files, jpg_folder_path, load_id, sort_keys, stat_keys)
+                else:
+                    image_files = self.sort_key_extractor.sort_files(
+                        library_files, jpg_folder_path, is_running=lambda: self._is_running,
+                        stat_keys=stat_keys, keys_out=sort_keys)
+                if image_files is None: return self._abort(load_id)
 
-            if mode == 'raw_only':
+            elif mode == 'raw_only':
                 self.progress.emit(LanguageManager.translate("RAW 파일 정렬 중..."))
-                image_files = sorted(raw_file_list_from_main, key=self.get_datetime_from_file_fast)
+                raw_file_list = [Path(p) for p in raw_file_list_from_main]
+                # 증분 새로고침이 제자리 변경을 감지할 수 있도록 스냅샷(크기, 수정시간)도 채움
+                for raw_path in raw_file_list:
+                    if not self._is_running: return self._abort(load_id)
+                    try:
+                        st = raw_path.stat()
+                    except OSError:
+                        continue
+                    stat_keys[str(raw_path)] = (st.st_size, st.st_mtime_ns)
+                if streaming:
+                    image_files = self._stream_sort(raw_file_list, jpg_folder_path, load_id, sort_keys, stat_keys)
+                else:
+                    image_files = self.sort_key_extractor.sort_files(
+                        raw_file_list, jpg_folder_path, is_running=lambda: self._is_running,
+                        stat_keys=stat_keys, keys_out=sort_keys)
+                if image_files is None: return self._abort(load_id)
             
             else: # 'jpg_with_raw' or 'jpg_only'
                 self.progress.emit(LanguageManager.translate("이미지 파일 스캔 중..."))
-                target_path = Path(jpg_folder_path)
+                # RAW 폴더가 JPG 폴더와 같으면 한 번의 순회로 RAW까지 함께 수집
+                same_raw_folder = (mode == 'jpg_with_raw' and raw_folder_path
+                                   and os.path.normcase(os.path.abspath(raw_folder_path)) == os.path.normcase(os.path.abspath(jpg_folder_path)))
+                # RAW/사이드카 짝 매칭은 스캔 중에 해시 조인으로 처리 (이미지 옆의 XMP도 함께 수집)
+                pair_index = (RawPairIndex(self.raw_extensions, supported_extensions)
+                              if mode == 'jpg_with_raw' and raw_folder_path else None)
+                scan_extensions = set(supported_extensions)
+                if pair_index is not None:
+                    scan_extensions |= RawPairIndex.SIDECAR_EXTENSIONS
+                if same_raw_folder:
+                    scan_extensions |= self.raw_extensions
                 temp_image_files = []
-                for file_path in target_path.iterdir():
-                    if not self._is_running: return
-                    if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                        temp_image_files.append(file_path)
+                pending = []
+                batch_size = self.STREAM_FIRST_BATCH_SIZE
+                for file_path, ext, stat_key in FolderScanner.iter_files(
+                        jpg_folder_path, scan_extensions, is_running=lambda: self._is_running):
+                    if ext not in supported_extensions:
+                        pair_index.add_companion(file_path, ext)
+                        continue
+                    if pair_index is not None:
+                        pair_index.add_image(file_path)
+                    temp_image_files.append(file_path)
+                    stat_keys[str(file_path)] = stat_key
+                    if streaming:
+                        # 스캔이 끝나기 전에 발견한 파일부터 배치로 전송
+                        pending.append(file_path)
+                        if len(pending) >= batch_size:
+                            if not self._emit_stream_batch(pending, jpg_folder_path, load_id, sort_keys, stat_keys):
+                                return self._abort(load_id)
+                            pending = []
+                            batch_size = self.STREAM_BATCH_SIZE
+                if not self._is_running: return self._abort(load_id)
                 
                 if not temp_image_files:
                     self.error.emit(LanguageManager.translate("선택한 폴더에 지원하는 이미지 파일이 없습니다."), LanguageManager.translate("경고"))
                     return
 
-                self.progress.emit(LanguageManager.translate("파일 정렬 중..."))
-                image_files = sorted(temp_image_files, key=self.get_datetime_from_file_fast)
+                if streaming:
+                    if pending and not self._emit_stream_batch(pending, jpg_folder_path, load_id, sort_keys, stat_keys):
+                        return self._abort(load_id)
+                    image_files = sorted(temp_image_files, key=lambda path: (sort_keys[path], path.name))
+                else:
+                    self.progress.emit(LanguageManager.translate("파일 정렬 중..."))
+                    image_files = self.sort_key_extractor.sort_files(
+                        temp_image_files, jpg_folder_path, is_running=lambda: self._is_running,
+                        stat_keys=stat_keys, keys_out=sort_keys)
+                    if image_files is None: return self._abort(load_id)
 
-                if mode == 'jpg_with_raw' and raw_folder_path:
+                if pair_index is not None:
                     self.progress.emit(LanguageManager.translate("RAW 파일 매칭 중..."))
-                    jpg_filenames = {f.stem: f for f in image_files}
-                    for file_path in Path(raw_folder_path).iterdir():
-                        if not self._is_running: return
-                        if file_path.is_file() and file_path.suffix.lower() in self.raw_extensions:
-                            if file_path.stem in jpg_filenames:
-                                raw_files[file_path.stem] = file_path
+                    if not same_raw_folder:
+                        companion_extensions = self.raw_extensions | RawPairIndex.SIDECAR_EXTENSIONS
+                        for file_path, ext, _ in FolderScanner.iter_files(
+                                raw_folder_path, companion_extensions, is_running=lambda: self._is_running):
+                            pair_index.add_companion(file_path, ext)
+                        if not self._is_running: return self._abort(load_id)
+                    raw_files, paired_files = pair_index.pairs()
             
-            if not self._is_running: return
-            self.finished.emit(image_files, raw_files, jpg_folder_path, raw_folder_path, mode)
+            if self.metadata_catalog:
+                self.metadata_catalog.flush()
+
+            if not self._is_running: return self._abort(load_id)
+            self.finished.emit(load_id, image_files, raw_files, jpg_folder_path, raw_folder_path, mode, sort_keys, stat_keys, paired_files)
 
         except Exception as e:
             logging.error(f"백그라운드 폴더 로딩 중 오류: {e}")
@@ -3867,6 +7089,18 @@ class FolderLoaderWorker(QObject):
 
 class PhotoSortApp(QMainWindow):
     STATE_FILE = "photosort_data.json" # 상태 저장 파일 이름 정의
+    NAVIGATION_TASK_GROUP = "navigation" # 인접 이미지 미리 로드 작업 그룹 (이동할 때마다 세대 전환)
+    RAW_FULL_DECODE_DELAY_MS = 400 # RAW 빠른 단계 표시 후 원본 품질 디코딩을 시작하기까지 대기 (빠르게 넘길 때 낭비 방지)
+
+    @property
+    def image_files(self):
+        """현재 세션의 이미지 목록 (ThumbnailModel과 공유하는 ImageFileTable)"""
+        return self._image_table
+
+    @image_files.setter
+    def image_files(self, files):
+        # 리스트를 대입하면 새 테이블로 변환 (기존 리스트 대입과 같은 값 의미)
+        self._image_table = files if isinstance(files, ImageFileTable) else ImageFileTable(files)
     
     # 단축키 정의 (두 함수에서 공통으로 사용)
     SHORTCUT_DEFINITIONS = [
@@ -3911,8 +7145,13 @@ class PhotoSortApp(QMainWindow):
         self.supported_image_extensions = {
             '.jpg', '.jpeg'
         }
-        self.raw_files = {}  # 키: 기본 파일명, 값: RAW 파일 경로
+        self.raw_files = {}  # 키: 정규화된 파일명(raw_pair_key), 값: 기본 RAW 파일 경로
+        self.paired_files = {}  # 키: raw_pair_key, 값: 함께 이동할 RAW 변형/사이드카 경로 목록 (기본 RAW가 맨 앞)
         self.is_raw_only_mode = False # RAW 단독 로드 모드인지 나타내는 플래그
+        self.is_library_mode = False # 하위 폴더 포함 라이브러리 모드인지 나타내는 플래그
+        self.library_roots = [] # 라이브러리 모드의 루트 폴더 목록
+        self._pending_library_roots = [] # 로딩 중인 라이브러리 루트 (완료 시 library_roots로 반영)
+        self._restore_path_after_load = None # 라이브러리 새로고침 후 다시 선택할 이미지 경로
         self.raw_extensions = {'.arw', '.crw', '.dng', '.cr2', '.cr3', '.nef', 
                              '.nrw', '.raf', '.srw', '.srf', '.sr2', '.rw2', 
                              '.rwl', '.x3f', '.gpr', '.orf', '.pef', '.ptx', 
@@ -3933,6 +7172,7 @@ class PhotoSortApp(QMainWindow):
 
         self.viewport_move_speed = 5 # 뷰포트 이동 속도 (1~10), 기본값 5
         self.mouse_wheel_action = "photo_navigation"  # 마우스 휠 동작: "photo_navigation" 또는 "none"
+        self.live_folder_watch = False  # 불러온 폴더의 변경 자동 감지 여부
 
         self.mouse_wheel_sensitivity = 1 # 휠 민감도 (1, 2, 3)
         self.mouse_wheel_accumulator = 0 # 휠 틱 누적 카운터
@@ -4017,6 +7257,10 @@ class PhotoSortApp(QMainWindow):
         # 리소스 매니저 초기화
         self.resource_manager = ResourceManager.instance()
 
+        # 인접 이미지 미리 로드 계획 (이동할 때마다 목표 창을 다시 계산해 diff)
+        self.preload_planner = PreloadPlanner()
+        self._preload_tasks = {}  # 현재 목표 창의 파일 경로 -> ImagingTask
+
         # === 유휴 프리로더(Idle Preloader) 타이머 추가 ===
         self.idle_preload_timer = QTimer(self)
         self.idle_preload_timer.setSingleShot(True)
@@ -4032,18 +7276,14 @@ class PhotoSortApp(QMainWindow):
             logging.info("유휴 프리로더 비활성화 (Conservative 프로필)")
 
         # RAW 디코더 결과 처리 타이머 
-        if not hasattr(self, 'raw_result_processor_timer'): # 중복 생성 방지
-            self.raw_result_processor_timer = QTimer(self)
-            self.raw_result_processor_timer.setInterval(100)  # 0.1초마다 결과 확인 (조정 가능)
-            self.raw_result_processor_timer.timeout.connect(self.process_pending_raw_results)
-            self.raw_result_processor_timer.start()
+        if not getattr(self, '_raw_results_connected', False): # 중복 연결 방지
+            # RAW 디코딩 결과가 도착할 때만 GUI 스레드에서 처리 (수신 스레드의 큐 연결 시그널)
+            self.resource_manager.raw_decoder_pool.notifier.resultsReady.connect(self.process_pending_raw_results)
+            self._raw_results_connected = True
 
         # --- 그리드 썸네일 사전 생성을 위한 변수 추가 ---
         self.grid_thumbnail_cache = {"2x2": {}, "3x3": {}, "4x4": {}}
-        self.active_thumbnail_futures = [] # 현재 실행 중인 백그라운드 썸네일 작업 추적
-        self.grid_thumbnail_executor = ThreadPoolExecutor(
-        max_workers=2, 
-        thread_name_prefix="GridThumbnail")
+        self.active_thumbnail_futures = [] # 현재 실행 중인 백그라운드 썸네일 작업 추적 (이미징 풀의 'low' 우선순위)
 
         # 이미지 방향 추적을 위한 변수 추가
         self.current_image_orientation = None  # "landscape" 또는 "portrait"
@@ -4076,8 +7316,13 @@ class PhotoSortApp(QMainWindow):
         
         # 이미지 로더/캐시 추가
         self.image_loader = ImageLoader(raw_extensions=self.raw_extensions)
+        self._full_resolution_pending = None # 100%/Spin 전환으로 원본 해상도 로드 중인 이미지 경로
+        self._raw_full_decode_path = None # RAW 빠른 단계 표시 후 원본 품질 디코딩을 예약한 이미지 경로
+        self._raw_full_decode_timer = QTimer(self)
+        self._raw_full_decode_timer.setSingleShot(True)
+        self._raw_full_decode_timer.timeout.connect(self._start_raw_full_decode)
         self.image_loader.imageLoaded.connect(self.on_image_loaded)
-        self.image_loader.loadCompleted.connect(self._on_image_loaded_for_display)  # 새 시그널 연결
+        self.image_loader.loadCompleted.connect(self._on_image_decoded_for_display)  # 디코딩된 QImage를 GUI 스레드에서 승격
         self.image_loader.loadFailed.connect(self._on_image_load_failed)  # 새 시그널 연결
         self.image_loader.decodingFailedForFile.connect(self.handle_raw_decoding_failure) # 새 시그널 연결
 
@@ -4340,6 +7585,8 @@ class PhotoSortApp(QMainWindow):
         self.load_button.setFixedHeight(button_height)
         
         self.load_button.clicked.connect(self.load_jpg_folder)
+        self.load_button.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.load_button.customContextMenuRequested.connect(self.show_load_button_context_menu)
         
         self.control_layout.addWidget(self.load_button)
         self.control_layout.addWidget(jpg_folder_container)
@@ -4571,9 +7818,14 @@ class PhotoSortApp(QMainWindow):
         except Exception as e:
             logging.error(f"ExifTool 확인 중 오류: {e}")
 
+        # 영구 메타데이터 카탈로그 (photosort_data.json과 같은 위치)
+        self.metadata_catalog = MetadataCatalog(self.get_script_dir() / MetadataCatalog.DB_FILE)
+        # 폴더 스캔용 병렬 정렬 키 추출기 (헤더 파싱 실패 시 기존 추출 경로 사용)
+        self.sort_key_extractor = SortKeyExtractor(self.metadata_catalog, self.get_datetime_from_file_fast)
+
         # === EXIF 병렬 처리를 위한 스레드 및 워커 설정 ===
         self.exif_thread = QThread(self)
-        self.exif_worker = ExifWorker(self.raw_extensions, self.exiftool_path, self.exiftool_available)
+        self.exif_worker = ExifWorker(self.raw_extensions, self.exiftool_path, self.exiftool_available, self.metadata_catalog)
         self.exif_worker.moveToThread(self.exif_thread)
 
         # 시그널-슬롯 연결
@@ -4607,7 +7859,7 @@ class PhotoSortApp(QMainWindow):
         # --- 백그라운드 폴더 로더 설정 ---
         self.folder_loader_thread = QThread()
         self.folder_loader_worker = FolderLoaderWorker(
-            self.raw_extensions, self.get_datetime_from_file_fast
+            self.raw_extensions, self.sort_key_extractor, self.metadata_catalog
         )
         self.folder_loader_worker.moveToThread(self.folder_loader_thread)
 
@@ -4615,11 +7867,25 @@ class PhotoSortApp(QMainWindow):
         self.folder_loader_worker.finished.connect(self.on_loading_finished)
         self.folder_loader_worker.progress.connect(self.on_loading_progress)
         self.folder_loader_worker.error.connect(self.on_loading_error)
+        self.folder_loader_worker.batchReady.connect(self.on_loading_batch)
+        self.folder_loader_worker.cancelled.connect(self.on_loading_cancelled)
         
         self.folder_loader_thread.start()
         self.loading_progress_dialog = None
+        # 스트리밍 로드 상태 (배치 단위로 먼저 표시)
+        self._folder_load_id = 0             # 로드 요청마다 증가, 이전 로드의 늦은 시그널 무시용
+        self._streaming_load_active = False  # 현재 로드가 배치 스트리밍 중인지
+        self._streaming_first_shown = False  # 첫 배치가 이미 화면에 표시되었는지
+        self.image_sort_keys = {}            # {Path: 정렬 키(촬영 시간)} - 스트리밍 병합/증분 새로고침에 사용
+        self._folder_snapshot = {}           # 새로고침 비교용 {str 경로: (크기, 수정시간 ns)}
+        self._streaming_load_args = ("", "", "")  # (모드, JPG 폴더, RAW 폴더)
         # --- 백그라운드 폴더 로더 설정 끝 ---
 
+        # --- 폴더 자동 감지 ---
+        self.folder_watcher = FolderWatcher(self._build_folder_watch_task, self)
+        self.folder_watcher.changesReady.connect(self.on_folder_watch_changes)
+        self._update_folder_watch()
+
         self.scroll_area.verticalScrollBar().valueChanged.connect(self._sync_viewports)
         self.scroll_area.horizontalScrollBar().valueChanged.connect(self._sync_viewports)
 
@@ -4632,29 +7898,184 @@ class PhotoSortApp(QMainWindow):
 
     def on_loading_error(self, message, title):
         """로딩 중 오류 발생 시 처리합니다."""
-        if self.loading_progress_dialog:
-            self.loading_progress_dialog.close()
-            self.loading_progress_dialog = None
+        self._close_loading_dialog()
+        self._end_streaming_load()
         
         self.show_themed_message_box(QMessageBox.Warning, title, message)
         self._reset_workspace_after_load_fail()
 
-    def on_loading_finished(self, image_files, raw_files, jpg_folder, raw_folder, final_mode):
-        """백그라운드 로딩 완료 시 UI를 업데이트합니다."""
+    def on_loading_batch(self, load_id, batch_files, batch_keys):
+        """스트리밍 로드: 첫 배치는 바로 표시하고, 이후 배치는 정렬 위치에 병합합니다."""
+        if load_id != self._folder_load_id or not self._streaming_load_active:
+            return  # 취소되었거나 이전 로드에서 늦게 도착한 배치
+        self.image_sort_keys.update(zip(batch_files, batch_keys))
+
+        if not self._streaming_first_shown:
+            self._streaming_first_shown = True
+            mode, jpg_folder, raw_folder = self._streaming_load_args
+            self._apply_loaded_files(list(batch_files), {}, jpg_folder, raw_folder, mode, partial=True)
+            self._set_loading_dialog_background()
+        else:
+            self._merge_streamed_files(batch_files)
+
+        if self.loading_progress_dialog:
+            self.loading_progress_dialog.setLabelText(
+                LanguageManager.translate("이미지 불러오는 중... ({count}개)").format(count=len(self.image_files)))
+
+    def _image_sort_key(self, file_path):
+        """목록 병합용 정렬 키 (FolderLoaderWorker의 최종 정렬과 동일한 기준)"""
+        return (self.image_sort_keys.get(file_path, datetime.min), Path(file_path).name)
+
+    def _merge_streamed_files(self, batch_files):
+        """배치를 image_files의 정렬 위치에 삽입하고, 보고 있던 이미지가 유지되도록 인덱스를 보정합니다."""
+        if not batch_files:
+            return
+        # 썸네일 모델은 image_files와 같은 리스트를 공유해야 행 단위 삽입이 반영됨
+        if self.thumbnail_panel.model._image_files is not self.image_files:
+            self.thumbnail_panel.set_image_files(self.image_files)
+
+        current_global = (self.grid_page_start_index + self.current_grid_index
+                          if self.grid_mode != "Off" else self.current_image_index)
+        first_inserted_row = None
+        for file_path in batch_files:
+            row = bisect.bisect_right(self.image_files, self._image_sort_key(file_path), key=self._image_sort_key)
+            self.thumbnail_panel.model.insert_files([(row, file_path)])
+            if first_inserted_row is None or row < first_inserted_row:
+                first_inserted_row = row
+            if 0 <= row <= current_global:
+                current_global += 1
+
+        if self.grid_mode != "Off":
+            rows, cols = self._get_grid_dimensions()
+            num_cells = rows * cols
+            old_page_start = self.grid_page_start_index
+            self.grid_page_start_index = (current_global // num_cells) * num_cells
+            self.current_grid_index = current_global % num_cells
+            # 현재 페이지 범위 이전/내부에 삽입되었으면 페이지 내용이 바뀌므로 다시 그림
+            if first_inserted_row < old_page_start + num_cells or self.grid_page_start_index != old_page_start:
+                self.update_grid_view()
+        else:
+            self.current_image_index = current_global
+        self.update_counters()
+
+    def _set_loading_dialog_background(self):
+        """첫 배치 표시 후 로딩창을 비모달로 전환하여 스캔 중에도 사진을 볼 수 있게 합니다."""
+        dialog = self.loading_progress_dialog
+        if not dialog:
+            return
+        dialog.hide()
+        dialog.setWindowModality(Qt.NonModal)
+        dialog.show()
+        self.activateWindow()
+
+    def _end_streaming_load(self):
+        """스트리밍 로드 상태 정리"""
+        self._streaming_load_active = False
+        self._streaming_first_shown = False
+
+    def on_loading_cancelled(self, load_id):
+        """사용자가 로딩을 취소했을 때: 이미 표시된 파일은 유지하고, 없으면 작업 공간을 초기화합니다."""
+        if load_id != self._folder_load_id:
+            return
+        self._close_loading_dialog()
+        first_shown = self._streaming_first_shown
+        self._end_streaming_load()
+        if first_shown and self.image_files:
+            logging.info(f"폴더 로딩 취소: 불러온 {len(self.image_files)}개 파일만 유지")
+            self.update_counters()
+            self.save_state()
+            self._update_folder_watch()
+        else:
+            logging.info("폴더 로딩 취소: 표시된 파일 없음, 작업 공간 초기화")
+            self._reset_workspace_after_load_fail()
+        self._is_silent_load = False
+
+    def _close_loading_dialog(self):
+        """로딩창 닫기 (닫힐 때 발생하는 canceled 시그널이 취소로 처리되지 않도록 연결 해제)"""
         if self.loading_progress_dialog:
+            self.loading_progress_dialog.canceled.disconnect(self._cancel_background_loading)
             self.loading_progress_dialog.close()
             self.loading_progress_dialog = None
 
+    def _cancel_background_loading(self):
+        """로딩창의 취소 버튼 처리"""
+        if self.folder_loader_worker:
+            self.folder_loader_worker.cancel()
+        if self.loading_progress_dialog:
+            self.loading_progress_dialog.setLabelText(LanguageManager.translate("취소하는 중..."))
+
+    def _finish_streaming_load(self, raw_files, paired_files, jpg_folder, raw_folder, final_mode):
+        """스트리밍 로드 완료: 이미 병합된 목록은 그대로 두고 RAW 매칭 결과만 반영합니다.
+        (스캔 중 사용자가 이동한 파일이 다시 나타나지 않도록 최종 목록으로 교체하지 않음)
+        """
+        self._end_streaming_load()
+        self.raw_files = raw_files
+        self.paired_files = paired_files
+        logging.info(f"스트리밍 로딩 완료 (모드: {final_mode}): {len(self.image_files)}개 이미지, {len(self.raw_files)}개 RAW 매칭")
+
+        if final_mode == 'jpg_with_raw':
+            self._show_raw_match_result(len(raw_files), len(self.image_files))
+
+        self.update_raw_folder_ui_state()
+        self.update_match_raw_button_state()
+        self.update_all_folder_labels_state()
+        self.update_counters()
+        if self.grid_mode == "Off" and 0 <= self.current_image_index < len(self.image_files):
+            self.update_file_info_display(self.image_files.key(self.current_image_index))
+        self.save_state()
+        self._update_folder_watch()
+        self._is_silent_load = False
+
+    def _show_raw_match_result(self, matched_count, total_jpg_count):
+        """RAW 매칭 결과 메시지 표시"""
+        if matched_count > 0:
+            self.show_themed_message_box(
+                QMessageBox.Information,
+                LanguageManager.translate("RAW 파일 매칭 결과"),
+                f"{LanguageManager.translate('RAW 파일이 매칭되었습니다.')}\n{matched_count} / {total_jpg_count}"
+            )
+        else:
+            self.show_themed_message_box(
+                QMessageBox.Information,
+                LanguageManager.translate("정보"),
+                LanguageManager.translate("선택한 RAW 폴더에서 매칭되는 파일을 찾을 수 없습니다.")
+            )
+
+    def on_loading_finished(self, load_id, image_files, raw_files, jpg_folder, raw_folder, final_mode, sort_keys, stat_keys, paired_files):
+        """백그라운드 로딩 완료 시 UI를 업데이트합니다."""
+        if load_id != self._folder_load_id:
+            logging.debug(f"이전 폴더 로드(ID {load_id})의 늦은 완료 시그널 무시")
+            return
+        self._close_loading_dialog()
+        # 이후 증분 새로고침에서 재사용할 정렬 키와 폴더 스냅샷
+        self.image_sort_keys = sort_keys
+        self._folder_snapshot = stat_keys
+
+        if self._streaming_load_active and self._streaming_first_shown:
+            self._finish_streaming_load(raw_files, paired_files, jpg_folder, raw_folder, final_mode)
+            return
+        self._end_streaming_load()
+
         if not image_files:
             logging.warning("백그라운드 로더가 빈 이미지 목록을 반환했습니다.")
             self._reset_workspace_after_load_fail()
             self._is_silent_load = False
             return
-            
+
+        self._apply_loaded_files(image_files, raw_files, jpg_folder, raw_folder, final_mode, paired_files=paired_files)
+
+    def _apply_loaded_files(self, image_files, raw_files, jpg_folder, raw_folder, final_mode, partial=False, paired_files=None):
+        """로드된 파일 목록으로 앱 상태와 UI를 갱신합니다.
+        partial=True: 스트리밍 로드의 첫 배치 (RAW 매칭 결과 표시와 상태 저장은 완료 시점으로 미룸)
+        """
         # 성공적으로 로드된 데이터로 앱 상태 업데이트
         self.image_files = image_files
+        self._reset_preload_state()
         self.raw_files = raw_files
+        self.paired_files = paired_files or {}
         
+        self.is_library_mode = (final_mode == 'library')
+        self.library_roots = list(self._pending_library_roots) if self.is_library_mode else []
         if final_mode == 'raw_only':
             self.is_raw_only_mode = True
             self.raw_folder = jpg_folder
@@ -4663,25 +8084,13 @@ class PhotoSortApp(QMainWindow):
             self.is_raw_only_mode = False
             self.current_folder = jpg_folder
             self.raw_folder = raw_folder
+        self.image_loader.configure_pipeline(self.library_roots if self.is_library_mode else [self.current_folder])
 
         logging.info(f"백그라운드 로딩 완료 (모드: {final_mode}): {len(self.image_files)}개 이미지, {len(self.raw_files)}개 RAW 매칭")
 
         if not self._is_silent_load:
-            if final_mode == 'jpg_with_raw':
-                matched_count = len(raw_files)
-                total_jpg_count = len(image_files)
-                if matched_count > 0:
-                    self.show_themed_message_box(
-                        QMessageBox.Information,
-                        LanguageManager.translate("RAW 파일 매칭 결과"),
-                        f"{LanguageManager.translate('RAW 파일이 매칭되었습니다.')}\n{matched_count} / {total_jpg_count}"
-                    )
-                else:
-                    self.show_themed_message_box(
-                        QMessageBox.Information,
-                        LanguageManager.translate("정보"),
-                        LanguageManager.translate("선택한 RAW 폴더에서 매칭되는 파일을 찾을 수 없습니다.")
-                    )
+            if final_mode == 'jpg_with_raw' and not partial:
+                self._show_raw_match_result(len(raw_files), len(image_files))
             
             # 상태 복원 중이 아닐 때만 UI 상태를 기본값으로 리셋
             self.grid_page_start_index = 0
@@ -4692,7 +8101,8 @@ class PhotoSortApp(QMainWindow):
             self.current_image_index = 0
         
         # --- UI 업데이트 (공통) ---
-        if self.current_folder: self.folder_path_label.setText(self.current_folder)
+        if self.is_library_mode: self.folder_path_label.setText(self._library_label_text())
+        elif self.current_folder: self.folder_path_label.setText(self.current_folder)
         else: self.folder_path_label.setText(LanguageManager.translate("폴더 경로"))
         
         if self.raw_folder: self.raw_folder_path_label.setText(self.raw_folder)
@@ -4715,6 +8125,13 @@ class PhotoSortApp(QMainWindow):
 
             # 마지막으로 보던 이미지 인덱스 유효성 검사
             loaded_index = self.current_image_index
+            if self._restore_path_after_load:
+                # 라이브러리 새로고침: 보던 이미지를 경로로 다시 찾음
+                try:
+                    loaded_index = self.image_files.index(Path(self._restore_path_after_load))
+                except ValueError:
+                    pass
+                self._restore_path_after_load = None
             if not (0 <= loaded_index < len(self.image_files)):
                 loaded_index = 0 if self.image_files else -1
             
@@ -4744,7 +8161,7 @@ class PhotoSortApp(QMainWindow):
         # Compare 모드 B 캔버스 복원
         if self._is_silent_load and self.compare_mode_active and self.image_B_path:
             def restore_b_canvas():
-                self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path))
+                self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path), full_resolution=True)
                 self._apply_zoom_to_canvas('B')
                 self._sync_viewports()
                 self.update_compare_filenames()
@@ -4757,9 +8174,12 @@ class PhotoSortApp(QMainWindow):
 
         self.update_thumbnail_panel_style()
         
+        if partial:
+            return
         if not self._is_silent_load:
             self.save_state()
 
+        self._update_folder_watch()
         self._is_silent_load = False
 
     def _reset_workspace_after_load_fail(self):
@@ -4776,6 +8196,7 @@ class PhotoSortApp(QMainWindow):
         self.update_raw_folder_ui_state()
         self.update_match_raw_button_state()
         self.update_all_folder_labels_state()
+        self._update_folder_watch()
 
     def reset_application_settings(self):
         """사용자에게 확인을 받은 후, 설정 파일을 삭제하고 앱을 재시작합니다."""
@@ -4820,8 +8241,12 @@ class PhotoSortApp(QMainWindow):
             # 활성 타이머 중지
             if hasattr(self, 'memory_monitor_timer') and self.memory_monitor_timer.isActive():
                 self.memory_monitor_timer.stop()
-            if hasattr(self, 'raw_result_processor_timer') and self.raw_result_processor_timer.isActive():
-                self.raw_result_processor_timer.stop()
+            if getattr(self, '_raw_results_connected', False):
+                try:
+                    self.resource_manager.raw_decoder_pool.notifier.resultsReady.disconnect(self.process_pending_raw_results)
+                except (RuntimeError, TypeError):
+                    pass
+                self._raw_results_connected = False
                 
             # 리소스 매니저 종료
             if hasattr(self, 'resource_manager'):
@@ -4872,14 +8297,14 @@ class PhotoSortApp(QMainWindow):
         for i in range(1, total_files):
             # 앞으로 탐색
             forward_index = (self.current_image_index + i) % total_files
-            forward_path = str(self.image_files[forward_index])
+            forward_path = self.image_files.key(forward_index)
             if forward_path not in cached_paths:
                 files_to_preload.append(forward_path)
 
             # 뒤로 탐색 (중복 방지)
             backward_index = (self.current_image_index - i + total_files) % total_files
             if backward_index != forward_index:
-                backward_path = str(self.image_files[backward_index])
+                backward_path = self.image_files.key(backward_index)
                 if backward_path not in cached_paths:
                     files_to_preload.append(backward_path)
         
@@ -4905,13 +8330,9 @@ class PhotoSortApp(QMainWindow):
             if path in self.image_loader.cache:
                 continue
             
-            # _preload_image_for_grid 함수는 내부적으로 ImageLoader 캐시를 채우므로 재사용합니다.
-            # 이 함수는 RAW 파일의 경우 preview만 로드하므로, 유휴 로딩 시에도 시스템 부하가 적습니다.
-            self.resource_manager.submit_imaging_task_with_priority(
-                'low',
-                self._preload_image_for_grid,
-                path
-            )
+            # RAW 파일은 preview만 로드하므로 유휴 로딩 시에도 시스템 부하가 적습니다.
+            # 같은 파일을 다른 경로에서 이미 로딩 중이면 새 작업 없이 합류합니다.
+            self._submit_preload(path, 'low')
 
         # 모든 작업 제출이 끝나면 플래그를 리셋합니다.
         # 실제 작업은 백그라운드에서 계속됩니다.
@@ -5008,6 +8429,7 @@ class PhotoSortApp(QMainWindow):
         moved_jpg_path = None
         moved_raw_path = None
         raw_path_before_move = None
+        companion_moves = []
         
         try:
             moved_jpg_path = self.move_file(image_to_move_path, target_folder)
@@ -5017,15 +8439,14 @@ class PhotoSortApp(QMainWindow):
 
             raw_moved_successfully = True
             if self.move_raw_files:
-                base_name = image_to_move_path.stem
-                if base_name in self.raw_files:
-                    raw_path_before_move = self.raw_files[base_name]
-                    moved_raw_path = self.move_file(raw_path_before_move, target_folder)
-                    if moved_raw_path:
-                        del self.raw_files[base_name]
-                    else:
-                        raw_moved_successfully = False
-                        self.show_themed_message_box(QMessageBox.Warning, "경고", f"RAW 파일 이동 실패: {raw_path_before_move.name}")
+                paired_moves = self.move_paired_files(image_to_move_path, target_folder)
+                raw_path_before_move = paired_moves['raw_source']
+                moved_raw_path = paired_moves['raw_target']
+                companion_moves = paired_moves['companions']
+                if paired_moves['failed']:
+                    raw_moved_successfully = raw_path_before_move is None or moved_raw_path is not None
+                    failed_names = ", ".join(path.name for path in paired_moves['failed'])
+                    self.show_themed_message_box(QMessageBox.Warning, "경고", f"RAW 파일 이동 실패: {failed_names}")
 
             # 3. Undo/Redo 히스토리 추가
             if moved_jpg_path and image_to_move_index != -1:
@@ -5034,6 +8455,7 @@ class PhotoSortApp(QMainWindow):
                     "jpg_target": str(moved_jpg_path),
                     "raw_source": str(raw_path_before_move) if raw_path_before_move else None,
                     "raw_target": str(moved_raw_path) if moved_raw_path and raw_moved_successfully else None,
+                    "companions": companion_moves, # 함께 이동한 RAW 변형/사이드카 [[원래 경로, 이동 경로]]
                     "index_before_move": image_to_move_index, # 이동된 B 이미지의 인덱스
                     "a_index_before_move": self.current_image_index, # 당시 A 이미지의 인덱스
                     "mode": "CompareB"
@@ -5151,7 +8573,7 @@ class PhotoSortApp(QMainWindow):
                 index = int(mime_text.split(":")[1])
                 if 0 <= index < len(self.image_files):
                     self.image_B_path = self.image_files[index]
-                    self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path))
+                    self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path), full_resolution=True)
                     if self.original_pixmap_B and not self.original_pixmap_B.isNull():
                         self.image_label_B.setText("") # 안내 문구 제거
                         self._apply_zoom_to_canvas('B') # B 캔버스에 줌/뷰포트 적용
@@ -5220,71 +8642,139 @@ class PhotoSortApp(QMainWindow):
             self.first_raw_load_progress.close()
             self.first_raw_load_progress = None
 
+    def _loaded_image_folder(self):
+        """현재 목록의 원본 폴더 (RAW 단독 모드면 RAW 폴더)"""
+        return self.raw_folder if self.is_raw_only_mode else self.current_folder
+
+    def _is_same_raw_folder(self):
+        """JPG 모드에서 RAW 폴더가 JPG 폴더와 같은지 여부 (같으면 한 번의 스캔으로 RAW 목록도 얻음)"""
+        return bool(not self.is_raw_only_mode and self.raw_folder and self.current_folder
+                    and os.path.normcase(os.path.abspath(self.raw_folder)) == os.path.normcase(os.path.abspath(self.current_folder)))
+
+    @staticmethod
+    def _scan_loaded_folder(image_folder, raw_only, same_raw_folder, image_extensions, raw_extensions):
+        """로드된 폴더를 스캔하여 (스캔 결과, 목록 대상 파일)을 반환합니다. 백그라운드 스레드에서도 호출됩니다."""
+        if raw_only:
+            scan_result = FolderScanner.scan(image_folder, raw_extensions=raw_extensions)
+            return scan_result, scan_result['raw_files']
+        scan_result = FolderScanner.scan(image_folder, image_extensions, raw_extensions if same_raw_folder else (),
+                                         sidecar_extensions=RawPairIndex.SIDECAR_EXTENSIONS)
+        return scan_result, scan_result['image_files']
+
     def refresh_folder_contents(self):
-        """F5 키를 눌렀을 때 현재 로드된 폴더의 내용을 새로고침합니다."""
+        """F5 키를 눌렀을 때 현재 로드된 폴더의 내용을 새로고침합니다.
+        전체를 다시 정렬하지 않고, 이전 스냅샷(이름/크기/수정시간)과 비교하여 추가/삭제/변경된 파일만 반영합니다.
+        """
         if not self.current_folder and not self.is_raw_only_mode:
             logging.debug("새로고침 건너뛰기: 로드된 폴더가 없습니다.")
             return
+        if self.is_library_mode:
+            self.reload_library()
+            return
 
         logging.info("폴더 내용 새로고침을 시작합니다...")
+        start_time = time.time()
 
-        current_index_before_refresh = self.current_image_index
-        current_path_before_refresh = self.get_current_image_path()
-        
-        new_image_files = []
+        image_folder = self._loaded_image_folder()
+        scan_result, scanned_files = None, []
+        if image_folder and Path(image_folder).is_dir():
+            try:
+                scan_result, scanned_files = self._scan_loaded_folder(
+                    image_folder, self.is_raw_only_mode, self._is_same_raw_folder(),
+                    self.supported_image_extensions, self.raw_extensions)
+            except OSError as e:
+                logging.error(f"새로고침 폴더 스캔 실패 ({image_folder}): {e}")
 
-        if self.is_raw_only_mode:
-            if self.raw_folder and Path(self.raw_folder).is_dir():
-                raw_path = Path(self.raw_folder)
-                scanned_files = []
-                for ext in self.raw_extensions:
-                    scanned_files.extend(raw_path.glob(f'*{ext}'))
-                    scanned_files.extend(raw_path.glob(f'*{ext.upper()}'))
-                new_image_files = sorted(list(set(scanned_files)), key=self.get_datetime_from_file_fast)
-            
-            if not new_image_files:
+        if not scanned_files:
+            if self.is_raw_only_mode:
                 logging.warning("새로고침 결과: RAW 폴더에 파일이 더 이상 없습니다. 초기화합니다.")
                 self.clear_raw_folder()
-                return
-
-        else: # JPG 모드
-            if self.current_folder and Path(self.current_folder).is_dir():
-                jpg_path = Path(self.current_folder)
-                scanned_files = []
-                for file_path in jpg_path.iterdir():
-                    if file_path.is_file() and file_path.suffix.lower() in self.supported_image_extensions:
-                        scanned_files.append(file_path)
-                new_image_files = sorted(scanned_files, key=self.get_datetime_from_file_fast)
-
-            if not new_image_files:
+            else:
                 logging.warning("새로고침 결과: JPG 폴더에 파일이 더 이상 없습니다. 초기화합니다.")
                 self.clear_jpg_folder()
-                return
-            
-            if self.raw_folder and Path(self.raw_folder).is_dir():
-                self.match_raw_files(self.raw_folder, silent=True)
+            return
+
+        self._apply_folder_scan(scan_result, scanned_files, image_folder)
+        logging.info(f"새로고침 완료: 총 {len(self.image_files)}개, {(time.time() - start_time) * 1000:.0f}ms")
+
+    def _apply_folder_scan(self, scan_result, scanned_files, image_folder, new_keys=None, raw_folder_files=None):
+        """
+        스캔 결과를 이전 스냅샷과 비교하여 image_files, raw_files, 썸네일 모델에 추가/삭제/변경분만 반영합니다.
+        new_keys: 백그라운드에서 미리 추출한 정렬 키 (없는 파일만 여기서 추출)
+        raw_folder_files: 별도 RAW 폴더의 RAW + 사이드카 스캔 결과 (None이면 필요 시 여기서 스캔)
+        보고 있던 이미지는 삭제/변경된 경우에만 다시 표시합니다. 변경이 있었으면 True 반환.
+        """
+        new_stat_keys = scan_result['stat_keys']
+        scanned_set = set(scanned_files)
+        current_set = set(self.image_files)
+        added = [path for path in scanned_files if path not in current_set]
+        removed = current_set - scanned_set
+        modified = [path for path in self.image_files
+                    if path in scanned_set
+                    and self._folder_snapshot.get(str(path)) is not None
+                    and self._folder_snapshot[str(path)] != new_stat_keys.get(str(path))]
+        modified_set = set(modified)
+        self._folder_snapshot = new_stat_keys
+
+        current_path_before = self.get_current_image_path()
+        current_index_before = (self.grid_page_start_index + self.current_grid_index
+                                if self.grid_mode != "Off" else self.current_image_index)
+        list_changed = bool(added or removed or modified)
+
+        if list_changed:
+            # 썸네일 모델은 image_files와 같은 리스트를 공유해야 행 단위 갱신이 반영됨
+            if self.thumbnail_panel.model._image_files is not self.image_files:
+                self.thumbnail_panel.set_image_files(self.image_files)
+
+            # 삭제 + 변경 파일 제거 (변경 파일은 촬영 시간이 바뀌었을 수 있어 재삽입)
+            rows_to_remove = [row for row in (self.image_files.index_of(path) for path in removed | modified_set) if row >= 0]
+            self.thumbnail_panel.model.remove_rows(rows_to_remove)
+            self.image_loader.invalidate_paths(list(removed) + modified)
+            for path in removed:
+                self.image_sort_keys.pop(path, None)
+
+            # 추가 + 변경 파일의 정렬 키만 반영하여 정렬 위치에 삽입
+            to_insert = added + modified
+            if to_insert:
+                new_keys = dict(new_keys or {})
+                missing = [path for path in to_insert if path not in new_keys]
+                if missing:
+                    new_keys.update(self.sort_key_extractor.extract(missing, image_folder, stat_keys=new_stat_keys))
+                self.image_sort_keys.update({path: new_keys[path] for path in to_insert})
+                for file_path in sorted(to_insert, key=self._image_sort_key):
+                    row = bisect.bisect_right(self.image_files, self._image_sort_key(file_path), key=self._image_sort_key)
+                    self.thumbnail_panel.model.insert_files([(row, file_path)])
+            logging.info(f"폴더 변경 반영: 추가 {len(added)}, 삭제 {len(removed)}, 변경 {len(modified)} (총 {len(self.image_files)}개)")
+
+        # --- RAW/사이드카 매칭 갱신 (JPG 모드) ---
+        if not self.is_raw_only_mode:
+            if self._is_same_raw_folder():
+                self._refresh_raw_matches(scan_result['raw_files'] + scan_result['sidecar_files'])
+            else:
+                self._refresh_raw_matches(raw_folder_files, image_folder_sidecars=scan_result['sidecar_files'])
 
-        self.image_files = new_image_files
-        logging.info(f"새로고침 완료: 총 {len(self.image_files)}개의 파일을 찾았습니다.")
+        if not list_changed:
+            return False
 
         new_index = -1
-        if current_path_before_refresh:
+        if current_path_before:
             try:
-                new_index = self.image_files.index(Path(current_path_before_refresh))
-                logging.info(f"이전 이미지 '{Path(current_path_before_refresh).name}'를 새 목록에서 찾았습니다. 인덱스: {new_index}")
+                new_index = self.image_files.index(Path(current_path_before))
             except ValueError:
                 logging.info("이전에 보던 파일이 삭제되었습니다. 인덱스를 조정합니다.")
-                new_index = min(current_index_before_refresh, len(self.image_files) - 1)
-        
+                new_index = min(current_index_before, len(self.image_files) - 1)
         if new_index < 0 and self.image_files:
             new_index = 0
 
-        self.force_refresh = True
+        current_changed = (current_path_before is None
+                           or Path(current_path_before) in removed
+                           or Path(current_path_before) in modified_set)
         
         if self.grid_mode == "Off":
             self.current_image_index = new_index
-            self.display_current_image()
-            self.thumbnail_panel.set_image_files(self.image_files)
+            if current_changed:
+                self.force_refresh = True
+                self.display_current_image()
             if self.current_image_index >= 0:
                 self.thumbnail_panel.set_current_index(self.current_image_index)
         else: # Grid 모드
@@ -5299,7 +8789,106 @@ class PhotoSortApp(QMainWindow):
             self.update_grid_view()
 
         self.update_counters()
-        logging.info("UI 새로고침이 완료되었습니다.")
+        return True
+
+    def _refresh_raw_matches(self, scanned_companions=None, image_folder_sidecars=()):
+        """JPG 모드에서 RAW/사이드카 짝을 현재 목록 기준으로 다시 조인합니다 (RAW 폴더 한 번만 스캔).
+        scanned_companions: RAW 폴더의 RAW + 사이드카 목록 (None이면 여기서 스캔)
+        image_folder_sidecars: RAW 폴더가 따로 있을 때 이미지 폴더에서 함께 스캔된 사이드카
+        """
+        if not self.raw_folder:
+            return
+        if scanned_companions is None:
+            if not Path(self.raw_folder).is_dir():
+                return
+            try:
+                raw_scan = FolderScanner.scan(self.raw_folder, raw_extensions=self.raw_extensions,
+                                              sidecar_extensions=RawPairIndex.SIDECAR_EXTENSIONS)
+            except OSError as e:
+                logging.error(f"RAW 폴더 스캔 실패 ({self.raw_folder}): {e}")
+                return
+            scanned_companions = raw_scan['raw_files'] + raw_scan['sidecar_files']
+        pair_index = RawPairIndex(self.raw_extensions, self.supported_image_extensions)
+        for image_key in self.image_files.iter_keys():
+            pair_index.add_image(image_key)
+        for companion_path in list(image_folder_sidecars) + list(scanned_companions):
+            pair_index.add_companion(companion_path)
+        new_raw_files, new_paired_files = pair_index.pairs()
+        if new_raw_files != self.raw_files or new_paired_files != self.paired_files:
+            logging.info(f"RAW 매칭 갱신: {len(self.raw_files)} -> {len(new_raw_files)}")
+            self.raw_files = new_raw_files
+            self.paired_files = new_paired_files
+            current_path = self.get_current_image_path()
+            if current_path:
+                self.update_file_info_display(current_path)
+
+    # === 폴더 자동 감지 ===
+    def _update_folder_watch(self):
+        """로드된 폴더에 맞춰 감시 대상을 갱신합니다 (설정이 꺼져 있으면 감시 해제)."""
+        if not hasattr(self, 'folder_watcher'):
+            return
+        paths = []
+        if self.live_folder_watch and self.image_files and not self.is_library_mode:
+            image_folder = self._loaded_image_folder()
+            if image_folder:
+                paths.append(image_folder)
+            if not self.is_raw_only_mode and self.raw_folder and not self._is_same_raw_folder():
+                paths.append(self.raw_folder)
+        self.folder_watcher.set_paths(paths)
+
+    def _build_folder_watch_task(self):
+        """디바운스 후 호출: 현재 상태를 복사해 백그라운드에서 실행할 스캔 작업을 만듭니다 (UI 스레드에서 실행)."""
+        if not self.live_folder_watch or self._streaming_load_active or not self.image_files or self.is_library_mode:
+            return None
+        image_folder = self._loaded_image_folder()
+        if not image_folder:
+            return None
+        raw_only = self.is_raw_only_mode
+        same_raw_folder = self._is_same_raw_folder()
+        separate_raw_folder = self.raw_folder if (not raw_only and self.raw_folder and not same_raw_folder) else None
+        image_extensions = set(self.supported_image_extensions)
+        raw_extensions = set(self.raw_extensions)
+        snapshot = dict(self._folder_snapshot)
+        sort_key_extractor = self.sort_key_extractor
+
+        def scan_task():
+            scan_result, scanned_files = self._scan_loaded_folder(
+                image_folder, raw_only, same_raw_folder, image_extensions, raw_extensions)
+            stat_keys = scan_result['stat_keys']
+            # 새 파일/변경 파일의 정렬 키도 여기서 미리 추출하여 UI 스레드 작업을 줄임
+            changed = [path for path in scanned_files if snapshot.get(str(path)) != stat_keys.get(str(path))]
+            sort_keys = sort_key_extractor.extract(changed, image_folder, stat_keys=stat_keys) if changed else {}
+            raw_folder_files = None
+            if separate_raw_folder and Path(separate_raw_folder).is_dir():
+                raw_scan = FolderScanner.scan(separate_raw_folder, raw_extensions=raw_extensions,
+                                              sidecar_extensions=RawPairIndex.SIDECAR_EXTENSIONS)
+                raw_folder_files = raw_scan['raw_files'] + raw_scan['sidecar_files']
+            return {
+                'image_folder': image_folder,
+                'scan_result': scan_result,
+                'scanned_files': scanned_files,
+                'sort_keys': sort_keys,
+                'raw_folder_files': raw_folder_files,
+            }
+        return scan_task
+
+    def on_folder_watch_changes(self, generation, result):
+        """백그라운드 스캔 결과를 현재 목록에 반영합니다 (보고 있던 이미지는 유지)."""
+        if generation != self.folder_watcher.generation or self._streaming_load_active:
+            return
+        if result.get('image_folder') != self._loaded_image_folder() or not self.image_files:
+            return  # 그 사이 다른 폴더가 로드됨
+        if not result['scanned_files']:
+            logging.warning("폴더 자동 감지: 폴더에 이미지가 없어 반영하지 않습니다.")
+            return
+        self._apply_folder_scan(result['scan_result'], result['scanned_files'], result['image_folder'],
+                                new_keys=result['sort_keys'], raw_folder_files=result['raw_folder_files'])
+
+    def on_live_folder_watch_toggled(self, checked):
+        """폴더 자동 감지 설정 변경"""
+        self.live_folder_watch = bool(checked)
+        logging.info(f"폴더 자동 감지: {'켜짐' if self.live_folder_watch else '꺼짐'}")
+        self._update_folder_watch()
 
     def request_thumbnail_load(self, file_path, index):
         """ThumbnailModel로부터 썸네일 로딩 요청을 받아 처리"""
@@ -5308,12 +8897,15 @@ class PhotoSortApp(QMainWindow):
 
         thumbnail_size = UIScaleManager.get("thumbnail_image_size")
 
-        # --- future가 None이 아닌지 확인하는 방어 코드 추가 ---
-        future = self.resource_manager.submit_imaging_task_with_priority(
-            'low',
-            self._generate_thumbnail_task,
-            file_path,
-            thumbnail_size
+        # 같은 썸네일을 이미 생성 중이면 기존 작업에 합류 (future가 None이면 제출 실패)
+        future = self.image_loader.request_shared(
+            file_path, "thumb",
+            lambda: self.resource_manager.submit_imaging_task_with_priority(
+                'low',
+                self._generate_thumbnail_task,
+                file_path,
+                thumbnail_size
+            )
         )
         
         if future: # future가 유효할 때만 콜백을 연결합니다.
@@ -5361,9 +8953,9 @@ class PhotoSortApp(QMainWindow):
         try:
             is_raw = Path(file_path).suffix.lower() in self.raw_extensions
             if is_raw:
-                preview_pixmap, _, _ = self.image_loader._load_raw_preview_with_orientation(file_path)
-                if preview_pixmap and not preview_pixmap.isNull():
-                    return preview_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation).toImage()
+                preview_image, _, _ = self.image_loader._load_raw_preview_image(file_path)
+                if preview_image is not None and not preview_image.isNull():
+                    return preview_image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 else:
                     logging.warning(f"썸네일 패널용 프리뷰 없음: {file_path}")
                     return QImage()
@@ -5716,10 +9308,7 @@ class PhotoSortApp(QMainWindow):
     def _has_supported_image_files(self, folder_path):
         """폴더에 지원하는 이미지 파일이 있는지 확인"""
         try:
-            for file_path in folder_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.supported_image_extensions:
-                    return True
-            return False
+            return FolderScanner.has_files(folder_path, self.supported_image_extensions)
         except Exception as e:
             logging.debug(f"이미지 파일 확인 오류: {e}")
             return False
@@ -5727,10 +9316,7 @@ class PhotoSortApp(QMainWindow):
     def _has_raw_files(self, folder_path):
         """폴더에 RAW 파일이 있는지 확인"""
         try:
-            for file_path in folder_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.raw_extensions:
-                    return True
-            return False
+            return FolderScanner.has_files(folder_path, self.raw_extensions)
         except Exception as e:
             logging.debug(f"RAW 파일 확인 오류: {e}")
             return False
@@ -5852,13 +9438,11 @@ class PhotoSortApp(QMainWindow):
             return None, None
         
         # [빠른 작업] 파일 목록 스캔
-        target_path = Path(folder_path)
-        temp_raw_file_list = []
-        for ext in self.raw_extensions:
-            temp_raw_file_list.extend(target_path.glob(f'*{ext}'))
-            temp_raw_file_list.extend(target_path.glob(f'*{ext.upper()}'))
-        
-        unique_raw_files = list(set(temp_raw_file_list))
+        try:
+            unique_raw_files = FolderScanner.scan(folder_path, raw_extensions=self.raw_extensions)['raw_files']
+        except OSError as e:
+            logging.error(f"RAW 폴더 스캔 실패 ({folder_path}): {e}")
+            unique_raw_files = []
         if not unique_raw_files:
             self.show_themed_message_box(QMessageBox.Warning, LanguageManager.translate("경고"), LanguageManager.translate("선택한 폴더에 RAW 파일이 없습니다."))
             return None, None
@@ -6084,23 +9668,14 @@ class PhotoSortApp(QMainWindow):
             if not folder_path_obj.is_dir():
                 return None
             
-            # 파일 분류
-            raw_files = []
-            image_files = []
+            # 파일 분류 (한 번의 순회)
+            scan_result = FolderScanner.scan(folder_path_obj, self.supported_image_extensions, self.raw_extensions)
+            raw_files = scan_result['raw_files']
+            image_files = scan_result['image_files']
             
-            for file_path in folder_path_obj.iterdir():
-                if not file_path.is_file():
-                    continue
-                
-                ext = file_path.suffix.lower()
-                if ext in self.raw_extensions:
-                    raw_files.append(file_path)
-                elif ext in self.supported_image_extensions:
-                    image_files.append(file_path)
-            
-            # 매칭 파일 확인 (이름이 같은 파일)
-            raw_stems = {f.stem for f in raw_files}
-            image_stems = {f.stem for f in image_files}
+            # 매칭 파일 확인 (대소문자를 무시하고 이름이 같은 파일)
+            raw_stems = {RawPairIndex.normalize_key(f) for f in raw_files}
+            image_stems = {RawPairIndex.normalize_key(f) for f in image_files}
             matching_files = raw_stems & image_stems
             
             return {
@@ -6496,6 +10071,7 @@ class PhotoSortApp(QMainWindow):
             "current_folder": str(self.current_folder) if self.current_folder else "",
             "raw_folder": str(self.raw_folder) if self.raw_folder else "",
             "raw_files": {k: str(v) for k, v in self.raw_files.items()}, # Path를 str로
+            "paired_files": {k: [str(p) for p in v] for k, v in self.paired_files.items()},
             "move_raw_files": self.move_raw_files,
             "target_folders": [str(f) if f else "" for f in self.target_folders],
             "folder_count": self.folder_count,  # 분류 폴더 개수 저장 추가
@@ -6581,7 +10157,9 @@ class PhotoSortApp(QMainWindow):
         self.current_folder = session_data.get("current_folder", "")
         self.raw_folder = session_data.get("raw_folder", "")
         raw_files_str_dict = session_data.get("raw_files", {})
-        self.raw_files = {k: Path(v) for k, v in raw_files_str_dict.items() if v} # Path 객체로
+        # 키는 RAW 경로로 다시 계산 (이전 버전의 대소문자 구분 키와 호환)
+        self.raw_files = {self.raw_pair_key(v): Path(v) for k, v in raw_files_str_dict.items() if v} # Path 객체로
+        self.paired_files = {k: [Path(p) for p in v] for k, v in session_data.get("paired_files", {}).items() if v}
         self.move_raw_files = session_data.get("move_raw_files", True)
         
         # target_folders 복원 (folder_count 기반으로 크기 조정)
@@ -6851,11 +10429,11 @@ class PhotoSortApp(QMainWindow):
         current_path_to_display = None
         if self.grid_mode == "Off":
             if 0 <= self.current_image_index < len(self.image_files):
-                current_path_to_display = str(self.image_files[self.current_image_index])
+                current_path_to_display = self.image_files.key(self.current_image_index)
         else:
             grid_idx = self.grid_page_start_index + self.current_grid_index
             if 0 <= grid_idx < len(self.image_files):
-                current_path_to_display = str(self.image_files[grid_idx])
+                current_path_to_display = self.image_files.key(grid_idx)
 
         if current_path_to_display == failed_file_path:
             # 사용자에게 알림 (기존 show_compatibility_message 사용 또는 새 메시지)
@@ -6993,7 +10571,7 @@ class PhotoSortApp(QMainWindow):
             # 현재 표시 중인 이미지는 유지
             current_path = None
             if self.current_image_index >= 0 and self.current_image_index < len(self.image_files):
-                current_path = str(self.image_files[self.current_image_index])
+                current_path = self.image_files.key(self.current_image_index)
             
             # 불필요한 캐시 항목 제거
             keys_to_remove = []
@@ -7340,11 +10918,10 @@ class PhotoSortApp(QMainWindow):
 
         # 우선순위 이미지 로드
         for idx in priority_indices:
-            img_path = str(self.image_files[idx])
-            future = self.grid_thumbnail_executor.submit(
-                self._preload_image_for_grid, img_path
-            )
-            futures.append(future)
+            img_path = self.image_files.key(idx)
+            future = self._submit_preload(img_path, 'low')
+            if future is not None:
+                futures.append(future)
 
         self.active_thumbnail_futures = futures
         logging.info(f"총 {len(futures)}개의 그리드용 이미지 사전 로딩 작업 제출됨.")
@@ -7364,24 +10941,14 @@ class PhotoSortApp(QMainWindow):
         except:
             return 3  # 기본값
 
-    def _preload_image_for_grid(self, image_path):
+    def _submit_preload(self, image_path, priority='low', task_group=None):
         """
-        주어진 이미지 경로의 원본 이미지를 ImageLoader 캐시에 미리 로드합니다.
-        백그라운드 스레드에서 실행됩니다.
+        주어진 이미지 경로의 원본 이미지를 ImageLoader 캐시에 미리 로드하도록 제출합니다.
+        같은 파일이 이미 로딩 중이면 기존 작업을 갱신해 반환하고, 캐시로 충분하면 None을 반환합니다.
         """
-        try:
-            # ImageLoader를 사용하여 원본 이미지 로드 (EXIF 방향 처리 포함)
-            # 반환값을 사용하지 않고, 로드 행위 자체로 ImageLoader 캐시에 저장되도록 함
-            loaded = self.image_loader.load_image_with_orientation(image_path)
-            if loaded and not loaded.isNull():
-                # print(f"이미지 사전 로드 완료: {Path(image_path).name}") # 디버깅 로그
-                return True
-            else:
-                # print(f"이미지 사전 로드 실패: {Path(image_path).name}")
-                return False
-        except Exception as e:
-            logging.error(f"백그라운드 이미지 사전 로드 오류 ({Path(image_path).name}): {e}")
-            return False
+        # 단일 보기에서 100%/Spin이면 넘겼을 때 바로 쓸 수 있도록 원본 해상도로 미리 로드
+        full_resolution = self.grid_mode == "Off" and self.zoom_mode != "Fit"
+        return self.image_loader.submit_decode(image_path, priority, full_resolution, task_group=task_group)
         
     def on_mouse_wheel_action_changed(self, button):
         """마우스 휠 동작 설정 변경 시 호출"""
@@ -7497,6 +11064,11 @@ class PhotoSortApp(QMainWindow):
         self.mouse_pan_sensitivity_combo.setStyleSheet(self.generate_combobox_style())
         self.mouse_pan_sensitivity_combo.currentIndexChanged.connect(self.on_mouse_pan_sensitivity_changed)
 
+        # --- 폴더 자동 감지 설정 ---
+        self.live_folder_watch_checkbox = QCheckBox(LanguageManager.translate("사용"))
+        self.live_folder_watch_checkbox.setStyleSheet(checkbox_style)
+        self.live_folder_watch_checkbox.toggled.connect(self.on_live_folder_watch_toggled)
+
         # --- 저장된 RAW 처리 방식 초기화 버튼 ---
         button_style = f"""
             QPushButton {{
@@ -7773,6 +11345,7 @@ class PhotoSortApp(QMainWindow):
         self._create_setting_row(grid_layout, current_row, "마우스 휠 동작", self._create_mouse_wheel_radios()); current_row += 1
         self._create_setting_row(grid_layout, current_row, "마우스 휠 민감도", self.mouse_wheel_sensitivity_combo); current_row += 1
         self._create_setting_row(grid_layout, current_row, "마우스 패닝 감도", self.mouse_pan_sensitivity_combo); current_row += 1
+        self._create_setting_row(grid_layout, current_row, "폴더 자동 감지 ⓘ", self.live_folder_watch_checkbox); current_row += 1
 
         return current_row
 
@@ -7902,6 +11475,11 @@ class PhotoSortApp(QMainWindow):
             tooltip_text = LanguageManager.translate(tooltip_key)
             label.setToolTip(tooltip_text)
             label.setCursor(Qt.WhatsThisCursor)
+        elif label_key == "폴더 자동 감지 ⓘ":
+            tooltip_key = "다른 프로그램이 불러온 폴더에 파일을 추가하거나 삭제하면 F5 없이 목록에 자동으로 반영합니다."
+            tooltip_text = LanguageManager.translate(tooltip_key)
+            label.setToolTip(tooltip_text)
+            label.setCursor(Qt.WhatsThisCursor)
 
         grid_layout.addWidget(label, row_index, 0, Qt.AlignVCenter | Qt.AlignLeft)
         if control_widget:
@@ -8787,6 +12365,7 @@ class PhotoSortApp(QMainWindow):
     def resizeEvent(self, event):
             """창 크기 변경 이벤트 처리"""
             super().resizeEvent(event)
+            self._update_fit_decode_size()
             self.adjust_layout()
             self.update_minimap_position()
             
@@ -8815,6 +12394,128 @@ class PhotoSortApp(QMainWindow):
                 raw_file_list=None
             )
 
+    def show_load_button_context_menu(self, pos):
+        """'이미지 불러오기' 버튼 우클릭 메뉴 (하위 폴더 포함 라이브러리 불러오기)"""
+        context_menu = QMenu(self)
+        context_menu.setStyleSheet(f"""
+            QMenu {{
+                background-color: {ThemeManager.get_color('bg_secondary')};
+                color: {ThemeManager.get_color('text')};
+                border: 1px solid {ThemeManager.get_color('border')};
+                padding: 2px;
+            }}
+            QMenu::item {{
+                padding: 8px 16px;
+                background-color: transparent;
+            }}
+            QMenu::item:selected {{
+                background-color: {ThemeManager.get_color('accent')};
+                color: {ThemeManager.get_color('text')};
+            }}
+        """)
+        action = QAction(LanguageManager.translate("하위 폴더 포함 불러오기 (라이브러리)"), self)
+        action.triggered.connect(self.load_library_folder)
+        context_menu.addAction(action)
+        context_menu.exec(self.load_button.mapToGlobal(pos))
+
+    def load_library_folder(self):
+        """라이브러리 모드: 하나 이상의 루트 폴더를 선택하여 하위 폴더 전체를 하나의 타임라인으로 불러옵니다."""
+        roots = []
+        while True:
+            folder_path = QFileDialog.getExistingDirectory(
+                self, LanguageManager.translate("라이브러리 루트 폴더 선택"), "",
+                QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+            )
+            if not folder_path:
+                break
+            if folder_path not in roots:
+                roots.append(folder_path)
+            reply = self.show_themed_message_box(
+                QMessageBox.Question,
+                LanguageManager.translate("라이브러리"),
+                LanguageManager.translate("다른 루트 폴더를 추가하시겠습니까?"),
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                break
+        if not roots:
+            return
+        logging.info(f"라이브러리 루트 선택: {roots}")
+        self.clear_raw_folder()
+        self.start_background_loading(
+            mode='library',
+            jpg_folder_path=roots[0],
+            raw_folder_path=None,
+            raw_file_list=roots
+        )
+
+    def reload_library(self):
+        """라이브러리 모드 새로고침: 트리를 다시 탐색하고 보던 이미지를 유지합니다."""
+        if not self.library_roots:
+            return
+        logging.info(f"라이브러리 새로고침: {self.library_roots}")
+        self._restore_path_after_load = self.get_current_image_path()
+        self._is_silent_load = True
+        self.start_background_loading(
+            mode='library',
+            jpg_folder_path=self.library_roots[0],
+            raw_folder_path=None,
+            raw_file_list=list(self.library_roots)
+        )
+
+    def _library_label_text(self):
+        """폴더 경로 레이블에 표시할 라이브러리 루트 텍스트"""
+        if not self.library_roots:
+            return self.current_folder
+        if len(self.library_roots) == 1:
+            return self.library_roots[0]
+        return f"{self.library_roots[0]} (+{len(self.library_roots) - 1})"
+
+    def get_source_root(self, image_path):
+        """라이브러리 모드에서 파일이 속한 루트 폴더 반환 (일반 모드에서는 현재 폴더)"""
+        if not self.is_library_mode:
+            return self._loaded_image_folder()
+        image_path = os.path.normcase(os.path.abspath(str(image_path)))
+        best_root = ""
+        for root in self.library_roots:
+            root_norm = os.path.normcase(os.path.abspath(root))
+            if image_path.startswith(root_norm.rstrip(os.sep) + os.sep) and len(root) > len(best_root):
+                best_root = root
+        return best_root
+
+    def raw_pair_key(self, image_path):
+        """raw_files/paired_files 딕셔너리 키 (대소문자 무시, 라이브러리 모드는 폴더별로 매칭하므로 폴더 경로 포함)"""
+        return RawPairIndex.normalize_key(image_path, per_folder=self.is_library_mode)
+
+    def move_paired_files(self, image_path, target_folder):
+        """
+        이미지와 짝지어진 RAW 변형/사이드카를 모두 대상 폴더로 이동합니다.
+        반환: {'raw_source', 'raw_target', 'companions', 'failed'}
+          raw_source/raw_target: 기본 RAW의 이동 전/후 경로 (없거나 실패하면 raw_target은 None)
+          companions: 기본 RAW 외에 이동한 파일의 [이동 전 경로, 이동 후 경로] 목록 (Undo/Redo 기록용)
+          failed: 이동하지 못한 파일 목록 (짝 목록에 그대로 남음)
+        """
+        key = self.raw_pair_key(image_path)
+        primary = self.raw_files.get(key)
+        files = self.paired_files.get(key) or ([primary] if primary else [])
+        result = {'raw_source': primary, 'raw_target': None, 'companions': [], 'failed': []}
+        for source_path in files:
+            moved_path = self.move_file(source_path, target_folder)
+            if moved_path is None:
+                result['failed'].append(source_path)
+            elif source_path == primary:
+                result['raw_target'] = moved_path
+            else:
+                result['companions'].append([str(source_path), str(moved_path)])
+        if result['failed']:
+            self.paired_files[key] = result['failed']
+        else:
+            self.paired_files.pop(key, None)
+        if result['raw_target'] is not None:
+            del self.raw_files[key]
+        return result
+
     def on_match_raw_button_clicked(self):
         """ "JPG - RAW 연결" 또는 "RAW 불러오기" 버튼 클릭 시 호출 """
         if self.is_raw_only_mode:
@@ -8828,7 +12529,7 @@ class PhotoSortApp(QMainWindow):
 
 
     def get_datetime_from_file_fast(self, file_path):
-        """파일에서 촬영 시간을 빠르게 추출 (캐시 우선 사용)"""
+        """파일에서 촬영 시간을 빠르게 추출 (캐시 -> 카탈로그 -> 파일 순)"""
         file_key = str(file_path)
         
         # 1. 캐시에서 먼저 확인
@@ -8844,8 +12545,23 @@ class PhotoSortApp(QMainWindow):
                         pass
                 elif isinstance(cached_value, datetime):
                     return cached_value
-        
-        # 2. RAW 파일의 경우 rawpy로 빠른 메타데이터 추출
+
+        # 2. 영구 카탈로그 확인 (크기/수정시간이 같으면 파일을 열지 않음)
+        catalog = getattr(self, 'metadata_catalog', None)
+        stat_key = MetadataCatalog.stat_key(file_key) if catalog and catalog.available else None
+        if stat_key is not None:
+            cached_dt = catalog.get_capture_datetime(file_key, stat_key)
+            if cached_dt is not None:
+                return cached_dt
+
+        capture_dt = self._extract_datetime_from_file(file_path)
+        if stat_key is not None:
+            catalog.put_capture_datetime(file_key, capture_dt, stat_key)
+        return capture_dt
+
+    def _extract_datetime_from_file(self, file_path):
+        """파일을 직접 열어 촬영 시간을 추출 (카탈로그 미스 시 사용)"""
+        # 1. RAW 파일의 경우 rawpy로 빠른 메타데이터 추출
         if file_path.suffix.lower() in self.raw_extensions:
             try:
                 import rawpy
@@ -8857,7 +12573,7 @@ class PhotoSortApp(QMainWindow):
             except:
                 pass
         
-        # 3. JPG/HEIC의 경우 piexif 사용 (이미 구현됨)
+        # 2. JPG/HEIC의 경우 piexif 사용 (이미 구현됨)
         try:
             import piexif
             exif_data = piexif.load(str(file_path))
@@ -8867,7 +12583,7 @@ class PhotoSortApp(QMainWindow):
         except:
             pass
         
-        # 4. 마지막 수단: 파일 수정 시간
+        # 3. 마지막 수단: 파일 수정 시간
         return datetime.fromtimestamp(file_path.stat().st_mtime)
 
     def load_images_from_folder(self, folder_path):
@@ -8892,11 +12608,27 @@ class PhotoSortApp(QMainWindow):
         if not self._is_silent_load:
             self._reset_workspace()
 
+        # 일반 로드는 배치 스트리밍으로 첫 이미지를 먼저 표시 (세션 복원은 전체 목록이 있어야 인덱스 복원 가능)
+        streaming = not self._is_silent_load
+        if mode == 'library':
+            self._pending_library_roots = [str(root) for root in (raw_file_list or [])]
+        if self._streaming_load_active:
+            self.folder_loader_worker.cancel()  # 스캔 중인 이전 로드 중단
+        self._close_loading_dialog()
+        self._folder_load_id += 1
+        self._end_streaming_load()
+        if streaming:
+            self.image_sort_keys = {}
+        self._streaming_load_active = streaming
+        self._streaming_load_args = (mode, jpg_folder_path or "", raw_folder_path or "")
+
         self.loading_progress_dialog = QProgressDialog(
             LanguageManager.translate("폴더를 읽는 중입니다..."),
-            "", 0, 0, self
+            LanguageManager.translate("취소"), 0, 0, self
         )
-        self.loading_progress_dialog.setCancelButton(None)
+        self.loading_progress_dialog.setAutoClose(False)
+        self.loading_progress_dialog.setAutoReset(False)
+        self.loading_progress_dialog.canceled.connect(self._cancel_background_loading)
         self.loading_progress_dialog.setWindowModality(Qt.WindowModal)
         self.loading_progress_dialog.setMinimumDuration(0)
         apply_dark_title_bar(self.loading_progress_dialog)
@@ -8928,7 +12660,9 @@ class PhotoSortApp(QMainWindow):
             raw_path_str,
             mode,
             raw_file_list if raw_file_list is not None else [],
-            current_supported_extensions
+            current_supported_extensions,
+            streaming,
+            self._folder_load_id
         )
 
     def force_grid_refresh(self):
@@ -9076,6 +12810,10 @@ class PhotoSortApp(QMainWindow):
             return
 
         if self.grid_mode != "Off": return
+
+        # Fit용 축소 디코딩 이미지로는 100%/Spin을 표시할 수 없으므로 원본 해상도 로드 후 다시 적용
+        if self.zoom_mode != "Fit" and self._request_full_resolution_if_reduced():
+            return
         
         # 1. A 캔버스에 줌/뷰포트 적용
         self._apply_zoom_to_canvas('A')
@@ -9090,6 +12828,27 @@ class PhotoSortApp(QMainWindow):
         if self.minimap_toggle.isChecked():
             self.toggle_minimap(True)
 
+    def _request_full_resolution_if_reduced(self):
+        """현재 이미지가 Fit용 축소 디코딩이면 원본 해상도 로드를 시작하고 True 반환 (완료 시 줌이 다시 적용됨)"""
+        if not (0 <= self.current_image_index < len(self.image_files)):
+            return False
+        image_path = self.image_files.key(self.current_image_index)
+        if not self.image_loader.is_reduced(image_path):
+            return False
+        if self._full_resolution_pending != image_path:
+            logging.debug(f"원본 해상도 로드 요청 (100%/Spin): {Path(image_path).name}")
+            self._full_resolution_pending = image_path
+            self.load_image_async(image_path, self.current_image_index)
+        return True
+
+    def _update_fit_decode_size(self):
+        """Fit 보기용 축소 디코딩 기준을 창이 있는 화면의 물리 해상도로 갱신"""
+        screen = self.screen() or QGuiApplication.primaryScreen()
+        if screen is None or not hasattr(self, 'image_loader'):
+            return
+        dpr = screen.devicePixelRatio()
+        self.image_loader.set_fit_decode_size(screen.size().width() * dpr, screen.size().height() * dpr)
+
     def high_quality_resize_to_fit(self, pixmap, target_widget):
             """고품질 이미지 리사이징 (Fit 모드용) - 메모리 최적화"""
             if not pixmap or not target_widget:
@@ -9518,16 +13277,15 @@ class PhotoSortApp(QMainWindow):
         )
 
         if folder_path:
-            target_path = Path(folder_path)
-            temp_raw_file_list = []
-
-            # RAW 파일 검색
-            for ext in self.raw_extensions:
-                temp_raw_file_list.extend(target_path.glob(f'*{ext}'))
-                temp_raw_file_list.extend(target_path.glob(f'*{ext.upper()}')) # 대문자 확장자도 고려
-
-            # 중복 제거 및 정렬
-            unique_raw_files = sorted(list(set(temp_raw_file_list)))
+            # RAW 파일 검색 (대소문자 구분 없이 한 번의 순회로 수집)
+            raw_stat_keys = {}
+            try:
+                raw_scan = FolderScanner.scan(folder_path, raw_extensions=self.raw_extensions)
+                unique_raw_files = sorted(raw_scan['raw_files'])
+                raw_stat_keys = raw_scan['stat_keys']
+            except OSError as e:
+                logging.error(f"RAW 폴더 스캔 실패 ({folder_path}): {e}")
+                unique_raw_files = []
 
             if not unique_raw_files:
                 self.show_themed_message_box(QMessageBox.Warning, LanguageManager.translate("경고"), LanguageManager.translate("선택한 폴더에 RAW 파일이 없습니다."))
@@ -9721,6 +13479,12 @@ class PhotoSortApp(QMainWindow):
 
             self.current_folder = ""
             self.raw_files = {} # RAW 전용 모드에서는 이 딕셔너리는 다른 용도로 사용되지 않음
+            self.paired_files = {}
+            # 파일 이름순 목록이므로 정렬 키는 비우고, 스캔 결과를 증분 새로고침/자동 감지용 스냅샷으로 사용
+            self.image_sort_keys = {}
+            self._folder_snapshot = raw_stat_keys
+            self._update_folder_watch()
+            self._reset_preload_state()
             self.folder_path_label.setText(LanguageManager.translate("폴더 경로"))
             self.update_jpg_folder_ui_state()
 
@@ -10503,6 +14267,7 @@ class PhotoSortApp(QMainWindow):
         moved_jpg_path = None # 이동된 JPG 경로 저장 변수
         moved_raw_path = None # 이동된 RAW 경로 저장 변수
         raw_path_before_move = None # 이동 전 RAW 경로 저장 변수
+        companion_moves = [] # 함께 이동한 RAW 변형/사이드카 [[원래 경로, 이동 경로]]
 
         try:
             # --- JPG 파일 이동 ---
@@ -10516,17 +14281,16 @@ class PhotoSortApp(QMainWindow):
             # --- RAW 파일 이동 (토글 활성화 및 파일 존재 시) ---
             raw_moved_successfully = True # RAW 이동 성공 플래그
             if self.move_raw_files:
-                base_name = current_image_path.stem
-                if base_name in self.raw_files:
-                    raw_path_before_move = self.raw_files[base_name] # 이동 전 경로 저장
-                    moved_raw_path = self.move_file(raw_path_before_move, target_folder)
-                    if moved_raw_path is None:
-                        # RAW 이동 실패 시 사용자에게 알리고 계속 진행할지, 아니면 JPG 이동을 취소할지 결정해야 함
-                        # 여기서는 RAW 이동 실패 메시지만 보여주고 계속 진행 (JPG는 이미 이동됨)
-                        self.show_themed_message_box(QMessageBox.Warning, LanguageManager.translate("경고"), f"RAW 파일 이동 실패: {raw_path_before_move.name}")
-                        raw_moved_successfully = False # 실패 플래그 설정
-                    else:
-                        del self.raw_files[base_name] # 성공 시에만 raw_files 딕셔너리에서 제거
+                # 짝지어진 RAW 변형/사이드카 모두 이동 (성공한 파일만 raw_files/paired_files에서 제거)
+                paired_moves = self.move_paired_files(current_image_path, target_folder)
+                raw_path_before_move = paired_moves['raw_source'] # 이동 전 경로 저장
+                moved_raw_path = paired_moves['raw_target']
+                companion_moves = paired_moves['companions']
+                if paired_moves['failed']:
+                    # 여기서는 RAW 이동 실패 메시지만 보여주고 계속 진행 (JPG는 이미 이동됨)
+                    failed_names = ", ".join(path.name for path in paired_moves['failed'])
+                    self.show_themed_message_box(QMessageBox.Warning, LanguageManager.translate("경고"), f"RAW 파일 이동 실패: {failed_names}")
+                    raw_moved_successfully = raw_path_before_move is None or moved_raw_path is not None
 
             # --- 이미지 목록에서 제거 ---
             self.image_files.pop(current_index)
@@ -10539,6 +14303,7 @@ class PhotoSortApp(QMainWindow):
                     "jpg_target": str(moved_jpg_path),
                     "raw_source": str(raw_path_before_move) if raw_path_before_move else None,
                     "raw_target": str(moved_raw_path) if moved_raw_path and raw_moved_successfully else None, # RAW 이동 성공 시에만 target 저장
+                    "companions": companion_moves,
                     "index_before_move": current_index,
                     "mode": "Off" # 이동 당시 모드 기록
                 }
@@ -11751,7 +15516,8 @@ class PhotoSortApp(QMainWindow):
         num_cells = rows * cols
         start_idx = self.grid_page_start_index
         end_idx = min(start_idx + num_cells, len(self.image_files))
-        images_to_display = self.image_files[start_idx:end_idx]
+        # 페이지 셀에는 Path 대신 테이블의 str 키를 그대로 사용
+        images_to_display = [self.image_files.key(i) for i in range(start_idx, end_idx)]
 
         if self.current_grid_index >= len(images_to_display) and len(images_to_display) > 0:
              self.current_grid_index = len(images_to_display) - 1
@@ -11768,8 +15534,7 @@ class PhotoSortApp(QMainWindow):
             cell_widget.mouseDoubleClickEvent = partial(self.on_grid_cell_double_clicked, clicked_widget=cell_widget, clicked_index=i)
             
             if i < len(images_to_display):
-                current_image_path_obj = images_to_display[i]
-                current_image_path = str(current_image_path_obj)
+                current_image_path = images_to_display[i]
                 cell_widget.setProperty("image_path", current_image_path)
                 cell_widget.setPixmap(self.placeholder_pixmap)
             
@@ -11786,7 +15551,7 @@ class PhotoSortApp(QMainWindow):
 
         selected_image_list_index_gw = self.grid_page_start_index + self.current_grid_index
         if 0 <= selected_image_list_index_gw < len(self.image_files):
-            self.update_file_info_display(str(self.image_files[selected_image_list_index_gw]))
+            self.update_file_info_display(self.image_files.key(selected_image_list_index_gw))
         else:
             self.update_file_info_display(None)
         
@@ -11832,8 +15597,8 @@ class PhotoSortApp(QMainWindow):
         # 별도의 즉각적인 뷰 업데이트는 필요하지 않습니다.
         # (다음에 Grid On으로 전환될 때 self.show_grid_filenames 상태가 반영됩니다.)
 
-    def on_image_loaded(self, cell_index, pixmap, img_path):
-            """비동기 이미지 로딩 완료 시 호출되는 슬롯"""
+    def on_image_loaded(self, cell_index, image, img_path):
+            """비동기 이미지 로딩 완료 시 호출되는 슬롯 (QImage → QPixmap 승격은 여기서 GUI 스레드로 수행)"""
             if self.grid_mode == "Off" or not self.grid_labels:
                 return
                 
@@ -11841,6 +15606,7 @@ class PhotoSortApp(QMainWindow):
                 cell_widget = self.grid_labels[cell_index] # 이제 GridCellWidget
                 # GridCellWidget의 경로와 일치하는지 확인
                 if cell_widget.property("image_path") == img_path:
+                    pixmap = self.image_loader.cache.promote(img_path, image, keep=False)  # 셀이 참조를 보관
                     cell_widget.setProperty("original_pixmap_ref", pixmap) # 원본 참조 저장
                     cell_widget.setPixmap(pixmap) # setPixmap 호출 (내부에서 update 트리거)
                     cell_widget.setProperty("loaded", True)
@@ -11971,7 +15737,7 @@ class PhotoSortApp(QMainWindow):
         
         # 파일 정보 업데이트
         if self.primary_selected_index != -1 and 0 <= self.primary_selected_index < len(self.image_files):
-            selected_image_path = str(self.image_files[self.primary_selected_index])
+            selected_image_path = self.image_files.key(self.primary_selected_index)
             self.update_file_info_display(selected_image_path)
         else:
             self.update_file_info_display(None)
@@ -12101,7 +15867,7 @@ class PhotoSortApp(QMainWindow):
             image_list_index_ng = self.grid_page_start_index + self.current_grid_index
             # 페이지 내 이동 시에도 전역 인덱스 유효성 검사 (안전 장치)
             if 0 <= image_list_index_ng < total_images:
-                self.update_file_info_display(str(self.image_files[image_list_index_ng]))
+                self.update_file_info_display(self.image_files.key(image_list_index_ng))
             else:
                 # 이 경우는 발생하면 안되지만, 방어적으로 처리
                 self.update_file_info_display(None)
@@ -12185,6 +15951,7 @@ class PhotoSortApp(QMainWindow):
                 moved_jpg_path = None
                 moved_raw_path = None
                 raw_path_before_move = None
+                companion_moves = []
                 
                 try:
                     moved_jpg_path = self.move_file(current_image_path, target_folder)
@@ -12195,15 +15962,13 @@ class PhotoSortApp(QMainWindow):
                     
                     raw_moved_successfully = True
                     if self.move_raw_files:
-                        base_name = current_image_path.stem
-                        if base_name in self.raw_files:
-                            raw_path_before_move = self.raw_files[base_name]
-                            moved_raw_path = self.move_file(raw_path_before_move, target_folder)
-                            if moved_raw_path is None:
-                                logging.warning(f"RAW 파일 이동 실패: {raw_path_before_move.name}")
-                                raw_moved_successfully = False
-                            else:
-                                del self.raw_files[base_name]
+                        paired_moves = self.move_paired_files(current_image_path, target_folder)
+                        raw_path_before_move = paired_moves['raw_source']
+                        moved_raw_path = paired_moves['raw_target']
+                        companion_moves = paired_moves['companions']
+                        if paired_moves['failed']:
+                            logging.warning(f"RAW 파일 이동 실패: {', '.join(path.name for path in paired_moves['failed'])}")
+                            raw_moved_successfully = raw_path_before_move is None or moved_raw_path is not None
                     
                     self.image_files.pop(global_index)
                     successful_moves.append(moved_jpg_path.name)
@@ -12214,6 +15979,7 @@ class PhotoSortApp(QMainWindow):
                             "jpg_target": str(moved_jpg_path),
                             "raw_source": str(raw_path_before_move) if raw_path_before_move else None,
                             "raw_target": str(moved_raw_path) if moved_raw_path and raw_moved_successfully else None,
+                            "companions": companion_moves,
                             "index_before_move": global_index,
                             "mode": self.grid_mode
                         }
@@ -12329,7 +16095,7 @@ class PhotoSortApp(QMainWindow):
 
     def image_mouse_double_click_event(self, event: QMouseEvent):
         if self.grid_mode == "Off" and self.original_pixmap:
-            current_image_path_str = str(self.image_files[self.current_image_index]) if 0 <= self.current_image_index < len(self.image_files) else None
+            current_image_path_str = self.image_files.key(self.current_image_index) if 0 <= self.current_image_index < len(self.image_files) else None
             current_orientation = self.current_image_orientation
             if self.zoom_mode == "Fit":
                 self.double_click_pos = event.position().toPoint()
@@ -12426,6 +16192,7 @@ class PhotoSortApp(QMainWindow):
         logging.info("작업 공간 초기화 시작...")
         # 1. 백그라운드 작업 취소
         self.resource_manager.cancel_all_tasks()
+        self._reset_preload_state()
         for future in self.image_loader.active_futures:
             future.cancel()
         self.image_loader.active_futures.clear()
@@ -12440,9 +16207,15 @@ class PhotoSortApp(QMainWindow):
         self.current_folder = ""
         self.raw_folder = ""
         self.raw_files = {}
+        self.paired_files = {}
         self.current_image_index = -1
         self.is_raw_only_mode = False
+        self.is_library_mode = False
+        self.library_roots = []
         self.compare_mode_active = False
+        self.image_sort_keys = {}
+        self._folder_snapshot = {}
+        self._update_folder_watch()
         # 4. 캐시 및 원본 이미지 초기화
         self.original_pixmap = None
         self.image_loader.clear_cache()
@@ -12577,12 +16350,17 @@ class PhotoSortApp(QMainWindow):
         display_filename = actual_filename   # 표시용 파일명 초기값
 
         if not self.is_raw_only_mode and file_path_obj.suffix.lower() in ['.jpg', '.jpeg']:
-            base_name = file_path_obj.stem
+            base_name = self.raw_pair_key(file_path_obj)
             if self.raw_files and base_name in self.raw_files:
                 display_filename += "🔗" # 표시용 파일명에만 아이콘 추가
         
         # FilenameLabel에 표시용 텍스트와 실제 열릴 파일명 전달
         self.info_filename_label.set_display_and_actual_filename(display_filename, actual_filename)
+        if self.is_library_mode:
+            # 라이브러리 모드: 툴팁에 파일이 속한 루트와 루트 기준 상대 경로 표시 (같은 이름의 파일 구분용)
+            source_root = self.get_source_root(image_path)
+            if source_root:
+                self.info_filename_label.setToolTip(f"{os.path.relpath(str(file_path_obj), source_root)}\n{source_root}")
         
         self.current_exif_path = image_path
         loading_text = "▪ ···"
@@ -12783,6 +16561,14 @@ class PhotoSortApp(QMainWindow):
         # --- 모드에 따라 기준 폴더 결정 ---
         if self.is_raw_only_mode:
             base_folder = self.raw_folder
+        elif self.is_library_mode:
+            # 라이브러리 모드는 파일마다 루트/하위 폴더가 다르므로 현재 파일이 속한 루트 아래에서 경로를 찾음
+            current_path = Path(self.current_exif_path) if self.current_exif_path else None
+            source_root = self.get_source_root(current_path) if current_path else ""
+            if source_root and current_path.name == filename:
+                base_folder = str(current_path.parent)
+            else:
+                base_folder = source_root
         else:
             base_folder = self.current_folder
 
@@ -12849,13 +16635,16 @@ class PhotoSortApp(QMainWindow):
             self.setWindowTitle(f"PhotoSort - {image_path.name}")
             
             # --- 캐시 확인 및 즉시 적용 로직 (수정됨) ---
-            if image_path_str in self.image_loader.cache:
-                cached_pixmap = self.image_loader.cache[image_path_str]
-                if cached_pixmap and not cached_pixmap.isNull():
+            # 100%/Spin 보기에서는 Fit용 축소 디코딩 캐시를 쓰지 않고 원본 해상도로 다시 로드
+            needs_full_resolution = self.zoom_mode != "Fit" and self.image_loader.is_reduced(image_path_str)
+            cached_pixmap = None if needs_full_resolution else self.image_loader.cache.pixmap(image_path_str)
+            if cached_pixmap is not None:
+                if not cached_pixmap.isNull():
                     logging.info(f"display_current_image: 캐시된 이미지 즉시 적용 - '{image_path.name}'")
                     # _on_image_loaded_for_display와 동일한 로직을 사용하여 뷰를 업데이트합니다.
                     # 이 부분이 누락되어 화면이 갱신되지 않았습니다.
                     self._on_image_loaded_for_display(cached_pixmap, image_path_str, current_index)
+                    self.preload_adjacent_images(current_index)  # 캐시 적중이어도 이동할 때마다 미리 로드 창 재계산
                     return # 캐시를 사용했으므로 비동기 로딩 없이 함수 종료
 
             # --- 캐시에 없으면 비동기 로딩 요청 ---
@@ -12979,7 +16768,10 @@ class PhotoSortApp(QMainWindow):
                     is_main_display_image=True
                 )
                 
-                task_id = self.resource_manager.submit_raw_decoding(image_path, wrapped_callback)
+                # Fit 보기는 빠른 단계(half_size)로 먼저 표시하고 원본 품질은 표시 후 따로 요청, 100%/Spin은 바로 원본 품질
+                fit_size = self.image_loader.fit_decode_size if self.zoom_mode == "Fit" else None
+                task_id = self.resource_manager.submit_raw_decoding(
+                    image_path, wrapped_callback, fit_size, task_group=self.NAVIGATION_TASK_GROUP)
                 if task_id is None: 
                     raise RuntimeError("Failed to submit RAW decoding task.")
                 return True 
@@ -12987,7 +16779,8 @@ class PhotoSortApp(QMainWindow):
                 # JPG 또는 RAW (preview 모드)는 ImageLoader.load_image_with_orientation을 직접 호출합니다.
                 # 이 함수는 ICC 프로파일을 처리하도록 이미 수정되었습니다.
                 logging.info(f"_load_image_task: '{file_path_obj.name}' 직접 로드 시도 (JPG 또는 RAW-preview).")
-                pixmap = self.image_loader.load_image_with_orientation(image_path)
+                # Fit 보기는 화면 해상도 축소 디코딩, 100%/Spin은 원본 해상도
+                image = self.image_loader.decode_image(image_path, full_resolution=self.zoom_mode != "Fit")
 
                 if not resource_manager._running: # 로드 후 다시 확인
                     if hasattr(self, 'image_loader'):
@@ -13000,7 +16793,7 @@ class PhotoSortApp(QMainWindow):
                 # 결과를 메인 스레드로 안전하게 전달합니다.
                 if hasattr(self, 'image_loader'):
                     QMetaObject.invokeMethod(self.image_loader, "loadCompleted", Qt.QueuedConnection,
-                                             Q_ARG(QPixmap, pixmap),
+                                             Q_ARG(QImage, image),
                                              Q_ARG(str, image_path),
                                              Q_ARG(int, requested_index))
                 return True
@@ -13020,9 +16813,17 @@ class PhotoSortApp(QMainWindow):
             return False
 
 
+    def _on_image_decoded_for_display(self, image, image_path_str_loaded, requested_index):
+        """작업 스레드에서 디코딩된 QImage를 GUI 스레드에서 QPixmap으로 승격 (실제 표시될 이미지만)"""
+        if self.current_image_index != requested_index:
+            return
+        pixmap = self.image_loader.cache.promote(image_path_str_loaded, image)
+        self._on_image_loaded_for_display(pixmap, image_path_str_loaded, requested_index)
+
     def _on_image_loaded_for_display(self, pixmap, image_path_str_loaded, requested_index):
         if self.current_image_index != requested_index:
             return
+        self._full_resolution_pending = None
         if hasattr(self, 'loading_indicator_timer'): self.loading_indicator_timer.stop()
         if pixmap.isNull():
             self.image_label.setText(f"{LanguageManager.translate('이미지 로드 실패')}")
@@ -13100,26 +16901,8 @@ class PhotoSortApp(QMainWindow):
             return
 
         try:
-            data_bytes = result.get('data')
-            shape = result.get('shape')
-            if not data_bytes or not shape:
-                raise ValueError("디코딩 결과 데이터 또는 형태 정보 누락")
-            height, width, _ = shape
-            qimage = QImage(data_bytes, width, height, width * 3, QImage.Format_RGB888)
-
-            # --- NEW: RAW 이미지에 sRGB 색 공간 정보 태그 ---
-            # rawpy.postprocess의 기본 출력은 sRGB이므로, sRGB라고 명시해줍니다.
-            # 이 태그가 있으면 Qt가 자동으로 모니터 프로파일에 맞게 색상을 변환합니다.
-            srgb_color_space = QColorSpace(QColorSpace.SRgb)
-            if qimage and not qimage.isNull() and srgb_color_space.isValid():
-                qimage.setColorSpace(srgb_color_space)
-
-            pixmap = QPixmap.fromImage(qimage)
-            if pixmap.isNull():
-                raise ValueError("디코딩된 데이터로 QPixmap 생성 실패")
-
-            if hasattr(self, 'image_loader'):
-                self.image_loader._add_to_cache(file_path, pixmap)
+            decoded_image = self.image_loader.cache_raw_result(result)
+            pixmap = self.image_loader.cache.promote(file_path, decoded_image)
             logging.info(f"  _on_raw_decoded_for_display: RAW 이미지 캐싱 성공: '{Path(file_path).name}'")
 
         except Exception as e:
@@ -13146,17 +16929,38 @@ class PhotoSortApp(QMainWindow):
             
             self._close_first_raw_decode_progress()
             self.update_compare_filenames()
+            if result.get('tier') == 'fast':
+                self._schedule_raw_full_decode(file_path)
+            else:
+                self._full_resolution_pending = None
             logging.info(f"  _on_raw_decoded_for_display: 메인 이미지 UI 업데이트 완료.")
         else:
             logging.info(f"  _on_raw_decoded_for_display: 프리로드된 이미지 캐싱 완료, UI 업데이트는 건너뜀. 파일='{Path(file_path).name}'")
 
         logging.info(f"_on_raw_decoded_for_display 종료: 파일='{Path(file_path).name if file_path else 'N/A'}'")
 
+    def _schedule_raw_full_decode(self, file_path):
+        """RAW 빠른 단계 결과를 표시한 뒤 현재 이미지에 잠시 머무르면 원본 품질 디코딩을 백그라운드로 시작"""
+        self._raw_full_decode_path = file_path
+        self._raw_full_decode_timer.start(self.RAW_FULL_DECODE_DELAY_MS)
+
+    def _start_raw_full_decode(self):
+        """예약된 원본 품질 RAW 디코딩 제출 (그사이 다른 이미지로 이동했거나 이미 원본이면 건너뜀)"""
+        file_path, self._raw_full_decode_path = self._raw_full_decode_path, None
+        if not file_path or file_path != self.get_current_image_path() or not self.image_loader.is_reduced(file_path):
+            return
+        requested_index = self.current_image_index
+        logging.debug(f"RAW 원본 품질 디코딩 요청: {Path(file_path).name}")
+        self.resource_manager.submit_raw_decoding(
+            file_path,
+            lambda result_dict: self._on_raw_decoded_for_display(
+                result_dict, requested_index=requested_index, is_main_display_image=True),
+            priority='medium', task_group=self.NAVIGATION_TASK_GROUP)
+
     def process_pending_raw_results(self):
-        """ResourceManager를 통해 RawDecoderPool의 완료된 결과들을 처리합니다."""
+        """RawDecoderPool의 결과 도착 알림을 받아 도착한 결과를 모두 처리합니다."""
         if hasattr(self, 'resource_manager') and self.resource_manager:
-            # 한 번에 최대 5개의 결과를 처리하도록 시도 (조정 가능)
-            processed_count = self.resource_manager.process_raw_results(max_results=5)
+            processed_count = self.resource_manager.process_raw_results()
             if processed_count > 0:
                 logging.debug(f"process_pending_raw_results: {processed_count}개의 RAW 디코딩 결과 처리됨.")
         # else: # ResourceManager가 없는 예외적인 경우
@@ -13176,65 +16980,47 @@ class PhotoSortApp(QMainWindow):
 
 
 
+    def _reset_preload_state(self):
+        """새 파일 목록을 불러올 때 미리 로드 이동 기록과 이전 목록의 미리 로드 작업을 버림 (인덱스가 새 목록과 맞지 않음)"""
+        self.preload_planner.reset()
+        self._preload_tasks = {}
+        self.resource_manager.advance_imaging_generation(self.NAVIGATION_TASK_GROUP)
+
     def preload_adjacent_images(self, current_index):
-        """인접 이미지 미리 로드 - 시스템 프로필에 따라 동적으로 범위 조절."""
+        """
+        인접 이미지 미리 로드. PreloadPlanner가 방향과 최근 이동 속도로 목표 창을 순위 순으로 계산하면,
+        이전 목표와 비교해 새 목표만 제출하고 남은 작업은 새 순위로 재배치하며, 창에서 빠진 작업은 버립니다.
+        """
         if not self.image_files:
             return
 
         # HardwareProfileManager에서 현재 프로필의 미리 로드 범위 가져오기
         forward_preload_count, backward_preload_count = HardwareProfileManager.get("preload_range_adjacent")
-        priority_close_threshold = HardwareProfileManager.get("preload_range_priority")
-        
-        total_images = len(self.image_files)
-        
-        # 이동 방향 감지 (기존 로직 유지)
-        direction = 1
-        if hasattr(self, 'previous_image_index') and self.previous_image_index != current_index:
-            if self.previous_image_index < current_index or \
-            (self.previous_image_index == total_images - 1 and current_index == 0):
-                direction = 1
-            elif self.previous_image_index > current_index or \
-                (self.previous_image_index == 0 and current_index == total_images - 1):
-                direction = -1
-        self.previous_image_index = current_index
-
-        # 캐시된 이미지와 현재 로딩 요청된 이미지 확인
-        cached_images = set(self.image_loader.cache.keys())
-        # (이하 로직은 기존과 거의 동일하나, 범위 변수를 프로필에서 가져온 값으로 사용)
-        
-        to_preload = []
-        if direction >= 0: # 앞으로 이동
-            for offset in range(1, forward_preload_count + 1):
-                idx = (current_index + offset) % total_images
-                if str(self.image_files[idx]) not in cached_images:
-                    priority = 'high' if offset <= priority_close_threshold else ('medium' if offset <= priority_close_threshold * 2 else 'low')
-                    to_preload.append((idx, priority))
-            for offset in range(1, backward_preload_count + 1):
-                idx = (current_index - offset + total_images) % total_images
-                if str(self.image_files[idx]) not in cached_images:
-                    priority = 'medium' if offset <= priority_close_threshold else 'low'
-                    to_preload.append((idx, priority))
-        else: # 뒤로 이동
-            for offset in range(1, forward_preload_count + 1):
-                idx = (current_index - offset + total_images) % total_images
-                if str(self.image_files[idx]) not in cached_images:
-                    priority = 'high' if offset <= priority_close_threshold else ('medium' if offset <= priority_close_threshold * 2 else 'low')
-                    to_preload.append((idx, priority))
-            for offset in range(1, backward_preload_count + 1):
-                idx = (current_index + offset) % total_images
-                if str(self.image_files[idx]) not in cached_images:
-                    priority = 'medium' if offset <= priority_close_threshold else 'low'
-                    to_preload.append((idx, priority))
-
-        # 로드 요청 제출
-        for idx, priority in to_preload:
-            img_path = str(self.image_files[idx])
-            # 여기서는 _preload_image_for_grid를 사용하여 preview만 로드하는 것으로 단순화
-            self.resource_manager.submit_imaging_task_with_priority(
-                priority,
-                self._preload_image_for_grid, 
-                img_path
-            )
+        target_indices = self.preload_planner.plan(
+            current_index, len(self.image_files), forward_preload_count, backward_preload_count)
+        cache = self.image_loader.cache
+        targets = [path for path in map(self.image_files.key, target_indices) if path not in cache]
+
+        # 이전 창의 작업은 세대 전환으로 한 번에 무효화 (O(1)). 새 창에 남은 작업은 아래에서 재순위되며 갱신되고,
+        # 갱신되지 않은 작업은 작업자가 꺼낼 때 취소됩니다.
+        self.resource_manager.advance_imaging_generation(self.NAVIGATION_TASK_GROUP)
+        previous_tasks = self._preload_tasks
+        self._preload_tasks = {}
+        for rank, img_path in enumerate(targets):
+            priority = PreloadPlanner.priority_for_rank(rank)
+            task = previous_tasks.get(img_path)
+            if task is not None and task.reprioritize(priority):
+                self._preload_tasks[img_path] = task  # 아직 대기 중인 기존 작업은 새 순위로 이동
+                continue
+            # 다른 경로에서 이미 로딩 중인 파일은 기존 작업에 합류 (decode 방식 RAW는 RawDecoderPool 작업에 합류)
+            task = self._submit_preload(img_path, priority, self.NAVIGATION_TASK_GROUP)
+            if task is not None:
+                self._preload_tasks[img_path] = task
+        # 디코딩 작업이 꺼내 가기 전에 I/O 단계가 같은 순서로 파일 바이트를 미리 읽어 둠
+        self.image_loader.prefetch(targets)
+        logging.debug(f"미리 로드 계획: 방향 {self.preload_planner.direction}, 속도 {self.preload_planner.velocity:.1f}장/초, "
+                      f"목표 {len(targets)}개 (유지 {len(set(previous_tasks) & set(self._preload_tasks))}개), "
+                      f"파이프라인 {self.image_loader.pipeline.stats()}")
 
 
     def on_grid_cell_clicked(self, clicked_widget, clicked_index):
@@ -13311,7 +17097,7 @@ class PhotoSortApp(QMainWindow):
 
                     # 파일 정보는 primary 선택 이미지로 표시
                     if self.primary_selected_index != -1 and 0 <= self.primary_selected_index < len(self.image_files):
-                        selected_image_path = str(self.image_files[self.primary_selected_index])
+                        selected_image_path = self.image_files.key(self.primary_selected_index)
                         self.update_file_info_display(selected_image_path)
                     else:
                         self.update_file_info_display(None)
@@ -13400,6 +17186,7 @@ class PhotoSortApp(QMainWindow):
             "current_folder": str(self.current_folder) if self.current_folder else "",
             "raw_folder": str(self.raw_folder) if self.raw_folder else "",
             "raw_files": {k: str(v) for k, v in self.raw_files.items()},
+            "paired_files": {k: [str(p) for p in v] for k, v in self.paired_files.items()},
             "move_raw_files": self.move_raw_files,
             "target_folders": [str(f) if f else "" for f in self.target_folders],
             "zoom_mode": self.zoom_mode,
@@ -13415,12 +17202,15 @@ class PhotoSortApp(QMainWindow):
             "date_format": DateFormatManager.get_current_format(),
             "theme": ThemeManager.get_current_theme_name(),
             "is_raw_only_mode": self.is_raw_only_mode,
+            "is_library_mode": self.is_library_mode,
+            "library_roots": self.library_roots,
             "control_panel_on_right": getattr(self, 'control_panel_on_right', False),
             "show_grid_filenames": self.show_grid_filenames, # 파일명 표시 상태
             "last_used_raw_method": self.image_loader._raw_load_strategy if hasattr(self, 'image_loader') else "preview",
             "camera_raw_settings": self.camera_raw_settings, # 카메라별 raw 설정
             "viewport_move_speed": getattr(self, 'viewport_move_speed', 5), # 키보드 뷰포트 이동속도
             "mouse_wheel_action": getattr(self, 'mouse_wheel_action', 'photo_navigation'),  # 마우스 휠 동작
+            "live_folder_watch": getattr(self, 'live_folder_watch', False),  # 폴더 자동 감지
             "mouse_wheel_sensitivity": getattr(self, 'mouse_wheel_sensitivity', 1),
             "mouse_pan_sensitivity": getattr(self, 'mouse_pan_sensitivity', 1.5),
             "folder_count": self.folder_count,
@@ -13490,6 +17280,7 @@ class PhotoSortApp(QMainWindow):
             self.show_grid_filenames = loaded_data.get("show_grid_filenames", False)
             self.viewport_move_speed = loaded_data.get("viewport_move_speed", 5)
             self.mouse_wheel_action = loaded_data.get("mouse_wheel_action", "photo_navigation")
+            self.live_folder_watch = loaded_data.get("live_folder_watch", False)
             self.mouse_wheel_sensitivity = loaded_data.get("mouse_wheel_sensitivity", 1)
             self.mouse_pan_sensitivity = loaded_data.get("mouse_pan_sensitivity", 1.5)
             self.saved_sessions = loaded_data.get("saved_sessions", {})
@@ -13535,6 +17326,10 @@ class PhotoSortApp(QMainWindow):
             if hasattr(self, 'mouse_wheel_photo_radio') and hasattr(self, 'mouse_wheel_none_radio'):
                 if self.mouse_wheel_action == 'photo_navigation': self.mouse_wheel_photo_radio.setChecked(True)
                 else: self.mouse_wheel_none_radio.setChecked(True)
+            if hasattr(self, 'live_folder_watch_checkbox'):
+                self.live_folder_watch_checkbox.blockSignals(True)
+                self.live_folder_watch_checkbox.setChecked(self.live_folder_watch)
+                self.live_folder_watch_checkbox.blockSignals(False)
             if hasattr(self, 'mouse_wheel_sensitivity_combo'):
                 index = self.mouse_wheel_sensitivity_combo.findData(self.mouse_wheel_sensitivity)
                 if index >= 0: self.mouse_wheel_sensitivity_combo.setCurrentIndex(index)
@@ -13552,9 +17347,17 @@ class PhotoSortApp(QMainWindow):
             # 3. 폴더 및 파일 관련 상태 변수 설정
             self.current_folder = loaded_data.get("current_folder", "")
             self.raw_folder = loaded_data.get("raw_folder", "")
-            raw_files_str = loaded_data.get("raw_files", {})
-            self.raw_files = {k: Path(v) for k, v in raw_files_str.items() if v and Path(v).exists()}
             self.is_raw_only_mode = loaded_data.get("is_raw_only_mode", False)
+            self.is_library_mode = loaded_data.get("is_library_mode", False)
+            # raw_files 키는 RAW 경로로 다시 계산 (이전 버전의 대소문자 구분 키와 호환, 라이브러리 모드 플래그 이후)
+            raw_files_str = loaded_data.get("raw_files", {})
+            self.raw_files = {self.raw_pair_key(v): Path(v) for k, v in raw_files_str.items() if v and Path(v).exists()}
+            self.paired_files = {}
+            for pair_key, paths in loaded_data.get("paired_files", {}).items():
+                existing = [Path(p) for p in paths if p and Path(p).exists()]
+                if existing:
+                    self.paired_files[pair_key] = existing
+            self.library_roots = [root for root in loaded_data.get("library_roots", []) if root and Path(root).is_dir()]
             self.last_loaded_raw_method_from_state = loaded_data.get("last_used_raw_method", "preview")
 
             self.current_image_index = loaded_data.get("current_image_index", -1)
@@ -13587,7 +17390,14 @@ class PhotoSortApp(QMainWindow):
             self.update_all_folder_labels_state() # 생성된 UI에 경로/상태 반영
             
             # 6. 이미지 목록 로드 시작
-            if self.is_raw_only_mode:
+            if self.is_library_mode and self.library_roots:
+                self.start_background_loading(
+                    mode='library',
+                    jpg_folder_path=self.library_roots[0],
+                    raw_folder_path=None,
+                    raw_file_list=list(self.library_roots)
+                )
+            elif self.is_raw_only_mode:
                 if self.raw_folder and Path(self.raw_folder).is_dir():
                     raw_files_to_load = self.reload_raw_files_from_state(self.raw_folder)
                     if raw_files_to_load:
@@ -13680,7 +17490,7 @@ class PhotoSortApp(QMainWindow):
             self.idle_preload_timer.stop()
         if hasattr(self, 'wheel_reset_timer') and self.wheel_reset_timer.isActive():
             self.wheel_reset_timer.stop()
-        # raw_result_processor_timer와 memory_monitor_timer는 앱 전역에서 계속 실행되어야 하므로 중지하지 않습니다.
+        # RAW 결과 수신 연결과 memory_monitor_timer는 앱 전역에서 계속 실행되어야 하므로 중지하지 않습니다.
 
         # --- 2. 상태 변수 초기화 ---
         logging.debug("  -> 상태 변수 초기화...")
@@ -13690,6 +17500,7 @@ class PhotoSortApp(QMainWindow):
         self.raw_folder = ""
         self.image_files = []
         self.raw_files = {}
+        self.paired_files = {}
         self.is_raw_only_mode = False
         self.move_raw_files = True
         self.folder_count = 3
@@ -13759,16 +17570,9 @@ class PhotoSortApp(QMainWindow):
 
     def reload_raw_files_from_state(self, folder_path):
         """ 저장된 RAW 폴더 경로에서 파일 목록을 다시 로드하고 리스트를 반환 """
-        target_path = Path(folder_path)
-        temp_raw_file_list = []
         try:
             # RAW 파일 검색
-            for ext in self.raw_extensions:
-                temp_raw_file_list.extend(target_path.glob(f'*{ext}'))
-                temp_raw_file_list.extend(target_path.glob(f'*{ext.upper()}'))
-
-            # 중복 제거 및 정렬
-            unique_raw_files = sorted(list(set(temp_raw_file_list)))
+            unique_raw_files = sorted(FolderScanner.scan(folder_path, raw_extensions=self.raw_extensions)['raw_files'])
 
             if unique_raw_files:
                 logging.info(f"RAW 파일 목록 복원됨: {len(unique_raw_files)}개")
@@ -13873,6 +17677,14 @@ class PhotoSortApp(QMainWindow):
             shutil.move(str(raw_target_path), str(raw_source_path))
             logging.debug(f"Undo: Moved RAW {raw_target_path} -> {raw_source_path}")
 
+        # 2-1. 함께 이동했던 RAW 변형/사이드카 원래 위치로 이동
+        restored_companions = []
+        for companion_source, companion_target in move_info.get("companions") or []:
+            if Path(companion_target).exists():
+                shutil.move(companion_target, companion_source)
+                restored_companions.append(Path(companion_source))
+                logging.debug(f"Undo: Moved companion {companion_target} -> {companion_source}")
+
         # 3. 파일 목록 복원 (중복 검사 추가)
         if jpg_source_path not in self.image_files:
             if 0 <= index_before_move <= len(self.image_files):
@@ -13886,17 +17698,25 @@ class PhotoSortApp(QMainWindow):
 
         # 4. RAW 파일 딕셔너리 복원 (중복 검사 추가)
         if raw_source_path:
-            if jpg_source_path.stem not in self.raw_files:
-                self.raw_files[jpg_source_path.stem] = raw_source_path
-                logging.debug(f"Undo: Restored RAW file mapping for {jpg_source_path.stem}")
+            raw_key = self.raw_pair_key(jpg_source_path)
+            if raw_key not in self.raw_files:
+                self.raw_files[raw_key] = raw_source_path
+                logging.debug(f"Undo: Restored RAW file mapping for {raw_key}")
             else:
-                logging.warning(f"Undo: Skipped duplicate RAW file mapping for {jpg_source_path.stem}")
+                logging.warning(f"Undo: Skipped duplicate RAW file mapping for {raw_key}")
+
+        # 4-1. 짝 파일 목록 복원 (기본 RAW가 맨 앞)
+        restored_pairs = ([raw_source_path] if raw_source_path else []) + restored_companions
+        if restored_pairs:
+            raw_key = self.raw_pair_key(jpg_source_path)
+            remaining = [path for path in self.paired_files.get(raw_key, []) if path not in restored_pairs]
+            self.paired_files[raw_key] = restored_pairs + remaining
 
         if move_info.get("mode") == "CompareB":
             jpg_source_path = Path(move_info["jpg_source"])
             self.image_B_path = jpg_source_path
             # B 캔버스용 pixmap도 다시 로드
-            self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path))
+            self.original_pixmap_B = self.image_loader.load_image_with_orientation(str(self.image_B_path), full_resolution=True)
             self.update_compare_filenames()
             logging.debug(f"Undo: Restored image to Canvas B: {self.image_B_path.name}")
 
@@ -14075,6 +17895,13 @@ class PhotoSortApp(QMainWindow):
                 shutil.move(str(raw_source_path), str(raw_target_path))
                 logging.debug(f"Redo: Moved RAW {raw_source_path} -> {raw_target_path}")
 
+        # 2-1. 함께 이동했던 RAW 변형/사이드카 다시 이동
+        companions = move_info.get("companions") or []
+        for companion_source, companion_target in companions:
+            if Path(companion_source).exists():
+                shutil.move(companion_source, companion_target)
+                logging.debug(f"Redo: Moved companion {companion_source} -> {companion_target}")
+
         # 3. 파일 목록 업데이트
         try:
             self.image_files.remove(jpg_source_path)
@@ -14082,8 +17909,11 @@ class PhotoSortApp(QMainWindow):
             logging.warning(f"경고: Redo 시 파일 목록에서 경로를 찾지 못함: {jpg_source_path}")
 
         # 4. RAW 파일 딕셔너리 업데이트
-        if raw_source_path and jpg_source_path.stem in self.raw_files:
-            del self.raw_files[jpg_source_path.stem]
+        raw_key = self.raw_pair_key(jpg_source_path)
+        if raw_source_path and raw_key in self.raw_files:
+            del self.raw_files[raw_key]
+        if raw_source_path or companions:
+            self.paired_files.pop(raw_key, None)
 
     def update_ui_after_redo_batch(self, batch_entries):
         """ 배치 Redo 후 UI 업데이트 """
@@ -14209,6 +18039,7 @@ class PhotoSortApp(QMainWindow):
         logging.info("메모리 해제: 이미지 캐시 정리...")
         if hasattr(self, 'image_loader') and hasattr(self.image_loader, 'cache'):
             self.image_loader.cache.clear()
+            self.image_loader.pipeline.shutdown()
         self.fit_pixmap_cache.clear()
         if hasattr(self, 'grid_thumbnail_cache'):
             for key in self.grid_thumbnail_cache:
@@ -14247,12 +18078,14 @@ class PhotoSortApp(QMainWindow):
             logging.info("EXIF 워커 스레드 종료 완료")
         # === EXIF 스레드 정리 끝 ===
 
-        # grid_thumbnail_executor 종료 추가
-        if hasattr(self, 'grid_thumbnail_executor'):
-            logging.info("Grid Thumbnail 스레드 풀 종료 시도...")
-            self.grid_thumbnail_executor.shutdown(wait=False, cancel_futures=True)
-            logging.info("Grid Thumbnail 스레드 풀 종료 완료")
-        
+        # 폴더 자동 감지 종료
+        if hasattr(self, 'folder_watcher'):
+            self.folder_watcher.shutdown()
+
+        # 메타데이터 카탈로그 닫기 (남은 쓰기 커밋)
+        if hasattr(self, 'metadata_catalog'):
+            self.metadata_catalog.close()
+
         # 메모리 정리를 위한 가비지 컬렉션 명시적 호출
         logging.info("메모리 해제: 가비지 컬렉션 호출...")
         import gc
@@ -14298,10 +18131,10 @@ class PhotoSortApp(QMainWindow):
             self.display_current_image()
             
             # 이미지 로더의 캐시 확인하여 이미 메모리에 있으면 즉시 적용을 시도
-            image_path = str(self.image_files[index])
-            if image_path in self.image_loader.cache:
-                cached_pixmap = self.image_loader.cache[image_path]
-                if cached_pixmap and not cached_pixmap.isNull():
+            image_path = self.image_files.key(index)
+            cached_pixmap = self.image_loader.cache.pixmap(image_path)
+            if cached_pixmap is not None:
+                if not cached_pixmap.isNull():
                     # 캐시된 이미지가 있으면 즉시 적용 시도
                     self.original_pixmap = cached_pixmap
                     if self.zoom_mode == "Fit":
@@ -14671,8 +18504,8 @@ class PhotoSortApp(QMainWindow):
                 self.raw_toggle_button.setEnabled(False)
                 self.move_raw_files = True # 내부 상태도 강제로 동기화
             else:
-                # JPG 모드일 때
-                is_raw_folder_valid = bool(self.raw_folder and Path(self.raw_folder).is_dir())
+                # JPG 모드일 때 (라이브러리 모드는 폴더별로 매칭된 RAW가 있으면 활성화)
+                is_raw_folder_valid = bool(self.raw_folder and Path(self.raw_folder).is_dir()) or (self.is_library_mode and bool(self.raw_files))
                 self.raw_toggle_button.setEnabled(is_raw_folder_valid)
                 if is_raw_folder_valid:
                     # 유효한 RAW 폴더가 연결되면, 저장된 내부 상태를 UI에 반영
@@ -14695,8 +18528,8 @@ class PhotoSortApp(QMainWindow):
         elif self.image_files:
             # JPG 로드됨: "JPG - RAW 연결" 버튼으로 변경
             self.match_raw_button.setText(LanguageManager.translate("JPG - RAW 연결"))
-            # RAW 폴더가 이미 로드된 상태인지 확인
-            is_raw_loaded = bool(self.raw_folder and Path(self.raw_folder).is_dir())
+            # RAW 폴더가 이미 로드된 상태인지 확인 (라이브러리 모드는 폴더별로 자동 매칭)
+            is_raw_loaded = bool(self.raw_folder and Path(self.raw_folder).is_dir()) or self.is_library_mode
             # RAW 폴더가 로드된 상태이면 버튼 비활성화, 아니면 활성화
             self.match_raw_button.setEnabled(not is_raw_loaded)
             # JPG가 이미 로드된 상태면 JPG 버튼 비활성화
@@ -14770,6 +18603,8 @@ class PhotoSortApp(QMainWindow):
             # --- 기존 로직: JPG 모드에서 RAW 연결만 해제 ---
             self.raw_folder = ""
             self.raw_files = {}
+            self.paired_files = {}
+            self._update_folder_watch()
             # UI 업데이트
             self.raw_folder_path_label.setText(LanguageManager.translate("폴더 경로"))
             self.update_raw_folder_ui_state() # 레이블 스타일, X 버튼, 토글 상태 업데이트
@@ -14881,6 +18716,7 @@ class PhotoSortApp(QMainWindow):
             "마우스_휠_동작_label": "마우스 휠 동작",
             "마우스_휠_민감도_label": "마우스 휠 민감도",
             "마우스_패닝_감도_label": "마우스 패닝 감도",
+            "폴더_자동_감지_ⓘ_label": "폴더 자동 감지 ⓘ",
             "성능_설정_ⓘ_label": "성능 설정 ⓘ",
         }
         for object_name, translation_key in setting_row_keys.items():
@@ -14895,6 +18731,8 @@ class PhotoSortApp(QMainWindow):
                     tooltip_key = "사진 확대 중 Shift + WASD 또는 방향키로 뷰포트(확대 부분)를 이동할 때의 속도입니다."
                     tooltip_text = LanguageManager.translate(tooltip_key)
                     label.setToolTip(tooltip_text)
+                elif translation_key == "폴더 자동 감지 ⓘ":
+                    label.setToolTip(LanguageManager.translate("다른 프로그램이 불러온 폴더에 파일을 추가하거나 삭제하면 F5 없이 목록에 자동으로 반영합니다."))
         # --- 라디오 버튼 텍스트 업데이트 (이전과 동일) ---
         if hasattr(self, 'panel_pos_left_radio'):
             self.panel_pos_left_radio.setText(LanguageManager.translate("좌측"))
@@ -14904,6 +18742,8 @@ class PhotoSortApp(QMainWindow):
             self.mouse_wheel_photo_radio.setText(LanguageManager.translate("사진 넘기기"))
         if hasattr(self, 'mouse_wheel_none_radio'):
             self.mouse_wheel_none_radio.setText(LanguageManager.translate("없음"))
+        if hasattr(self, 'live_folder_watch_checkbox'):
+            self.live_folder_watch_checkbox.setText(LanguageManager.translate("사용"))
         # --- 버튼 텍스트 업데이트 (이전과 동일) ---
         if hasattr(self, 'reset_camera_settings_button'):
             self.reset_camera_settings_button.setText(LanguageManager.translate("RAW 처리 방식 초기화"))
@@ -14930,12 +18770,12 @@ class PhotoSortApp(QMainWindow):
             
         if self.grid_mode == "Off":
             if 0 <= self.current_image_index < len(self.image_files):
-                return str(self.image_files[self.current_image_index])
+                return self.image_files.key(self.current_image_index)
         else:
             # 그리드 모드에서 선택된 이미지
             index = self.grid_page_start_index + self.current_grid_index
             if 0 <= index < len(self.image_files):
-                return str(self.image_files[index])
+                return self.image_files.key(index)
                 
         return None
 
@@ -14996,6 +18836,10 @@ def main():
     # PyInstaller로 패키징된 실행 파일을 위한 멀티프로세싱 지원 추가
     freeze_support()  # 이 호출이 멀티프로세싱 무한 재귀 문제를 해결합니다
 
+    # 로거 초기화 (모듈 수준에서 하면 forkserver가 __main__을 미리 import할 때와 디코더 프로세스마다
+    # 오래된 로그 정리와 시작 로그가 다시 실행되므로 메인 프로세스에서만)
+    setup_logger()
+
     try:
         pillow_heif.register_heif_opener()
         logging.info("HEIF/HEIC 지원이 활성화되었습니다. (main에서 등록)")
@@ -15144,6 +18988,14 @@ def main():
         "1/2 (둔감)": "1/2 (Less Sensitive)",
         "1/3 (매우 둔감)": "1/3 (Least Sensitive)",
         "마우스 패닝 감도": "Mouse Panning Sensitivity",
+        "폴더 자동 감지 ⓘ": "Watch Folder for Changes ⓘ",
+        "라이브러리 폴더 탐색 중...": "Scanning library folders...",
+        "하위 폴더 포함 불러오기 (라이브러리)": "Load Including Subfolders (Library)",
+        "라이브러리 루트 폴더 선택": "Select Library Root Folder",
+        "라이브러리": "Library",
+        "다른 루트 폴더를 추가하시겠습니까?": "Do you want to add another root folder?",
+        "사용": "Enabled",
+        "다른 프로그램이 불러온 폴더에 파일을 추가하거나 삭제하면 F5 없이 목록에 자동으로 반영합니다.": "Automatically updates the list when other programs add or remove files\nin the loaded folder, without pressing F5.",
         "100% (정확)": "100% (Precise)",
         "150% (기본값)": "150% (Default)",
         "200% (빠름)": "200% (Fast)",
@@ -15232,6 +19084,8 @@ def main():
         "현재 진행 중인 작업을 종료하고 새로운 폴더를 불러오시겠습니까?": "Do you want to end the current session and load a new folder?",
         "예": "Yes",
         "취소": "Cancel",
+        "취소하는 중...": "Cancelling...",
+        "이미지 불러오는 중... ({count}개)": "Loading images... ({count})",
         # 성능 프로필 관련 번역키
         "성능 설정 ⓘ": "Performance Setting ⓘ",
         "저사양 (8GB RAM)": "Low Spec (8GB RAM)",
@@ -15256,10 +19110,25 @@ def main():
         "파일 정렬 중...": "Sorting files...",
         "RAW 파일 매칭 중...": "Matching RAW files...",
         "RAW 파일 정렬 중...": "Sorting RAW files...",
+        "RAW 디코더가 비정상 종료되었습니다": "The RAW decoder stopped unexpectedly",
+        "디코더를 반복해서 중단시킨 파일이라 RAW 디코딩을 건너뜁니다": "Skipped RAW decoding: this file crashed the decoder repeatedly",
+        "RAW 디코더 프로세스가 시작 직후 반복해서 종료되어 RAW 디코딩을 중지합니다": "RAW decoding stopped: the decoder process kept exiting right after starting",
     }
     
     LanguageManager.initialize_translations(translations)
 
+    # 변환 경로 마이크로 벤치마크 (창 없이 실행 후 종료)
+    if "--benchmark-conversion" in sys.argv:
+        benchmark_app = QApplication(sys.argv)
+        ImageConverter.run_benchmark(sys.argv[sys.argv.index("--benchmark-conversion") + 1:])
+        sys.exit(0)
+
+    # 일반 이미지 디코딩 처리량 벤치마크: 스레드 디코딩 vs 프로세스 디코딩 엔진 (작업자 수 = 물리 코어 수)
+    if "--benchmark-decode" in sys.argv:
+        benchmark_app = QApplication(sys.argv)
+        ImageDecodeProcessPool.run_benchmark(sys.argv[sys.argv.index("--benchmark-decode") + 1:])
+        sys.exit(0)
+
     # 하나만 실행되도록 단일 인스턴스 체크 (모든 플랫폼에서 동작)
     shared_memory = QSharedMemory("PhotoSortApp_SingleInstance")
     if not shared_memory.create(1):
@@ -15267,6 +19136,7 @@ def main():
         sys.exit(1)
 
     app = QApplication(sys.argv)
+    app.setApplicationName("PhotoSort")  # 사용자별 캐시 폴더 이름 (QStandardPaths.CacheLocation)
 
     UIScaleManager.initialize() # UI 스케일 모드 결정
     application_font = QFont("Arial", UIScaleManager.get("font_size", 10)) # 결정된 폰트 크기 가져오기 (기본값 10)